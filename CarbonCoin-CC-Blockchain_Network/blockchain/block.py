@@ -1,5 +1,13 @@
 import hashlib
 import json
+from typing import Optional
+
+# Try to use orjson for fast block serialization
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
 
 # Try to use Cython-optimized functions
 try:
@@ -8,47 +16,126 @@ try:
 except ImportError:
     USE_CYTHON = False
 
+def _python_block_hash(index, timestamp, data, previous_hash, nonce):
+    """Pure Python hash calculation."""
+    block_string = json.dumps({
+        "index": index,
+        "timestamp": timestamp,
+        "data": data,
+        "previous_hash": previous_hash,
+        "nonce": nonce
+    }, sort_keys=True)
+    return hashlib.sha256(block_string.encode()).hexdigest()
+
+
+def split_block_header(index, timestamp, data, previous_hash):
+    """
+    Serialize a block header exactly as _python_block_hash does and split it
+    around the nonce value, so a nonce search only re-hashes the tail.
+    
+    Returns:
+        Tuple of (prefix_bytes, suffix_bytes)
+    """
+    header = json.dumps({
+        "index": index,
+        "timestamp": timestamp,
+        "data": data,
+        "previous_hash": previous_hash,
+        "nonce": 0
+    }, sort_keys=True)
+    
+    # Keys are sorted, so the top-level nonce is the last '"nonce": 0' before
+    # "previous_hash" (transaction data is serialized earlier, under "data")
+    pos = header.rindex('"nonce": 0, "previous_hash": ') + len('"nonce": ')
+    return header[:pos].encode(), header[pos + 1:].encode()
+
+
+def compute_block_hash(index, timestamp, data, previous_hash, nonce):
+    """
+    Calculate a block hash from its raw fields.
+    Lets callers hash block dicts (e.g. peer chains) without building Block objects.
+    """
+    # Use Cython-optimized version if available, with runtime fallback
+    if USE_CYTHON:
+        try:
+            return calculate_block_hash(
+                index, 
+                float(timestamp), 
+                data, 
+                previous_hash, 
+                nonce
+            )
+        except Exception:
+            # Cython failed at runtime, will fall back to Python
+            pass
+    
+    # Fallback to pure Python
+    return _python_block_hash(index, timestamp, data, previous_hash, nonce)
+
+
 class Block:
-    def __init__(self, index, timestamp, data, previous_hash, nonce=0):
+    # Fixed attribute layout: no per-instance __dict__ (chains hold many blocks)
+    __slots__ = (
+        "index", "timestamp", "data", "previous_hash", "nonce", "hash",
+        "_json_bytes", "_json_hash"
+    )
+
+    def __init__(self, index, timestamp, data, previous_hash, nonce=0, hash=None):
+        """
+        Create a block.
+        
+        Args:
+            hash: Known hash (e.g. from storage or a peer); computed if not given.
+                  Not verified here - validation recomputes it.
+        """
         self.index = index
         self.timestamp = timestamp
         self.data = data
         self.previous_hash = previous_hash
         self.nonce = nonce
-        self.hash = self.calculate_hash()
+        self.hash = hash if hash is not None else self.calculate_hash()
+        self._json_bytes: Optional[bytes] = None  # Cached wire form of the block
+        self._json_hash: Optional[str] = None  # Hash the cached bytes were built for
 
     def _python_calculate_hash(self):
         """Pure Python hash calculation."""
-        block_string = json.dumps({
+        return _python_block_hash(self.index, self.timestamp, self.data, self.previous_hash, self.nonce)
+
+    def calculate_hash(self):
+        return compute_block_hash(self.index, self.timestamp, self.data, self.previous_hash, self.nonce)
+
+    def to_dict(self) -> dict:
+        """Return the block as the dict sent over the wire."""
+        return {
             "index": self.index,
             "timestamp": self.timestamp,
             "data": self.data,
             "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+            "nonce": self.nonce,
+            "hash": self.hash
+        }
 
-    def calculate_hash(self):
-        # Use Cython-optimized version if available, with runtime fallback
-        cython_success = False
-        result = None
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the block to JSON bytes, memoized per block hash.
         
-        if USE_CYTHON:
-            try:
-                result = calculate_block_hash(
-                    self.index, 
-                    float(self.timestamp), 
-                    self.data, 
-                    self.previous_hash, 
-                    self.nonce
-                )
-                cython_success = True
-            except Exception:
-                # Cython failed at runtime, will fall back to Python
-                cython_success = False
-        
-        if not cython_success:
-            # Fallback to pure Python
-            result = self._python_calculate_hash()
+        Returns:
+            UTF-8 encoded JSON of to_dict(), reused until the block is re-mined
+        """
+        if self._json_bytes is None or self._json_hash != self.hash:
+            if USE_ORJSON:
+                self._json_bytes = orjson.dumps(self.to_dict())
+            else:
+                self._json_bytes = json.dumps(self.to_dict(), separators=(",", ":")).encode()
+            self._json_hash = self.hash
+        return self._json_bytes
+
+    def attach_json_bytes(self, raw: bytes):
+        """
+        Attach the wire bytes a block was received as, so rebroadcasts skip re-serialization.
         
-        return result
+        Args:
+            raw: JSON body the block was decoded from
+        """
+        self._json_bytes = raw
+        self._json_hash = self.hash
@@ -1,19 +1,28 @@
+import hashlib
 import time
-import threading
-from typing import List, Dict, Optional
-from blockchain.block import Block
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional
+from blockchain.block import Block, compute_block_hash, split_block_header
 from config import (
     MINING_REWARD, MAX_TRANSACTIONS_PER_BLOCK, COINBASE_ADDRESS,
     TransactionType, COIN_SYMBOL, MINING_DIFFICULTY
 )
 
-# Try to use Cython-optimized mining
+# Try to use Cython-optimized mining (nonce search runs without the GIL)
 try:
-    from cython_modules.block_utils import mine_block_hash
+    from cython_modules.block_utils import mine_block_nogil
     USE_CYTHON = True
 except ImportError:
     USE_CYTHON = False
 
+# Try to use fastrlock's Cython RLock (near-free when uncontended)
+try:
+    from fastrlock.rlock import FastRLock as RLock
+    USE_FASTRLOCK = True
+except ImportError:
+    from threading import RLock
+    USE_FASTRLOCK = False
+
 GENESIS_BLOCK = Block(
     index=0,
     timestamp=0,
@@ -22,6 +31,9 @@ GENESIS_BLOCK = Block(
 )
 
 class Blockchain:
+    # Nonces tried per proof-of-work batch before checking for an abort
+    _POW_BATCH = 50000
+
     def __init__(self, chain_data: Optional[List[Dict]] = None):
         """
         Initialize blockchain.
@@ -37,11 +49,18 @@ class Blockchain:
             self.chain = [GENESIS_BLOCK]
         
         self.pending_transactions = []
+        self._pending_tx_ids = set()  # tx_ids in pending_transactions, kept in step with the list
+        # Running per-sender [count, amount] of pending outgoing transactions
+        # (all types / auto-transfers only), so balance checks don't scan the pool
+        self._pending_outgoing = {}
+        self._pending_outgoing_auto = {}
         self.difficulty = MINING_DIFFICULTY  # Use config value
         self._balance_cache = {}  # Cache for balance lookups
         self._cache_chain_length = len(self.chain)  # Track chain length when cache was built
         self._mined_tx_cache = set()  # Cache for mined transaction IDs
-        self._lock = threading.RLock()  # Thread safety for balance operations
+        # Read-only (chain length, balances) snapshot, swapped atomically on rebuild
+        self._balance_snapshot = (0, MappingProxyType({}))
+        self._lock = RLock()  # Thread safety for balance operations
     
     def _restore_chain(self, chain_data: List[Dict]) -> List[Block]:
         """
@@ -53,19 +72,12 @@ class Blockchain:
         Returns:
             List of Block objects
         """
-        chain = []
-        for block_dict in chain_data:
-            block = Block(
-                index=block_dict["index"],
-                timestamp=block_dict["timestamp"],
-                data=block_dict["data"],
-                previous_hash=block_dict["previous_hash"],
-                nonce=block_dict["nonce"]
-            )
-            # Restore the original hash (don't recalculate)
-            block.hash = block_dict["hash"]
-            chain.append(block)
-        return chain
+        # Restore the original hashes (don't recalculate)
+        make_block = Block
+        return [
+            make_block(b["index"], b["timestamp"], b["data"], b["previous_hash"], b["nonce"], b["hash"])
+            for b in chain_data
+        ]
 
     def get_latest_block(self):
         return self.chain[-1]
@@ -75,6 +87,13 @@ class Blockchain:
         self._balance_cache = {}
         self._mined_tx_cache = set()
         self._cache_chain_length = len(self.chain)
+        self._balance_snapshot = (0, MappingProxyType({}))
+
+    def _mined_ids(self) -> set:
+        """Live mined tx_id index, rebuilt if stale. Caller must hold _lock."""
+        if not self._mined_tx_cache or self._cache_chain_length != len(self.chain):
+            self._rebuild_caches()
+        return self._mined_tx_cache
 
     def get_mined_transaction_ids(self) -> set:
         """
@@ -82,13 +101,140 @@ class Blockchain:
         Uses caching for performance.
         """
         with self._lock:
-            if not self._mined_tx_cache or self._cache_chain_length != len(self.chain):
-                self._rebuild_caches()
-            return self._mined_tx_cache.copy()
+            return self._mined_ids().copy()
 
     def is_transaction_mined(self, tx_id: str) -> bool:
         """Check if a transaction has already been mined into the chain."""
-        return tx_id in self.get_mined_transaction_ids()
+        with self._lock:
+            return tx_id in self._mined_ids()
+
+    def is_transaction_pending(self, tx_id: str) -> bool:
+        """Check if a transaction is already in the pending pool."""
+        return tx_id in self._pending_tx_ids
+
+    def is_transaction_known(self, tx_id: str) -> bool:
+        """Check if a transaction is either pending or already mined."""
+        return tx_id in self._pending_tx_ids or self.is_transaction_mined(tx_id)
+
+    def _track_outgoing(self, tx_dict: dict, sign: int):
+        """
+        Add (sign=1) or remove (sign=-1) a transaction from the per-sender
+        pending-outgoing totals. Must be called within _lock.
+        """
+        sender = tx_dict.get("sender")
+        if not sender:
+            return
+        amount = float(tx_dict.get("amount", 0))
+        
+        totals = [self._pending_outgoing]
+        if tx_dict.get("tx_type") == TransactionType.AUTO_TRANSFER:
+            totals.append(self._pending_outgoing_auto)
+        
+        for by_sender in totals:
+            entry = by_sender.setdefault(sender, [0, 0.0])
+            entry[0] += sign
+            entry[1] += sign * amount
+            if entry[0] <= 0:
+                # Drop the entry (and any float drift) once nothing is pending
+                del by_sender[sender]
+
+    def get_pending_outgoing(self, address: str, auto_only: bool = False) -> float:
+        """
+        Total amount of pending transactions sent by address (O(1)).
+        
+        Args:
+            address: Sender address
+            auto_only: Only count auto-transfer transactions
+        """
+        by_sender = self._pending_outgoing_auto if auto_only else self._pending_outgoing
+        entry = by_sender.get(address)
+        return entry[1] if entry else 0.0
+
+    def add_pending(self, tx_dict: dict) -> bool:
+        """
+        Append a validated transaction to the pending pool.
+        Keeps the tx_id index and pending-outgoing totals in step.
+        
+        The duplicate check and the append happen under one lock, so the same
+        transaction relayed by several peers at once is only admitted once.
+        
+        Returns:
+            True if added, False if it is already pending or mined
+        """
+        tx_id = tx_dict.get("tx_id")
+        with self._lock:
+            if tx_id in self._pending_tx_ids or tx_id in self._mined_ids():
+                return False
+            self.pending_transactions.append(tx_dict)
+            self._pending_tx_ids.add(tx_id)
+            self._track_outgoing(tx_dict, 1)
+            return True
+
+    def reserve_pending(self, tx_dict: dict) -> bool:
+        """
+        Atomically check the sender can afford a transaction and admit it.
+        
+        The balance check and the append happen under one lock, so two
+        concurrent transfers from the same wallet can't both pass the
+        check and over-spend.
+        
+        Args:
+            tx_dict: Signed transaction dict
+            
+        Returns:
+            True if admitted, False if balance minus pending outgoing is too
+            low (or the transaction is already pending or mined)
+        """
+        sender = tx_dict.get("sender")
+        amount = float(tx_dict.get("amount", 0))
+        with self._lock:
+            if self.get_balance(sender) - self.get_pending_outgoing(sender) < amount:
+                return False
+            return self.add_pending(tx_dict)
+
+    def set_pending(self, transactions: List[Dict]):
+        """Replace the pending pool (e.g. when loading it from storage)."""
+        with self._lock:
+            self.pending_transactions = transactions
+            self._pending_tx_ids = {tx.get("tx_id") for tx in transactions}
+            self._pending_outgoing = {}
+            self._pending_outgoing_auto = {}
+            for tx in transactions:
+                self._track_outgoing(tx, 1)
+
+    @staticmethod
+    def _apply_block(block, balances: dict, mined_tx_ids: set):
+        """Fold one block's transactions into balances and mined_tx_ids."""
+        if not isinstance(block.data, list):
+            return
+            
+        for tx in block.data:
+            if isinstance(tx, dict):
+                tx_id = tx.get("tx_id")
+                
+                # Skip duplicate transactions (already processed)
+                if tx_id and tx_id in mined_tx_ids:
+                    continue
+                
+                if tx_id:
+                    mined_tx_ids.add(tx_id)
+                
+                receiver = tx.get("receiver")
+                sender = tx.get("sender")
+                amount = float(tx.get("amount", 0))
+                
+                if receiver:
+                    balances[receiver] = balances.get(receiver, 0.0) + amount
+                if sender and sender != COINBASE_ADDRESS:
+                    balances[sender] = balances.get(sender, 0.0) - amount
+
+    def _publish_caches(self, balances: dict, mined_tx_ids: set):
+        """Install freshly built caches for the current chain length."""
+        self._balance_cache = balances
+        self._mined_tx_cache = mined_tx_ids
+        self._cache_chain_length = len(self.chain)
+        # balances is never mutated after this point, so readers can share it
+        self._balance_snapshot = (self._cache_chain_length, MappingProxyType(balances))
 
     def _rebuild_caches(self):
         """Rebuild both balance cache and mined tx cache from the chain."""
@@ -96,32 +242,25 @@ class Blockchain:
         mined_tx_ids = set()
         
         for block in self.chain:
-            if not isinstance(block.data, list):
-                continue
-                
-            for tx in block.data:
-                if isinstance(tx, dict):
-                    tx_id = tx.get("tx_id")
-                    
-                    # Skip duplicate transactions (already processed)
-                    if tx_id and tx_id in mined_tx_ids:
-                        continue
-                    
-                    if tx_id:
-                        mined_tx_ids.add(tx_id)
-                    
-                    receiver = tx.get("receiver")
-                    sender = tx.get("sender")
-                    amount = float(tx.get("amount", 0))
-                    
-                    if receiver:
-                        balances[receiver] = balances.get(receiver, 0.0) + amount
-                    if sender and sender != COINBASE_ADDRESS:
-                        balances[sender] = balances.get(sender, 0.0) - amount
+            self._apply_block(block, balances, mined_tx_ids)
         
-        self._balance_cache = balances
-        self._mined_tx_cache = mined_tx_ids
-        self._cache_chain_length = len(self.chain)
+        self._publish_caches(balances, mined_tx_ids)
+
+    def _extend_caches(self, block):
+        """
+        Fold a block just appended to the chain into the caches, instead of
+        invalidating them and rescanning the whole chain on the next lookup.
+        Caller must hold _lock.
+        """
+        if (not self._mined_tx_cache or self.chain[-1] is not block
+                or self._cache_chain_length != len(self.chain) - 1):
+            self._invalidate_cache()
+            return
+        
+        # Published balance snapshots are shared with readers - copy, don't mutate
+        balances = dict(self._balance_cache)
+        self._apply_block(block, balances, self._mined_tx_cache)
+        self._publish_caches(balances, self._mined_tx_cache)
 
     def _rebuild_all_balances(self) -> dict:
         """
@@ -179,7 +318,7 @@ class Blockchain:
             return (False, "Transaction already mined in blockchain")
         
         # Check if transaction already in pending
-        if tx_id and any(t.get("tx_id") == tx_id for t in self.pending_transactions):
+        if tx_id and tx_id in self._pending_tx_ids:
             return (False, "Transaction already in pending pool")
         
         # Coinbase transactions are only created during mining
@@ -205,34 +344,101 @@ class Blockchain:
         
         return (True, "")
 
-    def _python_proof_of_work(self, block):
-        """Pure Python proof-of-work implementation."""
-        while block.hash[:self.difficulty] != "0" * self.difficulty:
-            block.nonce += 1
-            block.hash = block.calculate_hash()
-
-    def proof_of_work(self, block):
-        # Use Cython-optimized mining if available, with runtime fallback
-        cython_success = False
-        
-        if USE_CYTHON:
-            try:
-                block.hash, block.nonce = mine_block_hash(
-                    block.index,
-                    float(block.timestamp),
-                    block.data,
-                    block.previous_hash,
-                    self.difficulty,
-                    block.nonce
-                )
-                cython_success = True
-            except Exception:
-                # Cython failed at runtime, will fall back to Python
-                cython_success = False
-        
-        if not cython_success:
-            # Fallback to pure Python
-            self._python_proof_of_work(block)
+    def _python_proof_of_work(self, block, max_attempts: int) -> bool:
+        """
+        Pure Python proof-of-work implementation.
+        The SHA-256 state of the header before the nonce is reused, so each
+        attempt only hashes the nonce and the header tail.
+        """
+        prefix, suffix = split_block_header(block.index, block.timestamp,
+                                            block.data, block.previous_hash)
+        base = hashlib.sha256(prefix)
+        target = "0" * self.difficulty
+        
+        for nonce in range(block.nonce, block.nonce + max_attempts):
+            h = base.copy()
+            h.update(str(nonce).encode())
+            h.update(suffix)
+            digest = h.hexdigest()
+            if digest.startswith(target):
+                block.hash, block.nonce = digest, nonce
+                return True
+        
+        block.nonce += max_attempts
+        return False
+
+    def proof_of_work(self, block, should_abort=None) -> bool:
+        """
+        Search for a valid nonce in batches of _POW_BATCH attempts.
+        Between batches should_abort() is polled, so mining stops promptly
+        when the block is no longer worth finishing (e.g. the tip moved).
+        
+        Returns:
+            True if block now has a valid hash, False if aborted
+        """
+        while True:
+            # Use Cython-optimized mining if available, with runtime fallback
+            cython_success = False
+            found = False
+            
+            if USE_CYTHON:
+                try:
+                    block_hash, block.nonce = mine_block_nogil(
+                        block.index,
+                        float(block.timestamp),
+                        block.data,
+                        block.previous_hash,
+                        self.difficulty,
+                        block.nonce,
+                        self._POW_BATCH
+                    )
+                    if block_hash is not None:
+                        block.hash = block_hash
+                        found = True
+                    cython_success = True
+                except Exception:
+                    # Cython failed at runtime, will fall back to Python
+                    cython_success = False
+            
+            if not cython_success:
+                # Fallback to pure Python
+                found = self._python_proof_of_work(block, self._POW_BATCH)
+            
+            if found:
+                return True
+            if should_abort is not None and should_abort():
+                return False
+
+    def _remove_pending(self, tx_ids: set) -> int:
+        """
+        Remove pending transactions whose tx_id is in tx_ids, in place.
+        
+        The pool is rewritten with one slice assignment, so readers iterating
+        it without the lock always see a complete list.
+        
+        Args:
+            tx_ids: Set of transaction IDs to drop
+            
+        Returns:
+            Number of transactions removed
+        """
+        with self._lock:
+            # tx_ids may be the whole mined index - only ever walk the pool
+            if self._pending_tx_ids.isdisjoint(tx_ids):
+                return 0
+            
+            pending = self.pending_transactions
+            count = len(pending)
+            kept = []
+            for tx in pending[:count]:
+                tx_id = tx.get("tx_id")
+                if tx_id in tx_ids:
+                    self._track_outgoing(tx, -1)
+                    self._pending_tx_ids.discard(tx_id)
+                else:
+                    kept.append(tx)
+            pending[:count] = kept
+            return count - len(kept)
 
     def cleanup_pending_transactions(self):
         """
@@ -240,13 +446,7 @@ class Blockchain:
         This prevents duplicate transactions from being included in new blocks.
         """
         with self._lock:
-            mined_ids = self.get_mined_transaction_ids()
-            original_count = len(self.pending_transactions)
-            self.pending_transactions = [
-                tx for tx in self.pending_transactions
-                if tx.get("tx_id") not in mined_ids
-            ]
-            removed = original_count - len(self.pending_transactions)
+            removed = self._remove_pending(self._mined_ids())
             if removed > 0:
                 import logging
                 logging.getLogger(__name__).info(f"[Cleanup] Removed {removed} already-mined transactions from pending")
@@ -260,7 +460,8 @@ class Blockchain:
             miner_address: Address to receive mining reward
             
         Returns:
-            Mined block or None if no transactions
+            Mined block, or None if mining was abandoned because another
+            block extended the chain first
         """
         from transaction.transaction import Transaction
         
@@ -270,7 +471,8 @@ class Blockchain:
         
         # Get transactions for this block (limit to MAX_TRANSACTIONS_PER_BLOCK)
         # Also double-check that no transaction is already mined
-        mined_ids = self.get_mined_transaction_ids()
+        with self._lock:
+            mined_ids = self._mined_ids()
         valid_pending = [
             tx for tx in self.pending_transactions 
             if tx.get("tx_id") not in mined_ids
@@ -287,22 +489,25 @@ class Blockchain:
             index=len(self.chain),
             timestamp=time.time(),
             data=block_data,
-            previous_hash=self.get_latest_block().hash
+            previous_hash=self.get_latest_block().hash,
+            hash=""  # Set by proof_of_work
         )
 
-        self.proof_of_work(block)
-        self.chain.append(block)
+        # Give up as soon as another block extends the chain we're mining on
+        tip_moved = lambda: self.get_latest_block().hash != block.previous_hash
+        if not self.proof_of_work(block, should_abort=tip_moved):
+            return None
+        
+        with self._lock:
+            if tip_moved():
+                return None  # Lost the race to a peer block; stale by now
+            self.chain.append(block)
+            # Update balance/mined caches incrementally after mining (thread-safe)
+            self._extend_caches(block)
         
         # Remove mined transactions from pending
         mined_tx_ids = {tx.get("tx_id") for tx in transactions_for_block}
-        self.pending_transactions = [
-            tx for tx in self.pending_transactions 
-            if tx.get("tx_id") not in mined_tx_ids
-        ]
-        
-        # Invalidate balance cache after mining (thread-safe)
-        with self._lock:
-            self._invalidate_cache()
+        self._remove_pending(mined_tx_ids)
         
         return block
 
@@ -320,7 +525,7 @@ class Blockchain:
                 return False
 
             self.chain.append(block)
-            self._invalidate_cache()  # Thread-safe cache invalidation
+            self._extend_caches(block)  # Thread-safe incremental cache update
             return True
 
     def replace_chain(self, new_chain) -> bool:
@@ -371,16 +576,65 @@ class Blockchain:
 
         return True
 
-    def get_all_balances(self) -> dict:
-        """Get balances of all addresses in the blockchain (uses cache)."""
+    def is_valid_chain_from_dicts(self, chain_data: List[Dict],
+                                  anchor_hash: Optional[str] = None) -> bool:
+        """
+        Validate chain integrity directly on block dictionaries (e.g. a peer's
+        /chain payload), without materializing Block objects.
+        
+        Args:
+            chain_data: Block dictionaries, starting at genesis unless anchor_hash is given
+            anchor_hash: Hash of the (already validated) block that chain_data extends
+        """
+        if not chain_data:
+            return False
+        
+        if anchor_hash is None:
+            # Check genesis block
+            if chain_data[0]["hash"] != GENESIS_BLOCK.hash:
+                return False
+            start = 1
+        else:
+            start = 0
+        
+        for i in range(start, len(chain_data)):
+            current = chain_data[i]
+            previous_hash = chain_data[i - 1]["hash"] if i else anchor_hash
+            
+            expected_hash = compute_block_hash(
+                current["index"],
+                current["timestamp"],
+                current["data"],
+                current["previous_hash"],
+                current["nonce"]
+            )
+            if current["hash"] != expected_hash:
+                return False
+            
+            if current["previous_hash"] != previous_hash:
+                return False
+        
+        return True
+
+    def get_all_balances(self) -> Mapping[str, float]:
+        """
+        Get balances of all addresses in the blockchain (uses cache).
+        
+        Returns:
+            Read-only mapping of address -> balance. Served lock-free from the
+            current snapshot when it matches the chain; rebuilt under the lock otherwise.
+        """
+        length, balances = self._balance_snapshot
+        if balances and length == len(self.chain):
+            return balances
+        
         with self._lock:
             # Ensure cache is up to date
             if not self._balance_cache or self._cache_chain_length != len(self.chain):
                 self._balance_cache = self._rebuild_all_balances()
                 self._cache_chain_length = len(self.chain)
             
-            # Return a copy to prevent external modification
-            return dict(self._balance_cache)
+            return self._balance_snapshot[1]
 
     def get_transactions(self, address: str, tx_filter: str = "all", 
                          include_pending: bool = True) -> dict:
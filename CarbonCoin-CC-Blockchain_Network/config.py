@@ -72,6 +72,10 @@ MINER_AUTO_TRANSFER_THRESHOLD = _get_env_float("MINER_AUTO_TRANSFER_THRESHOLD",
 # This prevents leftover coins from accumulating
 AUTO_TRANSFER_ALL = True
 
+# Ceiling (seconds) for the auto-transfer fallback check; the interval starts
+# short after a transfer or balance change and doubles up to this while idle
+AUTO_TRANSFER_MAX_INTERVAL = _get_env_float("AUTO_TRANSFER_MAX_INTERVAL", 30.0)
+
 # Maximum transactions per block (excluding coinbase/reward transaction)
 MAX_TRANSACTIONS_PER_BLOCK = _get_env_int("MAX_TRANSACTIONS_PER_BLOCK", 1)
 
@@ -117,6 +121,10 @@ BOOTSTRAP_PEERS = _get_env_list_str("BOOTSTRAP_PEERS", [
     "http://localhost:7000",
 ])
 
+# Transaction gossip fan-out: each transaction is sent to max(this, sqrt(#peers))
+# randomly chosen peers, which relay it onward
+TX_BROADCAST_FANOUT = _get_env_int("TX_BROADCAST_FANOUT", 8)
+
 # =============================================================================
 # SPECIAL ADDRESSES
 # =============================================================================
@@ -132,6 +140,13 @@ MONGO_URI = os.getenv("MONGO_URI", "")
 MONGO_DATABASE = os.getenv("MONGO_DATABASE", "User")
 MONGO_WALLETS_COLLECTION = os.getenv("MONGO_WALLETS_COLLECTION", "Wallets")
 
+# Connection pool bounds for the (single, process-wide) MongoClient: keep a few
+# warm connections so wallet requests skip connect/TLS/auth, cap the rest
+MONGO_MAX_POOL = _get_env_int("MONGO_MAX_POOL", 10)
+MONGO_MIN_POOL = _get_env_int("MONGO_MIN_POOL", 2)
+# Close pooled connections idle for longer than this (milliseconds)
+MONGO_MAX_IDLE_MS = _get_env_int("MONGO_MAX_IDLE_MS", 60000)
+
 # =============================================================================
 # TRANSACTION TYPES
 # =============================================================================
@@ -3,7 +3,7 @@
 
 try:
     from .crypto_utils import fast_sha256, fast_double_sha256, validate_proof
-    from .block_utils import calculate_block_hash, mine_block_hash
+    from .block_utils import calculate_block_hash, mine_block_hash, mine_block_nogil
     CYTHON_AVAILABLE = True
 except ImportError:
     CYTHON_AVAILABLE = False
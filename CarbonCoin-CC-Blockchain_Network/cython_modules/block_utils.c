@@ -6,7 +6,11 @@
         "depends": [],
         "extra_compile_args": [
             "/O2",
-            "/arch:AVX2"
+            "/arch:AVX2",
+            "/GL"
+        ],
+        "extra_link_args": [
+            "/LTCG"
         ],
         "name": "cython_modules.block_utils",
         "sources": [
@@ -1266,6 +1270,7 @@ static int __Pyx_init_co_variables(void) {
     #define PyContextVar_Get(var, d, v)         ((d) ?             ((void)(var), Py_INCREF(d), (v)[0] = (d), 0) :             ((v)[0] = NULL, 0)         )
     #endif
     
+#include <stdint.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1489,6 +1494,13 @@ static const char* const __pyx_f[] = {
   "cpython/complex.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
 /* Atomics.proto (used by UnpackUnboundCMethod) */
 #include <pythread.h>
 #ifndef CYTHON_ATOMICS
@@ -1658,6 +1670,11 @@ static const char* const __pyx_f[] = {
 /* IncludeStructmemberH.proto (used by FixUpExtensionType) */
 #include <structmember.h>
 
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
 /* #### Code section: numeric_typedefs ### */
 /* #### Code section: complex_type_declarations ### */
 /* #### Code section: type_declarations ### */
@@ -1689,10 +1706,53 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
   int __pyx_n;
   PyObject *default_value;
 };
+struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx;
+struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce;
+struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_nogil;
 struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash;
 struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment;
 
-/* "cython_modules/block_utils.pyx":40
+/* "cython_modules/block_utils.pyx":33
+ * ]
+ * 
+ * cdef struct Sha256Ctx:             # <<<<<<<<<<<<<<
+ *     uint32_t state[8]
+ *     uint64_t bitlen
+*/
+struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx {
+  uint32_t state[8];
+  uint64_t bitlen;
+  uint8_t data[64];
+  uint32_t datalen;
+};
+
+/* "cython_modules/block_utils.pyx":160
+ * 
+ * 
+ * cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,             # <<<<<<<<<<<<<<
+ *                        long long max_attempts=0):
+ *     """
+*/
+struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce {
+  int __pyx_n;
+  PY_LONG_LONG start_nonce;
+  PY_LONG_LONG max_attempts;
+};
+
+/* "cython_modules/block_utils.pyx":241
+ * 
+ * 
+ * cpdef tuple mine_block_nogil(object index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                              str previous_hash, int difficulty, long long start_nonce=0,
+ *                              long long max_attempts=0):
+*/
+struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_nogil {
+  int __pyx_n;
+  PY_LONG_LONG start_nonce;
+  PY_LONG_LONG max_attempts;
+};
+
+/* "cython_modules/block_utils.pyx":290
  * 
  * 
  * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
@@ -1704,7 +1764,7 @@ struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash {
   long start_nonce;
 };
 
-/* "cython_modules/block_utils.pyx":137
+/* "cython_modules/block_utils.pyx":387
  * 
  * 
  * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
@@ -1791,14 +1851,25 @@ struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment {
 #define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
 #define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
 
-/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+/* PyValueError_Check.proto */
+#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
+
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
 #else
-#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
 #endif
 
+/* PyObjectFastCall.proto */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs);
+
 /* PyThreadStateGet.proto (used by PyErrFetchRestore) */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1817,7 +1888,7 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
 #endif
 
-/* PyErrFetchRestore.proto (used by PyObjectGetAttrStrNoError) */
+/* PyErrFetchRestore.proto (used by RaiseException) */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
 #define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
@@ -1842,102 +1913,8 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
 #endif
 
-/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
-#else
-#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
-#endif
-
-/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
-
-/* GetBuiltinName.proto (used by GetModuleGlobalName) */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name);
-
-/* PyDictVersioning.proto (used by GetModuleGlobalName) */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
-#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
-    (version_var) = __PYX_GET_DICT_VERSION(dict);\
-    (cache_var) = (value);
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
-        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
-    } else {\
-        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
-        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
-    }\
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
-#else
-#define __PYX_GET_DICT_VERSION(dict)  (0)
-#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
-#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
-#endif
-
-/* GetModuleGlobalName.proto */
-#if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  do {\
-    static PY_UINT64_T __pyx_dict_version = 0;\
-    static PyObject *__pyx_dict_cached_value = NULL;\
-    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
-        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
-        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
-    PY_UINT64_T __pyx_dict_version;\
-    PyObject *__pyx_dict_cached_value;\
-    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-} while(0)
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
-#else
-#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
-#endif
-
-/* PyObjectCall.proto (used by PyObjectFastCall) */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
-#endif
-
-/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
-#endif
-
-/* PyObjectFastCall.proto (used by PyObjectVectorCallKwBuilder) */
-#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs);
-
-/* PyObjectVectorCallKwBuilder.proto */
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-#if CYTHON_VECTORCALL
-#if PY_VERSION_HEX >= 0x03090000
-#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
-#else
-#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
-#endif
-#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
-#else
-#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
-#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
-#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
-#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
-#endif
-
-/* RaiseUnexpectedTypeError.proto */
-static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
 /* PyObjectFastCallMethod.proto */
 #if CYTHON_VECTORCALL && PY_VERSION_HEX >= 0x03090000
@@ -2015,6 +1992,13 @@ static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d);
 /* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* PyObjectGetAttrStr.proto (used by UnpackUnboundCMethod) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
 /* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
 typedef struct {
     PyObject *type;
@@ -2131,6 +2115,113 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
     ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
         __Pyx__ArgTypeTest(obj, type, name, exact))
 
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyObjectVectorCallKwBuilder.proto */
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#if CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
+#endif
+#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
+#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
+#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
+#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
+#endif
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* PyObjectCall2Args.proto (used by CallUnboundCMethod1) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* CallUnboundCMethod1.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg);
+#else
+#define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
+#endif
+
+/* PyUnicode_Substring.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop);
+
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
+
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* RaiseNoneIterError.proto */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
+
 /* PySequenceMultiply.proto */
 #define __Pyx_PySequence_Multiply_Left(mul, seq)  __Pyx_PySequence_Multiply(seq, mul)
 #if !CYTHON_USE_TYPE_SLOTS
@@ -2368,12 +2459,21 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyLong_As_PY_LONG_LONG(PyObject *);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyLong_As_size_t(PyObject *);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
 
@@ -2567,7 +2667,20 @@ static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4imag_imag(PyComp
 
 /* Module declarations from "cpython" */
 
+/* Module declarations from "libc.stdint" */
+
 /* Module declarations from "cython_modules.block_utils" */
+static uint32_t __pyx_v_14cython_modules_11block_utils__K[64];
+static CYTHON_INLINE uint32_t __pyx_f_14cython_modules_11block_utils__rotr(uint32_t, uint32_t); /*proto*/
+static void __pyx_f_14cython_modules_11block_utils__sha256_transform(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *, uint8_t const *); /*proto*/
+static void __pyx_f_14cython_modules_11block_utils__sha256_init(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *); /*proto*/
+static void __pyx_f_14cython_modules_11block_utils__sha256_update(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *, uint8_t const *, size_t); /*proto*/
+static void __pyx_f_14cython_modules_11block_utils__sha256_final(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *, uint8_t *); /*proto*/
+static CYTHON_INLINE int __pyx_f_14cython_modules_11block_utils__format_nonce(PY_LONG_LONG, uint8_t *); /*proto*/
+static CYTHON_INLINE int __pyx_f_14cython_modules_11block_utils__meets_difficulty(uint8_t const *, int); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_find_nonce(PyObject *, PyObject *, int, int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce *__pyx_optional_args); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_split_block_header(PyObject *, double, PyObject *, PyObject *, int __pyx_skip_dispatch); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_mine_block_nogil(PyObject *, double, PyObject *, PyObject *, int, int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_nogil *__pyx_optional_args); /*proto*/
 static PyObject *__pyx_f_14cython_modules_11block_utils_calculate_block_hash(int, double, PyObject *, PyObject *, long, int __pyx_skip_dispatch); /*proto*/
 static PyObject *__pyx_f_14cython_modules_11block_utils_mine_block_hash(int, double, PyObject *, PyObject *, int, int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash *__pyx_optional_args); /*proto*/
 static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash(PyObject *, PyObject *, double, double, int __pyx_skip_dispatch); /*proto*/
@@ -2584,11 +2697,14 @@ int __pyx_module_is_main_cython_modules__block_utils = 0;
 /* #### Code section: string_decls ### */
 static const char __pyx_k_High_performance_block_utilitie[] = "\nHigh-performance block utilities implemented in Cython.\nOptimized for mining and block hash calculations.\n";
 /* #### Code section: decls ### */
-static PyObject *__pyx_pf_14cython_modules_11block_utils_calculate_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce); /* proto */
-static PyObject *__pyx_pf_14cython_modules_11block_utils_2mine_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, long __pyx_v_start_nonce); /* proto */
-static PyObject *__pyx_pf_14cython_modules_11block_utils_4fast_transaction_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp); /* proto */
-static PyObject *__pyx_pf_14cython_modules_11block_utils_6fast_transaction_hash_bytes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp); /* proto */
-static PyObject *__pyx_pf_14cython_modules_11block_utils_8verify_chain_segment(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, int __pyx_v_start_index); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_find_nonce(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_prefix, PyObject *__pyx_v_suffix, int __pyx_v_difficulty, PY_LONG_LONG __pyx_v_start_nonce, PY_LONG_LONG __pyx_v_max_attempts); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_2split_block_header(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_4mine_block_nogil(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, PY_LONG_LONG __pyx_v_start_nonce, PY_LONG_LONG __pyx_v_max_attempts); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_6calculate_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_8mine_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, long __pyx_v_start_nonce); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_10fast_transaction_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_12fast_transaction_hash_bytes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp); /* proto */
+static PyObject *__pyx_pf_14cython_modules_11block_utils_14verify_chain_segment(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, int __pyx_v_start_index); /* proto */
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 /* SmallCodeConfig */
@@ -2615,9 +2731,10 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
-  PyObject *__pyx_tuple[2];
-  PyObject *__pyx_codeobj_tab[5];
-  PyObject *__pyx_string_tab[53];
+  __Pyx_CachedCFunction __pyx_umethod_PyUnicode_Type__rindex;
+  PyObject *__pyx_tuple[3];
+  PyObject *__pyx_codeobj_tab[8];
+  PyObject *__pyx_string_tab[67];
   PyObject *__pyx_number_tab[2];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -2664,54 +2781,68 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[2]
 #define __pyx_kp_u_add_note __pyx_string_tab[3]
 #define __pyx_kp_u_cython_modules_block_utils_pyx __pyx_string_tab[4]
-#define __pyx_kp_u_utf_8 __pyx_string_tab[5]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[6]
-#define __pyx_n_u_amount __pyx_string_tab[7]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[8]
-#define __pyx_n_u_calculate_block_hash __pyx_string_tab[9]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[10]
-#define __pyx_n_u_cython_modules_block_utils __pyx_string_tab[11]
-#define __pyx_n_u_data __pyx_string_tab[12]
-#define __pyx_n_u_difficulty __pyx_string_tab[13]
-#define __pyx_n_u_digest __pyx_string_tab[14]
-#define __pyx_n_u_dumps __pyx_string_tab[15]
-#define __pyx_n_u_encode __pyx_string_tab[16]
-#define __pyx_n_u_fast_transaction_hash __pyx_string_tab[17]
-#define __pyx_n_u_fast_transaction_hash_bytes __pyx_string_tab[18]
-#define __pyx_n_u_func __pyx_string_tab[19]
-#define __pyx_n_u_hashes __pyx_string_tab[20]
-#define __pyx_n_u_hashlib __pyx_string_tab[21]
-#define __pyx_n_u_hexdigest __pyx_string_tab[22]
-#define __pyx_n_u_index __pyx_string_tab[23]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[24]
-#define __pyx_n_u_items __pyx_string_tab[25]
-#define __pyx_n_u_json __pyx_string_tab[26]
-#define __pyx_n_u_main __pyx_string_tab[27]
-#define __pyx_n_u_mine_block_hash __pyx_string_tab[28]
-#define __pyx_n_u_module __pyx_string_tab[29]
-#define __pyx_n_u_name __pyx_string_tab[30]
-#define __pyx_n_u_nonce __pyx_string_tab[31]
-#define __pyx_n_u_pop __pyx_string_tab[32]
-#define __pyx_n_u_previous_hash __pyx_string_tab[33]
-#define __pyx_n_u_previous_hashes __pyx_string_tab[34]
-#define __pyx_n_u_qualname __pyx_string_tab[35]
-#define __pyx_n_u_receiver __pyx_string_tab[36]
-#define __pyx_n_u_sender __pyx_string_tab[37]
-#define __pyx_n_u_set_name __pyx_string_tab[38]
-#define __pyx_n_u_setdefault __pyx_string_tab[39]
-#define __pyx_n_u_sha256 __pyx_string_tab[40]
-#define __pyx_n_u_sort_keys __pyx_string_tab[41]
-#define __pyx_n_u_start_index __pyx_string_tab[42]
-#define __pyx_n_u_start_nonce __pyx_string_tab[43]
-#define __pyx_n_u_test __pyx_string_tab[44]
-#define __pyx_n_u_timestamp __pyx_string_tab[45]
-#define __pyx_n_u_values __pyx_string_tab[46]
-#define __pyx_n_u_verify_chain_segment __pyx_string_tab[47]
-#define __pyx_kp_b_iso88591_D_a_Q_7_gQiz __pyx_string_tab[48]
-#define __pyx_kp_b_iso88591_PQ_a_d_A_Q_a_WG1_a_z_gQa_1_E_aq __pyx_string_tab[49]
-#define __pyx_kp_b_iso88591_SST_c_wc_AQ_q_U_3c_q_A_1_1 __pyx_string_tab[50]
-#define __pyx_kp_b_iso88591_V1_A_Q_7_7_9G1 __pyx_string_tab[51]
-#define __pyx_kp_b_iso88591_V1_A_Q_7_7_9Ja __pyx_string_tab[52]
+#define __pyx_kp_u_difficulty_must_be_between_0_and __pyx_string_tab[5]
+#define __pyx_kp_u_nonce_0_previous_hash __pyx_string_tab[6]
+#define __pyx_kp_u_nonce_2 __pyx_string_tab[7]
+#define __pyx_kp_u_utf_8 __pyx_string_tab[8]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[9]
+#define __pyx_n_u_amount __pyx_string_tab[10]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[11]
+#define __pyx_n_u_calculate_block_hash __pyx_string_tab[12]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[13]
+#define __pyx_n_u_cython_modules_block_utils __pyx_string_tab[14]
+#define __pyx_n_u_data __pyx_string_tab[15]
+#define __pyx_n_u_difficulty __pyx_string_tab[16]
+#define __pyx_n_u_digest __pyx_string_tab[17]
+#define __pyx_n_u_dumps __pyx_string_tab[18]
+#define __pyx_n_u_encode __pyx_string_tab[19]
+#define __pyx_n_u_fast_transaction_hash __pyx_string_tab[20]
+#define __pyx_n_u_fast_transaction_hash_bytes __pyx_string_tab[21]
+#define __pyx_n_u_find_nonce __pyx_string_tab[22]
+#define __pyx_n_u_func __pyx_string_tab[23]
+#define __pyx_n_u_hashes __pyx_string_tab[24]
+#define __pyx_n_u_hashlib __pyx_string_tab[25]
+#define __pyx_n_u_hex __pyx_string_tab[26]
+#define __pyx_n_u_hexdigest __pyx_string_tab[27]
+#define __pyx_n_u_index __pyx_string_tab[28]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[29]
+#define __pyx_n_u_items __pyx_string_tab[30]
+#define __pyx_n_u_json __pyx_string_tab[31]
+#define __pyx_n_u_main __pyx_string_tab[32]
+#define __pyx_n_u_max_attempts __pyx_string_tab[33]
+#define __pyx_n_u_mine_block_hash __pyx_string_tab[34]
+#define __pyx_n_u_mine_block_nogil __pyx_string_tab[35]
+#define __pyx_n_u_module __pyx_string_tab[36]
+#define __pyx_n_u_name __pyx_string_tab[37]
+#define __pyx_n_u_nonce __pyx_string_tab[38]
+#define __pyx_n_u_pop __pyx_string_tab[39]
+#define __pyx_n_u_prefix __pyx_string_tab[40]
+#define __pyx_n_u_previous_hash __pyx_string_tab[41]
+#define __pyx_n_u_previous_hashes __pyx_string_tab[42]
+#define __pyx_n_u_qualname __pyx_string_tab[43]
+#define __pyx_n_u_receiver __pyx_string_tab[44]
+#define __pyx_n_u_rindex __pyx_string_tab[45]
+#define __pyx_n_u_sender __pyx_string_tab[46]
+#define __pyx_n_u_set_name __pyx_string_tab[47]
+#define __pyx_n_u_setdefault __pyx_string_tab[48]
+#define __pyx_n_u_sha256 __pyx_string_tab[49]
+#define __pyx_n_u_sort_keys __pyx_string_tab[50]
+#define __pyx_n_u_split_block_header __pyx_string_tab[51]
+#define __pyx_n_u_start_index __pyx_string_tab[52]
+#define __pyx_n_u_start_nonce __pyx_string_tab[53]
+#define __pyx_n_u_suffix __pyx_string_tab[54]
+#define __pyx_n_u_test __pyx_string_tab[55]
+#define __pyx_n_u_timestamp __pyx_string_tab[56]
+#define __pyx_n_u_values __pyx_string_tab[57]
+#define __pyx_n_u_verify_chain_segment __pyx_string_tab[58]
+#define __pyx_kp_b_iso88591_D_a_Q_7_gQiz __pyx_string_tab[59]
+#define __pyx_kp_b_iso88591_PQ_a_d_A_Q_a_WG1_a_z_gQa_1_E_aq __pyx_string_tab[60]
+#define __pyx_kp_b_iso88591_SST_c_wc_AQ_q_U_3c_q_A_1_1 __pyx_string_tab[61]
+#define __pyx_kp_b_iso88591_V1_A_Q_7_7_9G1 __pyx_string_tab[62]
+#define __pyx_kp_b_iso88591_V1_A_Q_7_7_9Ja __pyx_string_tab[63]
+#define __pyx_kp_b_iso88591_VW45_I_q_Qhhl_q __pyx_string_tab[64]
+#define __pyx_kp_b_iso88591_YYZ_0_1_5Q_5Q_S_S_2Q_a_Bc_Ba_j __pyx_string_tab[65]
+#define __pyx_kp_b_iso88591_d_Q_a_q_Qa_F_D_q_Rs __pyx_string_tab[66]
 #define __pyx_int_0 __pyx_number_tab[0]
 #define __pyx_int_1 __pyx_number_tab[1]
 /* #### Code section: module_state_clear ### */
@@ -2731,9 +2862,9 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_4type_type);
   Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_4bool_bool);
   Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_7complex_complex);
-  for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<5; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<53; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<8; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<67; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<2; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
@@ -2760,9 +2891,9 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_4type_type);
   Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_4bool_bool);
   Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_7complex_complex);
-  for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<5; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<53; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
+  for (int i=0; i<8; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<67; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<2; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
@@ -3094,1200 +3225,1514 @@ static CYTHON_INLINE PyObject *__pyx_f_7cpython_11contextvars_get_value_no_defau
 }
 #endif /*!(#if !CYTHON_COMPILING_IN_LIMITED_API)*/
 
-/* "cython_modules/block_utils.pyx":14
- * from cpython cimport bool
+/* "cython_modules/block_utils.pyx":40
+ * 
+ * 
+ * cdef inline uint32_t _rotr(uint32_t x, uint32_t n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (x >> n) | (x << (32 - n))
  * 
- * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                                 str previous_hash, long nonce):
- *     """
 */
 
-static PyObject *__pyx_pw_14cython_modules_11block_utils_1calculate_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static PyObject *__pyx_f_14cython_modules_11block_utils_calculate_block_hash(int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_block_string = 0;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("calculate_block_hash", 0);
+static CYTHON_INLINE uint32_t __pyx_f_14cython_modules_11block_utils__rotr(uint32_t __pyx_v_x, uint32_t __pyx_v_n) {
+  uint32_t __pyx_r;
 
-  /* "cython_modules/block_utils.pyx":29
- *         Hexadecimal hash string
- *     """
- *     cdef str block_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "index": index,
- *         "timestamp": timestamp,
+  /* "cython_modules/block_utils.pyx":41
+ * 
+ * cdef inline uint32_t _rotr(uint32_t x, uint32_t n) noexcept nogil:
+ *     return (x >> n) | (x << (32 - n))             # <<<<<<<<<<<<<<
+ * 
+ * 
 */
-  __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 29, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 29, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = ((__pyx_v_x >> __pyx_v_n) | (__pyx_v_x << (32 - __pyx_v_n)));
+  goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":30
- *     """
- *     cdef str block_string = json.dumps({
- *         "index": index,             # <<<<<<<<<<<<<<
- *         "timestamp": timestamp,
- *         "data": data,
+  /* "cython_modules/block_utils.pyx":40
+ * 
+ * 
+ * cdef inline uint32_t _rotr(uint32_t x, uint32_t n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return (x >> n) | (x << (32 - n))
+ * 
 */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_index, __pyx_t_5) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_modules/block_utils.pyx":31
- *     cdef str block_string = json.dumps({
- *         "index": index,
- *         "timestamp": timestamp,             # <<<<<<<<<<<<<<
- *         "data": data,
- *         "previous_hash": previous_hash,
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "cython_modules/block_utils.pyx":44
+ * 
+ * 
+ * cdef void _sha256_transform(Sha256Ctx* ctx, const uint8_t* chunk) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint32_t w[64]
+ *     cdef uint32_t a, b, c, d, e, f, g, h, t1, t2, s0, s1
 */
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_modules/block_utils.pyx":32
- *         "index": index,
- *         "timestamp": timestamp,
- *         "data": data,             # <<<<<<<<<<<<<<
- *         "previous_hash": previous_hash,
- *         "nonce": nonce
+static void __pyx_f_14cython_modules_11block_utils__sha256_transform(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *__pyx_v_ctx, uint8_t const *__pyx_v_chunk) {
+  uint32_t __pyx_v_w[64];
+  uint32_t __pyx_v_a;
+  uint32_t __pyx_v_b;
+  uint32_t __pyx_v_c;
+  uint32_t __pyx_v_d;
+  uint32_t __pyx_v_e;
+  uint32_t __pyx_v_f;
+  uint32_t __pyx_v_g;
+  uint32_t __pyx_v_h;
+  uint32_t __pyx_v_t1;
+  uint32_t __pyx_v_t2;
+  uint32_t __pyx_v_s0;
+  uint32_t __pyx_v_s1;
+  int __pyx_v_i;
+  int __pyx_t_1;
+  long __pyx_t_2;
+
+  /* "cython_modules/block_utils.pyx":49
+ *     cdef int i
+ * 
+ *     for i in range(16):             # <<<<<<<<<<<<<<
+ *         w[i] = ((<uint32_t>chunk[i * 4] << 24) | (<uint32_t>chunk[i * 4 + 1] << 16) |
+ *                 (<uint32_t>chunk[i * 4 + 2] << 8) | (<uint32_t>chunk[i * 4 + 3]))
 */
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_data, __pyx_v_data) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  for (__pyx_t_1 = 0; __pyx_t_1 < 16; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
 
-  /* "cython_modules/block_utils.pyx":33
- *         "timestamp": timestamp,
- *         "data": data,
- *         "previous_hash": previous_hash,             # <<<<<<<<<<<<<<
- *         "nonce": nonce
- *     }, sort_keys=True)
+    /* "cython_modules/block_utils.pyx":50
+ * 
+ *     for i in range(16):
+ *         w[i] = ((<uint32_t>chunk[i * 4] << 24) | (<uint32_t>chunk[i * 4 + 1] << 16) |             # <<<<<<<<<<<<<<
+ *                 (<uint32_t>chunk[i * 4 + 2] << 8) | (<uint32_t>chunk[i * 4 + 3]))
+ *     for i in range(16, 64):
 */
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_previous_hash, __pyx_v_previous_hash) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+    (__pyx_v_w[__pyx_v_i]) = ((((((uint32_t)(__pyx_v_chunk[(__pyx_v_i * 4)])) << 24) | (((uint32_t)(__pyx_v_chunk[((__pyx_v_i * 4) + 1)])) << 16)) | (((uint32_t)(__pyx_v_chunk[((__pyx_v_i * 4) + 2)])) << 8)) | ((uint32_t)(__pyx_v_chunk[((__pyx_v_i * 4) + 3)])));
+  }
 
-  /* "cython_modules/block_utils.pyx":34
- *         "data": data,
- *         "previous_hash": previous_hash,
- *         "nonce": nonce             # <<<<<<<<<<<<<<
- *     }, sort_keys=True)
+  /* "cython_modules/block_utils.pyx":52
+ *         w[i] = ((<uint32_t>chunk[i * 4] << 24) | (<uint32_t>chunk[i * 4 + 1] << 16) |
+ *                 (<uint32_t>chunk[i * 4 + 2] << 8) | (<uint32_t>chunk[i * 4 + 3]))
+ *     for i in range(16, 64):             # <<<<<<<<<<<<<<
+ *         s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+ *         s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+*/
+  for (__pyx_t_1 = 16; __pyx_t_1 < 64; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "cython_modules/block_utils.pyx":53
+ *                 (<uint32_t>chunk[i * 4 + 2] << 8) | (<uint32_t>chunk[i * 4 + 3]))
+ *     for i in range(16, 64):
+ *         s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)             # <<<<<<<<<<<<<<
+ *         s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+ *         w[i] = w[i - 16] + s0 + w[i - 7] + s1
+*/
+    __pyx_v_s0 = ((__pyx_f_14cython_modules_11block_utils__rotr((__pyx_v_w[(__pyx_v_i - 15)]), 7) ^ __pyx_f_14cython_modules_11block_utils__rotr((__pyx_v_w[(__pyx_v_i - 15)]), 18)) ^ ((__pyx_v_w[(__pyx_v_i - 15)]) >> 3));
+
+    /* "cython_modules/block_utils.pyx":54
+ *     for i in range(16, 64):
+ *         s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+ *         s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)             # <<<<<<<<<<<<<<
+ *         w[i] = w[i - 16] + s0 + w[i - 7] + s1
  * 
 */
-  __pyx_t_5 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 34, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_t_5) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_v_s1 = ((__pyx_f_14cython_modules_11block_utils__rotr((__pyx_v_w[(__pyx_v_i - 2)]), 17) ^ __pyx_f_14cython_modules_11block_utils__rotr((__pyx_v_w[(__pyx_v_i - 2)]), 19)) ^ ((__pyx_v_w[(__pyx_v_i - 2)]) >> 10));
 
-  /* "cython_modules/block_utils.pyx":35
- *         "previous_hash": previous_hash,
- *         "nonce": nonce
- *     }, sort_keys=True)             # <<<<<<<<<<<<<<
+    /* "cython_modules/block_utils.pyx":55
+ *         s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+ *         s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+ *         w[i] = w[i - 16] + s0 + w[i - 7] + s1             # <<<<<<<<<<<<<<
  * 
- *     return hashlib.sha256(block_string.encode('utf-8')).hexdigest()
+ *     a = ctx.state[0]; b = ctx.state[1]; c = ctx.state[2]; d = ctx.state[3]
 */
-  __pyx_t_6 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
-    assert(__pyx_t_2);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-    __Pyx_INCREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
-    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 29, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 29, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    (__pyx_v_w[__pyx_v_i]) = ((((__pyx_v_w[(__pyx_v_i - 16)]) + __pyx_v_s0) + (__pyx_v_w[(__pyx_v_i - 7)])) + __pyx_v_s1);
   }
 
-  /* "cython_modules/block_utils.pyx":29
- *         Hexadecimal hash string
- *     """
- *     cdef str block_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "index": index,
- *         "timestamp": timestamp,
+  /* "cython_modules/block_utils.pyx":57
+ *         w[i] = w[i - 16] + s0 + w[i - 7] + s1
+ * 
+ *     a = ctx.state[0]; b = ctx.state[1]; c = ctx.state[2]; d = ctx.state[3]             # <<<<<<<<<<<<<<
+ *     e = ctx.state[4]; f = ctx.state[5]; g = ctx.state[6]; h = ctx.state[7]
+ * 
 */
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 29, __pyx_L1_error)
-  __pyx_v_block_string = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_v_a = (__pyx_v_ctx->state[0]);
+  __pyx_v_b = (__pyx_v_ctx->state[1]);
+  __pyx_v_c = (__pyx_v_ctx->state[2]);
+  __pyx_v_d = (__pyx_v_ctx->state[3]);
 
-  /* "cython_modules/block_utils.pyx":37
- *     }, sort_keys=True)
+  /* "cython_modules/block_utils.pyx":58
  * 
- *     return hashlib.sha256(block_string.encode('utf-8')).hexdigest()             # <<<<<<<<<<<<<<
+ *     a = ctx.state[0]; b = ctx.state[1]; c = ctx.state[2]; d = ctx.state[3]
+ *     e = ctx.state[4]; f = ctx.state[5]; g = ctx.state[6]; h = ctx.state[7]             # <<<<<<<<<<<<<<
  * 
+ *     for i in range(64):
+*/
+  __pyx_v_e = (__pyx_v_ctx->state[4]);
+  __pyx_v_f = (__pyx_v_ctx->state[5]);
+  __pyx_v_g = (__pyx_v_ctx->state[6]);
+  __pyx_v_h = (__pyx_v_ctx->state[7]);
+
+  /* "cython_modules/block_utils.pyx":60
+ *     e = ctx.state[4]; f = ctx.state[5]; g = ctx.state[6]; h = ctx.state[7]
  * 
+ *     for i in range(64):             # <<<<<<<<<<<<<<
+ *         s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+ *         t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]
 */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_v_block_string == Py_None)) {
-    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(0, 37, __pyx_L1_error)
-  }
-  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_block_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_7))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
-    assert(__pyx_t_3);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
-    __Pyx_INCREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
-    __pyx_t_6 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
-    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 37, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+  for (__pyx_t_1 = 0; __pyx_t_1 < 64; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "cython_modules/block_utils.pyx":61
+ * 
+ *     for i in range(64):
+ *         s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)             # <<<<<<<<<<<<<<
+ *         t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]
+ *         s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+*/
+    __pyx_v_s1 = ((__pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_e, 6) ^ __pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_e, 11)) ^ __pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_e, 25));
+
+    /* "cython_modules/block_utils.pyx":62
+ *     for i in range(64):
+ *         s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+ *         t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]             # <<<<<<<<<<<<<<
+ *         s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+ *         t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+*/
+    __pyx_v_t1 = ((((__pyx_v_h + __pyx_v_s1) + ((__pyx_v_e & __pyx_v_f) ^ ((~__pyx_v_e) & __pyx_v_g))) + (__pyx_v_14cython_modules_11block_utils__K[__pyx_v_i])) + (__pyx_v_w[__pyx_v_i]));
+
+    /* "cython_modules/block_utils.pyx":63
+ *         s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+ *         t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]
+ *         s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)             # <<<<<<<<<<<<<<
+ *         t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+ *         h = g; g = f; f = e; e = d + t1
+*/
+    __pyx_v_s0 = ((__pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_a, 2) ^ __pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_a, 13)) ^ __pyx_f_14cython_modules_11block_utils__rotr(__pyx_v_a, 22));
+
+    /* "cython_modules/block_utils.pyx":64
+ *         t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]
+ *         s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+ *         t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))             # <<<<<<<<<<<<<<
+ *         h = g; g = f; f = e; e = d + t1
+ *         d = c; c = b; b = a; a = t1 + t2
+*/
+    __pyx_v_t2 = (__pyx_v_s0 + (((__pyx_v_a & __pyx_v_b) ^ (__pyx_v_a & __pyx_v_c)) ^ (__pyx_v_b & __pyx_v_c)));
+
+    /* "cython_modules/block_utils.pyx":65
+ *         s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+ *         t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+ *         h = g; g = f; f = e; e = d + t1             # <<<<<<<<<<<<<<
+ *         d = c; c = b; b = a; a = t1 + t2
+ * 
+*/
+    __pyx_v_h = __pyx_v_g;
+    __pyx_v_g = __pyx_v_f;
+    __pyx_v_f = __pyx_v_e;
+    __pyx_v_e = (__pyx_v_d + __pyx_v_t1);
+
+    /* "cython_modules/block_utils.pyx":66
+ *         t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+ *         h = g; g = f; f = e; e = d + t1
+ *         d = c; c = b; b = a; a = t1 + t2             # <<<<<<<<<<<<<<
+ * 
+ *     ctx.state[0] += a; ctx.state[1] += b; ctx.state[2] += c; ctx.state[3] += d
+*/
+    __pyx_v_d = __pyx_v_c;
+    __pyx_v_c = __pyx_v_b;
+    __pyx_v_b = __pyx_v_a;
+    __pyx_v_a = (__pyx_v_t1 + __pyx_v_t2);
   }
-  __pyx_t_4 = __pyx_t_5;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_t_6 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+
+  /* "cython_modules/block_utils.pyx":68
+ *         d = c; c = b; b = a; a = t1 + t2
+ * 
+ *     ctx.state[0] += a; ctx.state[1] += b; ctx.state[2] += c; ctx.state[3] += d             # <<<<<<<<<<<<<<
+ *     ctx.state[4] += e; ctx.state[5] += f; ctx.state[6] += g; ctx.state[7] += h
+ * 
+*/
+  __pyx_t_2 = 0;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_a);
+  __pyx_t_2 = 1;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_b);
+  __pyx_t_2 = 2;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_c);
+  __pyx_t_2 = 3;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_d);
+
+  /* "cython_modules/block_utils.pyx":69
+ * 
+ *     ctx.state[0] += a; ctx.state[1] += b; ctx.state[2] += c; ctx.state[3] += d
+ *     ctx.state[4] += e; ctx.state[5] += f; ctx.state[6] += g; ctx.state[7] += h             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_2 = 4;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_e);
+  __pyx_t_2 = 5;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_f);
+  __pyx_t_2 = 6;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_g);
+  __pyx_t_2 = 7;
+  (__pyx_v_ctx->state[__pyx_t_2]) = ((__pyx_v_ctx->state[__pyx_t_2]) + __pyx_v_h);
+
+  /* "cython_modules/block_utils.pyx":44
+ * 
+ * 
+ * cdef void _sha256_transform(Sha256Ctx* ctx, const uint8_t* chunk) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint32_t w[64]
+ *     cdef uint32_t a, b, c, d, e, f, g, h, t1, t2, s0, s1
+*/
+
+  /* function exit code */
+}
+
+/* "cython_modules/block_utils.pyx":72
+ * 
+ * 
+ * cdef void _sha256_init(Sha256Ctx* ctx) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     ctx.datalen = 0
+ *     ctx.bitlen = 0
+*/
+
+static void __pyx_f_14cython_modules_11block_utils__sha256_init(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *__pyx_v_ctx) {
+
+  /* "cython_modules/block_utils.pyx":73
+ * 
+ * cdef void _sha256_init(Sha256Ctx* ctx) noexcept nogil:
+ *     ctx.datalen = 0             # <<<<<<<<<<<<<<
+ *     ctx.bitlen = 0
+ *     ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85
+*/
+  __pyx_v_ctx->datalen = 0;
+
+  /* "cython_modules/block_utils.pyx":74
+ * cdef void _sha256_init(Sha256Ctx* ctx) noexcept nogil:
+ *     ctx.datalen = 0
+ *     ctx.bitlen = 0             # <<<<<<<<<<<<<<
+ *     ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85
+ *     ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a
+*/
+  __pyx_v_ctx->bitlen = 0;
+
+  /* "cython_modules/block_utils.pyx":75
+ *     ctx.datalen = 0
+ *     ctx.bitlen = 0
+ *     ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85             # <<<<<<<<<<<<<<
+ *     ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a
+ *     ctx.state[4] = 0x510e527f; ctx.state[5] = 0x9b05688c
+*/
+  (__pyx_v_ctx->state[0]) = 0x6a09e667;
+  (__pyx_v_ctx->state[1]) = 0xbb67ae85;
+
+  /* "cython_modules/block_utils.pyx":76
+ *     ctx.bitlen = 0
+ *     ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85
+ *     ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a             # <<<<<<<<<<<<<<
+ *     ctx.state[4] = 0x510e527f; ctx.state[5] = 0x9b05688c
+ *     ctx.state[6] = 0x1f83d9ab; ctx.state[7] = 0x5be0cd19
+*/
+  (__pyx_v_ctx->state[2]) = 0x3c6ef372;
+  (__pyx_v_ctx->state[3]) = 0xa54ff53a;
+
+  /* "cython_modules/block_utils.pyx":77
+ *     ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85
+ *     ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a
+ *     ctx.state[4] = 0x510e527f; ctx.state[5] = 0x9b05688c             # <<<<<<<<<<<<<<
+ *     ctx.state[6] = 0x1f83d9ab; ctx.state[7] = 0x5be0cd19
+ * 
+*/
+  (__pyx_v_ctx->state[4]) = 0x510e527f;
+  (__pyx_v_ctx->state[5]) = 0x9b05688c;
+
+  /* "cython_modules/block_utils.pyx":78
+ *     ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a
+ *     ctx.state[4] = 0x510e527f; ctx.state[5] = 0x9b05688c
+ *     ctx.state[6] = 0x1f83d9ab; ctx.state[7] = 0x5be0cd19             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (__pyx_v_ctx->state[6]) = 0x1f83d9ab;
+  (__pyx_v_ctx->state[7]) = 0x5be0cd19;
+
+  /* "cython_modules/block_utils.pyx":72
+ * 
+ * 
+ * cdef void _sha256_init(Sha256Ctx* ctx) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     ctx.datalen = 0
+ *     ctx.bitlen = 0
+*/
+
+  /* function exit code */
+}
+
+/* "cython_modules/block_utils.pyx":81
+ * 
+ * 
+ * cdef void _sha256_update(Sha256Ctx* ctx, const uint8_t* data, size_t length) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     for i in range(length):
+*/
+
+static void __pyx_f_14cython_modules_11block_utils__sha256_update(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *__pyx_v_ctx, uint8_t const *__pyx_v_data, size_t __pyx_v_length) {
+  size_t __pyx_v_i;
+  size_t __pyx_t_1;
+  size_t __pyx_t_2;
+  size_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "cython_modules/block_utils.pyx":83
+ * cdef void _sha256_update(Sha256Ctx* ctx, const uint8_t* data, size_t length) noexcept nogil:
+ *     cdef size_t i
+ *     for i in range(length):             # <<<<<<<<<<<<<<
+ *         ctx.data[ctx.datalen] = data[i]
+ *         ctx.datalen += 1
+*/
+  __pyx_t_1 = __pyx_v_length;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "cython_modules/block_utils.pyx":84
+ *     cdef size_t i
+ *     for i in range(length):
+ *         ctx.data[ctx.datalen] = data[i]             # <<<<<<<<<<<<<<
+ *         ctx.datalen += 1
+ *         if ctx.datalen == 64:
+*/
+    (__pyx_v_ctx->data[__pyx_v_ctx->datalen]) = (__pyx_v_data[__pyx_v_i]);
+
+    /* "cython_modules/block_utils.pyx":85
+ *     for i in range(length):
+ *         ctx.data[ctx.datalen] = data[i]
+ *         ctx.datalen += 1             # <<<<<<<<<<<<<<
+ *         if ctx.datalen == 64:
+ *             _sha256_transform(ctx, ctx.data)
+*/
+    __pyx_v_ctx->datalen = (__pyx_v_ctx->datalen + 1);
+
+    /* "cython_modules/block_utils.pyx":86
+ *         ctx.data[ctx.datalen] = data[i]
+ *         ctx.datalen += 1
+ *         if ctx.datalen == 64:             # <<<<<<<<<<<<<<
+ *             _sha256_transform(ctx, ctx.data)
+ *             ctx.bitlen += 512
+*/
+    __pyx_t_4 = (__pyx_v_ctx->datalen == 64);
+    if (__pyx_t_4) {
+
+      /* "cython_modules/block_utils.pyx":87
+ *         ctx.datalen += 1
+ *         if ctx.datalen == 64:
+ *             _sha256_transform(ctx, ctx.data)             # <<<<<<<<<<<<<<
+ *             ctx.bitlen += 512
+ *             ctx.datalen = 0
+*/
+      __pyx_f_14cython_modules_11block_utils__sha256_transform(__pyx_v_ctx, __pyx_v_ctx->data);
+
+      /* "cython_modules/block_utils.pyx":88
+ *         if ctx.datalen == 64:
+ *             _sha256_transform(ctx, ctx.data)
+ *             ctx.bitlen += 512             # <<<<<<<<<<<<<<
+ *             ctx.datalen = 0
+ * 
+*/
+      __pyx_v_ctx->bitlen = (__pyx_v_ctx->bitlen + 0x200);
+
+      /* "cython_modules/block_utils.pyx":89
+ *             _sha256_transform(ctx, ctx.data)
+ *             ctx.bitlen += 512
+ *             ctx.datalen = 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+      __pyx_v_ctx->datalen = 0;
+
+      /* "cython_modules/block_utils.pyx":86
+ *         ctx.data[ctx.datalen] = data[i]
+ *         ctx.datalen += 1
+ *         if ctx.datalen == 64:             # <<<<<<<<<<<<<<
+ *             _sha256_transform(ctx, ctx.data)
+ *             ctx.bitlen += 512
+*/
+    }
   }
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 37, __pyx_L1_error)
-  __pyx_r = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":14
- * from cpython cimport bool
+  /* "cython_modules/block_utils.pyx":81
  * 
- * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                                 str previous_hash, long nonce):
- *     """
+ * 
+ * cdef void _sha256_update(Sha256Ctx* ctx, const uint8_t* data, size_t length) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef size_t i
+ *     for i in range(length):
 */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_block_string);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_14cython_modules_11block_utils_1calculate_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_calculate_block_hash, "calculate_block_hash(int index, double timestamp, data, str previous_hash, long nonce) -> str\n\nCalculate block hash with optimized JSON serialization.\n\nArgs:\n    index: Block index\n    timestamp: Block timestamp\n    data: Block data (transactions)\n    previous_hash: Hash of previous block\n    nonce: Mining nonce\n    \nReturns:\n    Hexadecimal hash string");
-static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_1calculate_block_hash = {"calculate_block_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_1calculate_block_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_calculate_block_hash};
-static PyObject *__pyx_pw_14cython_modules_11block_utils_1calculate_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  int __pyx_v_index;
-  double __pyx_v_timestamp;
-  PyObject *__pyx_v_data = 0;
-  PyObject *__pyx_v_previous_hash = 0;
-  long __pyx_v_nonce;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[5] = {0,0,0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("calculate_block_hash (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,&__pyx_mstate_global->__pyx_n_u_nonce,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 14, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  5:
-        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 14, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 14, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 14, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 14, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 14, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "calculate_block_hash", 0) < (0)) __PYX_ERR(0, 14, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("calculate_block_hash", 1, 5, 5, i); __PYX_ERR(0, 14, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 5)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 14, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 14, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 14, __pyx_L3_error)
-      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 14, __pyx_L3_error)
-      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 14, __pyx_L3_error)
-    }
-    __pyx_v_index = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L3_error)
-    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L3_error)
-    __pyx_v_data = values[2];
-    __pyx_v_previous_hash = ((PyObject*)values[3]);
-    __pyx_v_nonce = __Pyx_PyLong_As_long(values[4]); if (unlikely((__pyx_v_nonce == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 15, __pyx_L3_error)
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("calculate_block_hash", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 14, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 15, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14cython_modules_11block_utils_calculate_block_hash(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_nonce);
-
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+/* "cython_modules/block_utils.pyx":92
+ * 
+ * 
+ * cdef void _sha256_final(Sha256Ctx* ctx, uint8_t* digest) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint32_t i = ctx.datalen
+ *     cdef int j
+*/
 
-static PyObject *__pyx_pf_14cython_modules_11block_utils_calculate_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("calculate_block_hash", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_calculate_block_hash(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_nonce, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+static void __pyx_f_14cython_modules_11block_utils__sha256_final(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx *__pyx_v_ctx, uint8_t *__pyx_v_digest) {
+  uint32_t __pyx_v_i;
+  int __pyx_v_j;
+  uint32_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "cython_modules/block_utils.pyx":93
+ * 
+ * cdef void _sha256_final(Sha256Ctx* ctx, uint8_t* digest) noexcept nogil:
+ *     cdef uint32_t i = ctx.datalen             # <<<<<<<<<<<<<<
+ *     cdef int j
+ * 
+*/
+  __pyx_t_1 = __pyx_v_ctx->datalen;
+  __pyx_v_i = __pyx_t_1;
 
-/* "cython_modules/block_utils.pyx":40
+  /* "cython_modules/block_utils.pyx":96
+ *     cdef int j
  * 
+ *     ctx.data[i] = 0x80             # <<<<<<<<<<<<<<
+ *     i += 1
+ *     if ctx.datalen < 56:
+*/
+  (__pyx_v_ctx->data[__pyx_v_i]) = 0x80;
+
+  /* "cython_modules/block_utils.pyx":97
  * 
- * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                             str previous_hash, int difficulty, long start_nonce=0):
- *     """
+ *     ctx.data[i] = 0x80
+ *     i += 1             # <<<<<<<<<<<<<<
+ *     if ctx.datalen < 56:
+ *         while i < 56:
+*/
+  __pyx_v_i = (__pyx_v_i + 1);
+
+  /* "cython_modules/block_utils.pyx":98
+ *     ctx.data[i] = 0x80
+ *     i += 1
+ *     if ctx.datalen < 56:             # <<<<<<<<<<<<<<
+ *         while i < 56:
+ *             ctx.data[i] = 0
 */
+  __pyx_t_2 = (__pyx_v_ctx->datalen < 56);
+  if (__pyx_t_2) {
 
-static PyObject *__pyx_pw_14cython_modules_11block_utils_3mine_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static PyObject *__pyx_f_14cython_modules_11block_utils_mine_block_hash(int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash *__pyx_optional_args) {
-  long __pyx_v_start_nonce = ((long)0);
-  long __pyx_v_nonce;
-  PyObject *__pyx_v_block_hash = 0;
-  CYTHON_UNUSED PyObject *__pyx_v_target = 0;
-  int __pyx_v_i;
-  int __pyx_v_valid;
-  PyObject *__pyx_v_block_template = 0;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  size_t __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  Py_UCS4 __pyx_t_16;
-  int __pyx_t_17;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("mine_block_hash", 0);
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_start_nonce = __pyx_optional_args->start_nonce;
+    /* "cython_modules/block_utils.pyx":99
+ *     i += 1
+ *     if ctx.datalen < 56:
+ *         while i < 56:             # <<<<<<<<<<<<<<
+ *             ctx.data[i] = 0
+ *             i += 1
+*/
+    while (1) {
+      __pyx_t_2 = (__pyx_v_i < 56);
+      if (!__pyx_t_2) break;
+
+      /* "cython_modules/block_utils.pyx":100
+ *     if ctx.datalen < 56:
+ *         while i < 56:
+ *             ctx.data[i] = 0             # <<<<<<<<<<<<<<
+ *             i += 1
+ *     else:
+*/
+      (__pyx_v_ctx->data[__pyx_v_i]) = 0;
+
+      /* "cython_modules/block_utils.pyx":101
+ *         while i < 56:
+ *             ctx.data[i] = 0
+ *             i += 1             # <<<<<<<<<<<<<<
+ *     else:
+ *         while i < 64:
+*/
+      __pyx_v_i = (__pyx_v_i + 1);
     }
+
+    /* "cython_modules/block_utils.pyx":98
+ *     ctx.data[i] = 0x80
+ *     i += 1
+ *     if ctx.datalen < 56:             # <<<<<<<<<<<<<<
+ *         while i < 56:
+ *             ctx.data[i] = 0
+*/
+    goto __pyx_L3;
   }
 
-  /* "cython_modules/block_utils.pyx":57
- *         Tuple of (hash, nonce) when valid proof found
- *     """
- *     cdef long nonce = start_nonce             # <<<<<<<<<<<<<<
- *     cdef str block_hash
- *     cdef str target = '0' * difficulty
+  /* "cython_modules/block_utils.pyx":103
+ *             i += 1
+ *     else:
+ *         while i < 64:             # <<<<<<<<<<<<<<
+ *             ctx.data[i] = 0
+ *             i += 1
 */
-  __pyx_v_nonce = __pyx_v_start_nonce;
+  /*else*/ {
+    while (1) {
+      __pyx_t_2 = (__pyx_v_i < 64);
+      if (!__pyx_t_2) break;
 
-  /* "cython_modules/block_utils.pyx":59
- *     cdef long nonce = start_nonce
- *     cdef str block_hash
- *     cdef str target = '0' * difficulty             # <<<<<<<<<<<<<<
- *     cdef int i
- *     cdef bint valid
+      /* "cython_modules/block_utils.pyx":104
+ *     else:
+ *         while i < 64:
+ *             ctx.data[i] = 0             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         _sha256_transform(ctx, ctx.data)
 */
-  __pyx_t_1 = __Pyx_PySequence_Multiply(__pyx_mstate_global->__pyx_kp_u_0, __pyx_v_difficulty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_target = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+      (__pyx_v_ctx->data[__pyx_v_i]) = 0;
+
+      /* "cython_modules/block_utils.pyx":105
+ *         while i < 64:
+ *             ctx.data[i] = 0
+ *             i += 1             # <<<<<<<<<<<<<<
+ *         _sha256_transform(ctx, ctx.data)
+ *         for j in range(56):
+*/
+      __pyx_v_i = (__pyx_v_i + 1);
+    }
 
-  /* "cython_modules/block_utils.pyx":65
- *     # Pre-build the static parts of the block
- *     cdef dict block_template = {
- *         "index": index,             # <<<<<<<<<<<<<<
- *         "timestamp": timestamp,
- *         "data": data,
+    /* "cython_modules/block_utils.pyx":106
+ *             ctx.data[i] = 0
+ *             i += 1
+ *         _sha256_transform(ctx, ctx.data)             # <<<<<<<<<<<<<<
+ *         for j in range(56):
+ *             ctx.data[j] = 0
 */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_index, __pyx_t_2) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_f_14cython_modules_11block_utils__sha256_transform(__pyx_v_ctx, __pyx_v_ctx->data);
 
-  /* "cython_modules/block_utils.pyx":66
- *     cdef dict block_template = {
- *         "index": index,
- *         "timestamp": timestamp,             # <<<<<<<<<<<<<<
- *         "data": data,
- *         "previous_hash": previous_hash,
+    /* "cython_modules/block_utils.pyx":107
+ *             i += 1
+ *         _sha256_transform(ctx, ctx.data)
+ *         for j in range(56):             # <<<<<<<<<<<<<<
+ *             ctx.data[j] = 0
+ * 
 */
-  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_2) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    for (__pyx_t_3 = 0; __pyx_t_3 < 56; __pyx_t_3+=1) {
+      __pyx_v_j = __pyx_t_3;
 
-  /* "cython_modules/block_utils.pyx":67
- *         "index": index,
- *         "timestamp": timestamp,
- *         "data": data,             # <<<<<<<<<<<<<<
- *         "previous_hash": previous_hash,
- *         "nonce": 0
+      /* "cython_modules/block_utils.pyx":108
+ *         _sha256_transform(ctx, ctx.data)
+ *         for j in range(56):
+ *             ctx.data[j] = 0             # <<<<<<<<<<<<<<
+ * 
+ *     ctx.bitlen += <uint64_t>ctx.datalen * 8
 */
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_data, __pyx_v_data) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
+      (__pyx_v_ctx->data[__pyx_v_j]) = 0;
+    }
+  }
+  __pyx_L3:;
 
-  /* "cython_modules/block_utils.pyx":68
- *         "timestamp": timestamp,
- *         "data": data,
- *         "previous_hash": previous_hash,             # <<<<<<<<<<<<<<
- *         "nonce": 0
- *     }
+  /* "cython_modules/block_utils.pyx":110
+ *             ctx.data[j] = 0
+ * 
+ *     ctx.bitlen += <uint64_t>ctx.datalen * 8             # <<<<<<<<<<<<<<
+ *     for j in range(8):
+ *         ctx.data[63 - j] = <uint8_t>(ctx.bitlen >> (8 * j))
 */
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_previous_hash, __pyx_v_previous_hash) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 65, __pyx_L1_error)
-  __pyx_v_block_template = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_v_ctx->bitlen = (__pyx_v_ctx->bitlen + (((uint64_t)__pyx_v_ctx->datalen) * 8));
 
-  /* "cython_modules/block_utils.pyx":72
- *     }
+  /* "cython_modules/block_utils.pyx":111
  * 
- *     while True:             # <<<<<<<<<<<<<<
- *         block_template["nonce"] = nonce
- *         block_hash = hashlib.sha256(
+ *     ctx.bitlen += <uint64_t>ctx.datalen * 8
+ *     for j in range(8):             # <<<<<<<<<<<<<<
+ *         ctx.data[63 - j] = <uint8_t>(ctx.bitlen >> (8 * j))
+ *     _sha256_transform(ctx, ctx.data)
 */
-  while (1) {
+  for (__pyx_t_3 = 0; __pyx_t_3 < 8; __pyx_t_3+=1) {
+    __pyx_v_j = __pyx_t_3;
+
+    /* "cython_modules/block_utils.pyx":112
+ *     ctx.bitlen += <uint64_t>ctx.datalen * 8
+ *     for j in range(8):
+ *         ctx.data[63 - j] = <uint8_t>(ctx.bitlen >> (8 * j))             # <<<<<<<<<<<<<<
+ *     _sha256_transform(ctx, ctx.data)
+ * 
+*/
+    (__pyx_v_ctx->data[(63 - __pyx_v_j)]) = ((uint8_t)(__pyx_v_ctx->bitlen >> (8 * __pyx_v_j)));
+  }
 
-    /* "cython_modules/block_utils.pyx":73
+  /* "cython_modules/block_utils.pyx":113
+ *     for j in range(8):
+ *         ctx.data[63 - j] = <uint8_t>(ctx.bitlen >> (8 * j))
+ *     _sha256_transform(ctx, ctx.data)             # <<<<<<<<<<<<<<
  * 
- *     while True:
- *         block_template["nonce"] = nonce             # <<<<<<<<<<<<<<
- *         block_hash = hashlib.sha256(
- *             json.dumps(block_template, sort_keys=True).encode('utf-8')
+ *     for j in range(8):
 */
-    __pyx_t_1 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (unlikely((PyDict_SetItem(__pyx_v_block_template, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_t_1) < 0))) __PYX_ERR(0, 73, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_f_14cython_modules_11block_utils__sha256_transform(__pyx_v_ctx, __pyx_v_ctx->data);
 
-    /* "cython_modules/block_utils.pyx":74
- *     while True:
- *         block_template["nonce"] = nonce
- *         block_hash = hashlib.sha256(             # <<<<<<<<<<<<<<
- *             json.dumps(block_template, sort_keys=True).encode('utf-8')
- *         ).hexdigest()
+  /* "cython_modules/block_utils.pyx":115
+ *     _sha256_transform(ctx, ctx.data)
+ * 
+ *     for j in range(8):             # <<<<<<<<<<<<<<
+ *         digest[j * 4] = <uint8_t>(ctx.state[j] >> 24)
+ *         digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)
 */
-    __pyx_t_4 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 74, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 74, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  for (__pyx_t_3 = 0; __pyx_t_3 < 8; __pyx_t_3+=1) {
+    __pyx_v_j = __pyx_t_3;
 
-    /* "cython_modules/block_utils.pyx":75
- *         block_template["nonce"] = nonce
- *         block_hash = hashlib.sha256(
- *             json.dumps(block_template, sort_keys=True).encode('utf-8')             # <<<<<<<<<<<<<<
- *         ).hexdigest()
+    /* "cython_modules/block_utils.pyx":116
  * 
+ *     for j in range(8):
+ *         digest[j * 4] = <uint8_t>(ctx.state[j] >> 24)             # <<<<<<<<<<<<<<
+ *         digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)
+ *         digest[j * 4 + 2] = <uint8_t>(ctx.state[j] >> 8)
 */
-    __pyx_t_9 = NULL;
-    __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_10);
-    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
-    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-    __pyx_t_12 = 1;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_11))) {
-      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_11);
-      assert(__pyx_t_9);
-      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
-      __Pyx_INCREF(__pyx_t_9);
-      __Pyx_INCREF(__pyx__function);
-      __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
-      __pyx_t_12 = 0;
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_9, __pyx_v_block_template};
-      __pyx_t_10 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 75, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_10);
-      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_10, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 75, __pyx_L1_error)
-      __pyx_t_8 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_11, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_10);
-      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 75, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-    }
-    __pyx_t_7 = __pyx_t_8;
-    __Pyx_INCREF(__pyx_t_7);
-    __pyx_t_12 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_mstate_global->__pyx_kp_u_utf_8};
-      __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 75, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
-    }
-    __pyx_t_12 = 1;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_6))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
-      assert(__pyx_t_4);
-      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
-      __Pyx_INCREF(__pyx_t_4);
-      __Pyx_INCREF(__pyx__function);
-      __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
-      __pyx_t_12 = 0;
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_5};
-      __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-    }
-    __pyx_t_2 = __pyx_t_3;
-    __Pyx_INCREF(__pyx_t_2);
-    __pyx_t_12 = 0;
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
-      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_12, (1-__pyx_t_12) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-    }
+    (__pyx_v_digest[(__pyx_v_j * 4)]) = ((uint8_t)((__pyx_v_ctx->state[__pyx_v_j]) >> 24));
+
+    /* "cython_modules/block_utils.pyx":117
+ *     for j in range(8):
+ *         digest[j * 4] = <uint8_t>(ctx.state[j] >> 24)
+ *         digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)             # <<<<<<<<<<<<<<
+ *         digest[j * 4 + 2] = <uint8_t>(ctx.state[j] >> 8)
+ *         digest[j * 4 + 3] = <uint8_t>(ctx.state[j])
+*/
+    (__pyx_v_digest[((__pyx_v_j * 4) + 1)]) = ((uint8_t)((__pyx_v_ctx->state[__pyx_v_j]) >> 16));
 
-    /* "cython_modules/block_utils.pyx":76
- *         block_hash = hashlib.sha256(
- *             json.dumps(block_template, sort_keys=True).encode('utf-8')
- *         ).hexdigest()             # <<<<<<<<<<<<<<
+    /* "cython_modules/block_utils.pyx":118
+ *         digest[j * 4] = <uint8_t>(ctx.state[j] >> 24)
+ *         digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)
+ *         digest[j * 4 + 2] = <uint8_t>(ctx.state[j] >> 8)             # <<<<<<<<<<<<<<
+ *         digest[j * 4 + 3] = <uint8_t>(ctx.state[j])
  * 
- *         # Check if hash meets difficulty requirement
 */
-    if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 76, __pyx_L1_error)
-    __Pyx_XDECREF_SET(__pyx_v_block_hash, ((PyObject*)__pyx_t_1));
-    __pyx_t_1 = 0;
+    (__pyx_v_digest[((__pyx_v_j * 4) + 2)]) = ((uint8_t)((__pyx_v_ctx->state[__pyx_v_j]) >> 8));
 
-    /* "cython_modules/block_utils.pyx":79
+    /* "cython_modules/block_utils.pyx":119
+ *         digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)
+ *         digest[j * 4 + 2] = <uint8_t>(ctx.state[j] >> 8)
+ *         digest[j * 4 + 3] = <uint8_t>(ctx.state[j])             # <<<<<<<<<<<<<<
+ * 
  * 
- *         # Check if hash meets difficulty requirement
- *         valid = True             # <<<<<<<<<<<<<<
- *         for i in range(difficulty):
- *             if block_hash[i] != '0':
 */
-    __pyx_v_valid = 1;
+    (__pyx_v_digest[((__pyx_v_j * 4) + 3)]) = ((uint8_t)(__pyx_v_ctx->state[__pyx_v_j]));
+  }
 
-    /* "cython_modules/block_utils.pyx":80
- *         # Check if hash meets difficulty requirement
- *         valid = True
- *         for i in range(difficulty):             # <<<<<<<<<<<<<<
- *             if block_hash[i] != '0':
- *                 valid = False
+  /* "cython_modules/block_utils.pyx":92
+ * 
+ * 
+ * cdef void _sha256_final(Sha256Ctx* ctx, uint8_t* digest) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef uint32_t i = ctx.datalen
+ *     cdef int j
 */
-    __pyx_t_13 = __pyx_v_difficulty;
-    __pyx_t_14 = __pyx_t_13;
-    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-      __pyx_v_i = __pyx_t_15;
 
-      /* "cython_modules/block_utils.pyx":81
- *         valid = True
- *         for i in range(difficulty):
- *             if block_hash[i] != '0':             # <<<<<<<<<<<<<<
- *                 valid = False
- *                 break
-*/
-      __pyx_t_16 = __Pyx_GetItemInt_Unicode(__pyx_v_block_hash, __pyx_v_i, int, 1, __Pyx_PyLong_From_int, 0, 0, 0, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(__pyx_t_16 == (Py_UCS4)-1)) __PYX_ERR(0, 81, __pyx_L1_error)
-      __pyx_t_17 = (__pyx_t_16 != 48);
-      if (__pyx_t_17) {
+  /* function exit code */
+}
 
-        /* "cython_modules/block_utils.pyx":82
- *         for i in range(difficulty):
- *             if block_hash[i] != '0':
- *                 valid = False             # <<<<<<<<<<<<<<
- *                 break
+/* "cython_modules/block_utils.pyx":122
  * 
+ * 
+ * cdef inline int _format_nonce(long long nonce, uint8_t* buf) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Write nonce as ASCII decimal (same as json.dumps) into buf, return length."""
+ *     cdef uint8_t tmp[24]
 */
-        __pyx_v_valid = 0;
 
-        /* "cython_modules/block_utils.pyx":83
- *             if block_hash[i] != '0':
- *                 valid = False
- *                 break             # <<<<<<<<<<<<<<
+static CYTHON_INLINE int __pyx_f_14cython_modules_11block_utils__format_nonce(PY_LONG_LONG __pyx_v_nonce, uint8_t *__pyx_v_buf) {
+  uint8_t __pyx_v_tmp[24];
+  int __pyx_v_n;
+  int __pyx_v_k;
+  unsigned PY_LONG_LONG __pyx_v_v;
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "cython_modules/block_utils.pyx":125
+ *     """Write nonce as ASCII decimal (same as json.dumps) into buf, return length."""
+ *     cdef uint8_t tmp[24]
+ *     cdef int n = 0, k = 0             # <<<<<<<<<<<<<<
+ *     cdef unsigned long long v
  * 
- *         if valid:
 */
-        goto __pyx_L6_break;
+  __pyx_v_n = 0;
+  __pyx_v_k = 0;
 
-        /* "cython_modules/block_utils.pyx":81
- *         valid = True
- *         for i in range(difficulty):
- *             if block_hash[i] != '0':             # <<<<<<<<<<<<<<
- *                 valid = False
- *                 break
+  /* "cython_modules/block_utils.pyx":128
+ *     cdef unsigned long long v
+ * 
+ *     if nonce < 0:             # <<<<<<<<<<<<<<
+ *         buf[k] = 45  # '-'
+ *         k += 1
 */
-      }
-    }
-    __pyx_L6_break:;
+  __pyx_t_1 = (__pyx_v_nonce < 0);
+  if (__pyx_t_1) {
 
-    /* "cython_modules/block_utils.pyx":85
- *                 break
- * 
- *         if valid:             # <<<<<<<<<<<<<<
- *             return (block_hash, nonce)
+    /* "cython_modules/block_utils.pyx":129
  * 
+ *     if nonce < 0:
+ *         buf[k] = 45  # '-'             # <<<<<<<<<<<<<<
+ *         k += 1
+ *         v = <unsigned long long>(-(nonce + 1)) + 1
 */
-    if (__pyx_v_valid) {
+    (__pyx_v_buf[__pyx_v_k]) = 45;
 
-      /* "cython_modules/block_utils.pyx":86
+    /* "cython_modules/block_utils.pyx":130
+ *     if nonce < 0:
+ *         buf[k] = 45  # '-'
+ *         k += 1             # <<<<<<<<<<<<<<
+ *         v = <unsigned long long>(-(nonce + 1)) + 1
+ *     else:
+*/
+    __pyx_v_k = (__pyx_v_k + 1);
+
+    /* "cython_modules/block_utils.pyx":131
+ *         buf[k] = 45  # '-'
+ *         k += 1
+ *         v = <unsigned long long>(-(nonce + 1)) + 1             # <<<<<<<<<<<<<<
+ *     else:
+ *         v = <unsigned long long>nonce
+*/
+    __pyx_v_v = (((unsigned PY_LONG_LONG)(-(__pyx_v_nonce + 1))) + 1);
+
+    /* "cython_modules/block_utils.pyx":128
+ *     cdef unsigned long long v
  * 
- *         if valid:
- *             return (block_hash, nonce)             # <<<<<<<<<<<<<<
+ *     if nonce < 0:             # <<<<<<<<<<<<<<
+ *         buf[k] = 45  # '-'
+ *         k += 1
+*/
+    goto __pyx_L3;
+  }
+
+  /* "cython_modules/block_utils.pyx":133
+ *         v = <unsigned long long>(-(nonce + 1)) + 1
+ *     else:
+ *         v = <unsigned long long>nonce             # <<<<<<<<<<<<<<
  * 
- *         nonce += 1
+ *     while True:
 */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_1 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_v_block_hash);
-      __Pyx_GIVEREF(__pyx_v_block_hash);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_block_hash) != (0)) __PYX_ERR(0, 86, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_1);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 86, __pyx_L1_error);
-      __pyx_t_1 = 0;
-      __pyx_r = ((PyObject*)__pyx_t_3);
-      __pyx_t_3 = 0;
-      goto __pyx_L0;
+  /*else*/ {
+    __pyx_v_v = ((unsigned PY_LONG_LONG)__pyx_v_nonce);
+  }
+  __pyx_L3:;
 
-      /* "cython_modules/block_utils.pyx":85
- *                 break
+  /* "cython_modules/block_utils.pyx":135
+ *         v = <unsigned long long>nonce
  * 
- *         if valid:             # <<<<<<<<<<<<<<
- *             return (block_hash, nonce)
+ *     while True:             # <<<<<<<<<<<<<<
+ *         tmp[n] = <uint8_t>(48 + v % 10)
+ *         n += 1
+*/
+  while (1) {
+
+    /* "cython_modules/block_utils.pyx":136
  * 
+ *     while True:
+ *         tmp[n] = <uint8_t>(48 + v % 10)             # <<<<<<<<<<<<<<
+ *         n += 1
+ *         v //= 10
+*/
+    (__pyx_v_tmp[__pyx_v_n]) = ((uint8_t)(48 + (__pyx_v_v % 10)));
+
+    /* "cython_modules/block_utils.pyx":137
+ *     while True:
+ *         tmp[n] = <uint8_t>(48 + v % 10)
+ *         n += 1             # <<<<<<<<<<<<<<
+ *         v //= 10
+ *         if v == 0:
+*/
+    __pyx_v_n = (__pyx_v_n + 1);
+
+    /* "cython_modules/block_utils.pyx":138
+ *         tmp[n] = <uint8_t>(48 + v % 10)
+ *         n += 1
+ *         v //= 10             # <<<<<<<<<<<<<<
+ *         if v == 0:
+ *             break
+*/
+    __pyx_v_v = (__pyx_v_v / 10);
+
+    /* "cython_modules/block_utils.pyx":139
+ *         n += 1
+ *         v //= 10
+ *         if v == 0:             # <<<<<<<<<<<<<<
+ *             break
+ *     while n > 0:
+*/
+    __pyx_t_1 = (__pyx_v_v == 0);
+    if (__pyx_t_1) {
+
+      /* "cython_modules/block_utils.pyx":140
+ *         v //= 10
+ *         if v == 0:
+ *             break             # <<<<<<<<<<<<<<
+ *     while n > 0:
+ *         n -= 1
+*/
+      goto __pyx_L5_break;
+
+      /* "cython_modules/block_utils.pyx":139
+ *         n += 1
+ *         v //= 10
+ *         if v == 0:             # <<<<<<<<<<<<<<
+ *             break
+ *     while n > 0:
 */
     }
+  }
+  __pyx_L5_break:;
+
+  /* "cython_modules/block_utils.pyx":141
+ *         if v == 0:
+ *             break
+ *     while n > 0:             # <<<<<<<<<<<<<<
+ *         n -= 1
+ *         buf[k] = tmp[n]
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_n > 0);
+    if (!__pyx_t_1) break;
+
+    /* "cython_modules/block_utils.pyx":142
+ *             break
+ *     while n > 0:
+ *         n -= 1             # <<<<<<<<<<<<<<
+ *         buf[k] = tmp[n]
+ *         k += 1
+*/
+    __pyx_v_n = (__pyx_v_n - 1);
+
+    /* "cython_modules/block_utils.pyx":143
+ *     while n > 0:
+ *         n -= 1
+ *         buf[k] = tmp[n]             # <<<<<<<<<<<<<<
+ *         k += 1
+ *     return k
+*/
+    (__pyx_v_buf[__pyx_v_k]) = (__pyx_v_tmp[__pyx_v_n]);
 
-    /* "cython_modules/block_utils.pyx":88
- *             return (block_hash, nonce)
+    /* "cython_modules/block_utils.pyx":144
+ *         n -= 1
+ *         buf[k] = tmp[n]
+ *         k += 1             # <<<<<<<<<<<<<<
+ *     return k
  * 
- *         nonce += 1             # <<<<<<<<<<<<<<
+*/
+    __pyx_v_k = (__pyx_v_k + 1);
+  }
+
+  /* "cython_modules/block_utils.pyx":145
+ *         buf[k] = tmp[n]
+ *         k += 1
+ *     return k             # <<<<<<<<<<<<<<
  * 
  * 
 */
-    __pyx_v_nonce = (__pyx_v_nonce + 1);
-  }
+  __pyx_r = __pyx_v_k;
+  goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":40
+  /* "cython_modules/block_utils.pyx":122
  * 
  * 
- * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                             str previous_hash, int difficulty, long start_nonce=0):
- *     """
+ * cdef inline int _format_nonce(long long nonce, uint8_t* buf) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Write nonce as ASCII decimal (same as json.dumps) into buf, return length."""
+ *     cdef uint8_t tmp[24]
 */
 
   /* function exit code */
-  __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_block_hash);
-  __Pyx_XDECREF(__pyx_v_target);
-  __Pyx_XDECREF(__pyx_v_block_template);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_14cython_modules_11block_utils_3mine_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_2mine_block_hash, "mine_block_hash(int index, double timestamp, data, str previous_hash, int difficulty, long start_nonce=0) -> tuple\n\nMine a block by finding a valid nonce.\nThis is the most CPU-intensive operation in the blockchain.\n\nArgs:\n    index: Block index\n    timestamp: Block timestamp\n    data: Block data (transactions)\n    previous_hash: Hash of previous block\n    difficulty: Number of leading zeros required\n    start_nonce: Starting nonce value\n    \nReturns:\n    Tuple of (hash, nonce) when valid proof found");
-static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_3mine_block_hash = {"mine_block_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_3mine_block_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_2mine_block_hash};
-static PyObject *__pyx_pw_14cython_modules_11block_utils_3mine_block_hash(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  int __pyx_v_index;
-  double __pyx_v_timestamp;
-  PyObject *__pyx_v_data = 0;
-  PyObject *__pyx_v_previous_hash = 0;
-  int __pyx_v_difficulty;
-  long __pyx_v_start_nonce;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[6] = {0,0,0,0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("mine_block_hash (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_SIZE
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,&__pyx_mstate_global->__pyx_n_u_difficulty,&__pyx_mstate_global->__pyx_n_u_start_nonce,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 40, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  6:
-        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  5:
-        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  4:
-        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "mine_block_hash", 0) < (0)) __PYX_ERR(0, 40, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("mine_block_hash", 0, 5, 6, i); __PYX_ERR(0, 40, __pyx_L3_error) }
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  6:
-        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 40, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  5:
-        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 40, __pyx_L3_error)
-        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 40, __pyx_L3_error)
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 40, __pyx_L3_error)
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 40, __pyx_L3_error)
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 40, __pyx_L3_error)
-        break;
-        default: goto __pyx_L5_argtuple_error;
+/* "cython_modules/block_utils.pyx":148
+ * 
+ * 
+ * cdef inline bint _meets_difficulty(const uint8_t* digest, int difficulty) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Check the hex digest would start with `difficulty` zero characters."""
+ *     cdef int i
+*/
+
+static CYTHON_INLINE int __pyx_f_14cython_modules_11block_utils__meets_difficulty(uint8_t const *__pyx_v_digest, int __pyx_v_difficulty) {
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "cython_modules/block_utils.pyx":151
+ *     """Check the hex digest would start with `difficulty` zero characters."""
+ *     cdef int i
+ *     for i in range(difficulty):             # <<<<<<<<<<<<<<
+ *         if i & 1:
+ *             if digest[i >> 1] & 0x0F:
+*/
+  __pyx_t_1 = __pyx_v_difficulty;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "cython_modules/block_utils.pyx":152
+ *     cdef int i
+ *     for i in range(difficulty):
+ *         if i & 1:             # <<<<<<<<<<<<<<
+ *             if digest[i >> 1] & 0x0F:
+ *                 return False
+*/
+    __pyx_t_4 = ((__pyx_v_i & 1) != 0);
+    if (__pyx_t_4) {
+
+      /* "cython_modules/block_utils.pyx":153
+ *     for i in range(difficulty):
+ *         if i & 1:
+ *             if digest[i >> 1] & 0x0F:             # <<<<<<<<<<<<<<
+ *                 return False
+ *         elif digest[i >> 1] & 0xF0:
+*/
+      __pyx_t_4 = (((__pyx_v_digest[(__pyx_v_i >> 1)]) & 0x0F) != 0);
+      if (__pyx_t_4) {
+
+        /* "cython_modules/block_utils.pyx":154
+ *         if i & 1:
+ *             if digest[i >> 1] & 0x0F:
+ *                 return False             # <<<<<<<<<<<<<<
+ *         elif digest[i >> 1] & 0xF0:
+ *             return False
+*/
+        __pyx_r = 0;
+        goto __pyx_L0;
+
+        /* "cython_modules/block_utils.pyx":153
+ *     for i in range(difficulty):
+ *         if i & 1:
+ *             if digest[i >> 1] & 0x0F:             # <<<<<<<<<<<<<<
+ *                 return False
+ *         elif digest[i >> 1] & 0xF0:
+*/
       }
+
+      /* "cython_modules/block_utils.pyx":152
+ *     cdef int i
+ *     for i in range(difficulty):
+ *         if i & 1:             # <<<<<<<<<<<<<<
+ *             if digest[i >> 1] & 0x0F:
+ *                 return False
+*/
+      goto __pyx_L5;
     }
-    __pyx_v_index = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 40, __pyx_L3_error)
-    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 40, __pyx_L3_error)
-    __pyx_v_data = values[2];
-    __pyx_v_previous_hash = ((PyObject*)values[3]);
-    __pyx_v_difficulty = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_difficulty == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L3_error)
-    if (values[5]) {
-      __pyx_v_start_nonce = __Pyx_PyLong_As_long(values[5]); if (unlikely((__pyx_v_start_nonce == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 41, __pyx_L3_error)
-    } else {
-      __pyx_v_start_nonce = ((long)0);
+
+    /* "cython_modules/block_utils.pyx":155
+ *             if digest[i >> 1] & 0x0F:
+ *                 return False
+ *         elif digest[i >> 1] & 0xF0:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+*/
+    __pyx_t_4 = (((__pyx_v_digest[(__pyx_v_i >> 1)]) & 0xF0) != 0);
+    if (__pyx_t_4) {
+
+      /* "cython_modules/block_utils.pyx":156
+ *                 return False
+ *         elif digest[i >> 1] & 0xF0:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
+ * 
+*/
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "cython_modules/block_utils.pyx":155
+ *             if digest[i >> 1] & 0x0F:
+ *                 return False
+ *         elif digest[i >> 1] & 0xF0:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+*/
     }
+    __pyx_L5:;
   }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("mine_block_hash", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 40, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 41, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14cython_modules_11block_utils_2mine_block_hash(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, __pyx_v_start_nonce);
 
-  /* function exit code */
+  /* "cython_modules/block_utils.pyx":157
+ *         elif digest[i >> 1] & 0xF0:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = 1;
   goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
 
-static PyObject *__pyx_pf_14cython_modules_11block_utils_2mine_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, long __pyx_v_start_nonce) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("mine_block_hash", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.start_nonce = __pyx_v_start_nonce;
-  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_mine_block_hash(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  /* "cython_modules/block_utils.pyx":148
+ * 
+ * 
+ * cdef inline bint _meets_difficulty(const uint8_t* digest, int difficulty) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Check the hex digest would start with `difficulty` zero characters."""
+ *     cdef int i
+*/
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "cython_modules/block_utils.pyx":91
+/* "cython_modules/block_utils.pyx":160
  * 
  * 
- * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ * cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,             # <<<<<<<<<<<<<<
+ *                        long long max_attempts=0):
  *     """
- *     Calculate transaction hash efficiently.
 */
 
-static PyObject *__pyx_pw_14cython_modules_11block_utils_5fast_transaction_hash(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_1find_nonce(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash(PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_tx_string = 0;
+static PyObject *__pyx_f_14cython_modules_11block_utils_find_nonce(PyObject *__pyx_v_prefix, PyObject *__pyx_v_suffix, int __pyx_v_difficulty, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce *__pyx_optional_args) {
+  PY_LONG_LONG __pyx_v_start_nonce = ((PY_LONG_LONG)0);
+  PY_LONG_LONG __pyx_v_max_attempts = ((PY_LONG_LONG)0);
+  struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx __pyx_v_base;
+  struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx __pyx_v_ctx;
+  uint8_t __pyx_v_digest[32];
+  uint8_t __pyx_v_nonce_buf[24];
+  int __pyx_v_nonce_len;
+  PY_LONG_LONG __pyx_v_nonce;
+  uint8_t const *__pyx_v_prefix_ptr;
+  uint8_t const *__pyx_v_suffix_ptr;
+  size_t __pyx_v_prefix_len;
+  size_t __pyx_v_suffix_len;
+  PY_LONG_LONG __pyx_v_end_nonce;
+  int __pyx_v_found;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  size_t __pyx_t_6;
+  uint8_t const *__pyx_t_1;
+  uint8_t const *__pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
+  size_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fast_transaction_hash", 0);
+  __Pyx_RefNannySetupContext("find_nonce", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_start_nonce = __pyx_optional_args->start_nonce;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_max_attempts = __pyx_optional_args->max_attempts;
+      }
+    }
+  }
 
-  /* "cython_modules/block_utils.pyx":104
- *         Hexadecimal hash string
- *     """
- *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "sender": sender,
- *         "receiver": receiver,
+  /* "cython_modules/block_utils.pyx":185
+ *     cdef uint8_t nonce_buf[24]
+ *     cdef int nonce_len
+ *     cdef long long nonce = start_nonce             # <<<<<<<<<<<<<<
+ *     cdef const uint8_t* prefix_ptr = <const uint8_t*>prefix
+ *     cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix
 */
-  __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 104, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_nonce = __pyx_v_start_nonce;
 
-  /* "cython_modules/block_utils.pyx":105
- *     """
- *     cdef str tx_string = json.dumps({
- *         "sender": sender,             # <<<<<<<<<<<<<<
- *         "receiver": receiver,
- *         "amount": amount,
+  /* "cython_modules/block_utils.pyx":186
+ *     cdef int nonce_len
+ *     cdef long long nonce = start_nonce
+ *     cdef const uint8_t* prefix_ptr = <const uint8_t*>prefix             # <<<<<<<<<<<<<<
+ *     cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix
+ *     cdef size_t prefix_len = len(prefix)
 */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_sender, __pyx_v_sender) < (0)) __PYX_ERR(0, 105, __pyx_L1_error)
+  if (unlikely(__pyx_v_prefix == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 186, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyBytes_AsUString(__pyx_v_prefix); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_v_prefix_ptr = ((uint8_t const *)__pyx_t_1);
+
+  /* "cython_modules/block_utils.pyx":187
+ *     cdef long long nonce = start_nonce
+ *     cdef const uint8_t* prefix_ptr = <const uint8_t*>prefix
+ *     cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix             # <<<<<<<<<<<<<<
+ *     cdef size_t prefix_len = len(prefix)
+ *     cdef size_t suffix_len = len(suffix)
+*/
+  if (unlikely(__pyx_v_suffix == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+    __PYX_ERR(0, 187, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyBytes_AsUString(__pyx_v_suffix); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_v_suffix_ptr = ((uint8_t const *)__pyx_t_2);
+
+  /* "cython_modules/block_utils.pyx":188
+ *     cdef const uint8_t* prefix_ptr = <const uint8_t*>prefix
+ *     cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix
+ *     cdef size_t prefix_len = len(prefix)             # <<<<<<<<<<<<<<
+ *     cdef size_t suffix_len = len(suffix)
+ *     cdef long long end_nonce = start_nonce + max_attempts
+*/
+  if (unlikely(__pyx_v_prefix == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 188, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyBytes_GET_SIZE(__pyx_v_prefix); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_v_prefix_len = __pyx_t_3;
+
+  /* "cython_modules/block_utils.pyx":189
+ *     cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix
+ *     cdef size_t prefix_len = len(prefix)
+ *     cdef size_t suffix_len = len(suffix)             # <<<<<<<<<<<<<<
+ *     cdef long long end_nonce = start_nonce + max_attempts
+ *     cdef bint found = False
+*/
+  if (unlikely(__pyx_v_suffix == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 189, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyBytes_GET_SIZE(__pyx_v_suffix); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 189, __pyx_L1_error)
+  __pyx_v_suffix_len = __pyx_t_3;
+
+  /* "cython_modules/block_utils.pyx":190
+ *     cdef size_t prefix_len = len(prefix)
+ *     cdef size_t suffix_len = len(suffix)
+ *     cdef long long end_nonce = start_nonce + max_attempts             # <<<<<<<<<<<<<<
+ *     cdef bint found = False
+ * 
+*/
+  __pyx_v_end_nonce = (__pyx_v_start_nonce + __pyx_v_max_attempts);
 
-  /* "cython_modules/block_utils.pyx":106
- *     cdef str tx_string = json.dumps({
- *         "sender": sender,
- *         "receiver": receiver,             # <<<<<<<<<<<<<<
- *         "amount": amount,
- *         "timestamp": timestamp
+  /* "cython_modules/block_utils.pyx":191
+ *     cdef size_t suffix_len = len(suffix)
+ *     cdef long long end_nonce = start_nonce + max_attempts
+ *     cdef bint found = False             # <<<<<<<<<<<<<<
+ * 
+ *     if difficulty < 0 or difficulty > 64:
 */
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_receiver, __pyx_v_receiver) < (0)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_v_found = 0;
 
-  /* "cython_modules/block_utils.pyx":107
- *         "sender": sender,
- *         "receiver": receiver,
- *         "amount": amount,             # <<<<<<<<<<<<<<
- *         "timestamp": timestamp
- *     }, sort_keys=True)
+  /* "cython_modules/block_utils.pyx":193
+ *     cdef bint found = False
+ * 
+ *     if difficulty < 0 or difficulty > 64:             # <<<<<<<<<<<<<<
+ *         raise ValueError("difficulty must be between 0 and 64")
+ * 
 */
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 107, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_amount, __pyx_t_5) < (0)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = (__pyx_v_difficulty < 0);
+  if (!__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_difficulty > 64);
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_4)) {
 
-  /* "cython_modules/block_utils.pyx":108
- *         "receiver": receiver,
- *         "amount": amount,
- *         "timestamp": timestamp             # <<<<<<<<<<<<<<
- *     }, sort_keys=True)
+    /* "cython_modules/block_utils.pyx":194
+ * 
+ *     if difficulty < 0 or difficulty > 64:
+ *         raise ValueError("difficulty must be between 0 and 64")             # <<<<<<<<<<<<<<
  * 
+ *     with nogil:
 */
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 108, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_7 = NULL;
+    __pyx_t_8 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_mstate_global->__pyx_kp_u_difficulty_must_be_between_0_and};
+      __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 194, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    __Pyx_Raise(__pyx_t_6, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __PYX_ERR(0, 194, __pyx_L1_error)
 
-  /* "cython_modules/block_utils.pyx":109
- *         "amount": amount,
- *         "timestamp": timestamp
- *     }, sort_keys=True)             # <<<<<<<<<<<<<<
+    /* "cython_modules/block_utils.pyx":193
+ *     cdef bint found = False
+ * 
+ *     if difficulty < 0 or difficulty > 64:             # <<<<<<<<<<<<<<
+ *         raise ValueError("difficulty must be between 0 and 64")
  * 
- *     return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()
 */
-  __pyx_t_6 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
-    assert(__pyx_t_2);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
-    __Pyx_INCREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
-    __pyx_t_6 = 0;
   }
-  #endif
+
+  /* "cython_modules/block_utils.pyx":196
+ *         raise ValueError("difficulty must be between 0 and 64")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _sha256_init(&base)
+ *         _sha256_update(&base, prefix_ptr, prefix_len)
+*/
   {
-    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
-    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 104, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 104, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-  }
+      PyThreadState * _save;
+      _save = PyEval_SaveThread();
+      __Pyx_FastGIL_Remember();
+      /*try:*/ {
 
-  /* "cython_modules/block_utils.pyx":104
- *         Hexadecimal hash string
- *     """
- *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "sender": sender,
- *         "receiver": receiver,
+        /* "cython_modules/block_utils.pyx":197
+ * 
+ *     with nogil:
+ *         _sha256_init(&base)             # <<<<<<<<<<<<<<
+ *         _sha256_update(&base, prefix_ptr, prefix_len)
+ * 
 */
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 104, __pyx_L1_error)
-  __pyx_v_tx_string = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+        __pyx_f_14cython_modules_11block_utils__sha256_init((&__pyx_v_base));
 
-  /* "cython_modules/block_utils.pyx":111
- *     }, sort_keys=True)
+        /* "cython_modules/block_utils.pyx":198
+ *     with nogil:
+ *         _sha256_init(&base)
+ *         _sha256_update(&base, prefix_ptr, prefix_len)             # <<<<<<<<<<<<<<
  * 
- *     return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()             # <<<<<<<<<<<<<<
+ *         while max_attempts <= 0 or nonce < end_nonce:
+*/
+        __pyx_f_14cython_modules_11block_utils__sha256_update((&__pyx_v_base), __pyx_v_prefix_ptr, __pyx_v_prefix_len);
+
+        /* "cython_modules/block_utils.pyx":200
+ *         _sha256_update(&base, prefix_ptr, prefix_len)
  * 
+ *         while max_attempts <= 0 or nonce < end_nonce:             # <<<<<<<<<<<<<<
+ *             nonce_len = _format_nonce(nonce, nonce_buf)
+ *             memcpy(&ctx, &base, sizeof(Sha256Ctx))
+*/
+        while (1) {
+          __pyx_t_5 = (__pyx_v_max_attempts <= 0);
+          if (!__pyx_t_5) {
+          } else {
+            __pyx_t_4 = __pyx_t_5;
+            goto __pyx_L11_bool_binop_done;
+          }
+          __pyx_t_5 = (__pyx_v_nonce < __pyx_v_end_nonce);
+          __pyx_t_4 = __pyx_t_5;
+          __pyx_L11_bool_binop_done:;
+          if (!__pyx_t_4) break;
+
+          /* "cython_modules/block_utils.pyx":201
  * 
+ *         while max_attempts <= 0 or nonce < end_nonce:
+ *             nonce_len = _format_nonce(nonce, nonce_buf)             # <<<<<<<<<<<<<<
+ *             memcpy(&ctx, &base, sizeof(Sha256Ctx))
+ *             _sha256_update(&ctx, nonce_buf, nonce_len)
 */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 111, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_v_tx_string == Py_None)) {
-    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(0, 111, __pyx_L1_error)
+          __pyx_v_nonce_len = __pyx_f_14cython_modules_11block_utils__format_nonce(__pyx_v_nonce, __pyx_v_nonce_buf);
+
+          /* "cython_modules/block_utils.pyx":202
+ *         while max_attempts <= 0 or nonce < end_nonce:
+ *             nonce_len = _format_nonce(nonce, nonce_buf)
+ *             memcpy(&ctx, &base, sizeof(Sha256Ctx))             # <<<<<<<<<<<<<<
+ *             _sha256_update(&ctx, nonce_buf, nonce_len)
+ *             _sha256_update(&ctx, suffix_ptr, suffix_len)
+*/
+          (void)(memcpy((&__pyx_v_ctx), (&__pyx_v_base), (sizeof(struct __pyx_t_14cython_modules_11block_utils_Sha256Ctx))));
+
+          /* "cython_modules/block_utils.pyx":203
+ *             nonce_len = _format_nonce(nonce, nonce_buf)
+ *             memcpy(&ctx, &base, sizeof(Sha256Ctx))
+ *             _sha256_update(&ctx, nonce_buf, nonce_len)             # <<<<<<<<<<<<<<
+ *             _sha256_update(&ctx, suffix_ptr, suffix_len)
+ *             _sha256_final(&ctx, digest)
+*/
+          __pyx_f_14cython_modules_11block_utils__sha256_update((&__pyx_v_ctx), __pyx_v_nonce_buf, __pyx_v_nonce_len);
+
+          /* "cython_modules/block_utils.pyx":204
+ *             memcpy(&ctx, &base, sizeof(Sha256Ctx))
+ *             _sha256_update(&ctx, nonce_buf, nonce_len)
+ *             _sha256_update(&ctx, suffix_ptr, suffix_len)             # <<<<<<<<<<<<<<
+ *             _sha256_final(&ctx, digest)
+ * 
+*/
+          __pyx_f_14cython_modules_11block_utils__sha256_update((&__pyx_v_ctx), __pyx_v_suffix_ptr, __pyx_v_suffix_len);
+
+          /* "cython_modules/block_utils.pyx":205
+ *             _sha256_update(&ctx, nonce_buf, nonce_len)
+ *             _sha256_update(&ctx, suffix_ptr, suffix_len)
+ *             _sha256_final(&ctx, digest)             # <<<<<<<<<<<<<<
+ * 
+ *             if _meets_difficulty(digest, difficulty):
+*/
+          __pyx_f_14cython_modules_11block_utils__sha256_final((&__pyx_v_ctx), __pyx_v_digest);
+
+          /* "cython_modules/block_utils.pyx":207
+ *             _sha256_final(&ctx, digest)
+ * 
+ *             if _meets_difficulty(digest, difficulty):             # <<<<<<<<<<<<<<
+ *                 found = True
+ *                 break
+*/
+          __pyx_t_4 = __pyx_f_14cython_modules_11block_utils__meets_difficulty(__pyx_v_digest, __pyx_v_difficulty);
+          if (__pyx_t_4) {
+
+            /* "cython_modules/block_utils.pyx":208
+ * 
+ *             if _meets_difficulty(digest, difficulty):
+ *                 found = True             # <<<<<<<<<<<<<<
+ *                 break
+ *             nonce += 1
+*/
+            __pyx_v_found = 1;
+
+            /* "cython_modules/block_utils.pyx":209
+ *             if _meets_difficulty(digest, difficulty):
+ *                 found = True
+ *                 break             # <<<<<<<<<<<<<<
+ *             nonce += 1
+ * 
+*/
+            goto __pyx_L10_break;
+
+            /* "cython_modules/block_utils.pyx":207
+ *             _sha256_final(&ctx, digest)
+ * 
+ *             if _meets_difficulty(digest, difficulty):             # <<<<<<<<<<<<<<
+ *                 found = True
+ *                 break
+*/
+          }
+
+          /* "cython_modules/block_utils.pyx":210
+ *                 found = True
+ *                 break
+ *             nonce += 1             # <<<<<<<<<<<<<<
+ * 
+ *     if not found:
+*/
+          __pyx_v_nonce = (__pyx_v_nonce + 1);
+        }
+        __pyx_L10_break:;
+      }
+
+      /* "cython_modules/block_utils.pyx":196
+ *         raise ValueError("difficulty must be between 0 and 64")
+ * 
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _sha256_init(&base)
+ *         _sha256_update(&base, prefix_ptr, prefix_len)
+*/
+      /*finally:*/ {
+        /*normal exit:*/{
+          __Pyx_FastGIL_Forget();
+          PyEval_RestoreThread(_save);
+          goto __pyx_L8;
+        }
+        __pyx_L8:;
+      }
   }
-  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_tx_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_7))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
-    assert(__pyx_t_3);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
-    __Pyx_INCREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+
+  /* "cython_modules/block_utils.pyx":212
+ *             nonce += 1
+ * 
+ *     if not found:             # <<<<<<<<<<<<<<
+ *         return (None, nonce)
+ *     return ((<bytes>digest[:32]).hex(), nonce)
+*/
+  __pyx_t_4 = (!__pyx_v_found);
+  if (__pyx_t_4) {
+
+    /* "cython_modules/block_utils.pyx":213
+ * 
+ *     if not found:
+ *         return (None, nonce)             # <<<<<<<<<<<<<<
+ *     return ((<bytes>digest[:32]).hex(), nonce)
+ * 
+*/
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_6 = __Pyx_PyLong_From_PY_LONG_LONG(__pyx_v_nonce); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = PyTuple_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, Py_None) != (0)) __PYX_ERR(0, 213, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_6);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_6) != (0)) __PYX_ERR(0, 213, __pyx_L1_error);
     __pyx_t_6 = 0;
+    __pyx_r = ((PyObject*)__pyx_t_7);
+    __pyx_t_7 = 0;
+    goto __pyx_L0;
+
+    /* "cython_modules/block_utils.pyx":212
+ *             nonce += 1
+ * 
+ *     if not found:             # <<<<<<<<<<<<<<
+ *         return (None, nonce)
+ *     return ((<bytes>digest[:32]).hex(), nonce)
+*/
   }
-  #endif
+
+  /* "cython_modules/block_utils.pyx":214
+ *     if not found:
+ *         return (None, nonce)
+ *     return ((<bytes>digest[:32]).hex(), nonce)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_9 = __Pyx_PyBytes_FromStringAndSize(((char const *)__pyx_v_digest) + 0, 32 - 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_6 = __pyx_t_9;
+  __Pyx_INCREF(__pyx_t_6);
+  __pyx_t_8 = 0;
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
-    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
+    PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
+    __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hex, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 214, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
   }
-  __pyx_t_4 = __pyx_t_5;
-  __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_9 = __Pyx_PyLong_From_PY_LONG_LONG(__pyx_v_nonce); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 214, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7) != (0)) __PYX_ERR(0, 214, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_9);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_9) != (0)) __PYX_ERR(0, 214, __pyx_L1_error);
+  __pyx_t_7 = 0;
+  __pyx_t_9 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_6);
   __pyx_t_6 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 111, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-  }
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 111, __pyx_L1_error)
-  __pyx_r = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":91
+  /* "cython_modules/block_utils.pyx":160
  * 
  * 
- * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ * cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,             # <<<<<<<<<<<<<<
+ *                        long long max_attempts=0):
  *     """
- *     Calculate transaction hash efficiently.
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("cython_modules.block_utils.find_nonce", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_tx_string);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_14cython_modules_11block_utils_5fast_transaction_hash(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_1find_nonce(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_4fast_transaction_hash, "fast_transaction_hash(str sender, str receiver, double amount, double timestamp) -> str\n\nCalculate transaction hash efficiently.\n\nArgs:\n    sender: Sender address\n    receiver: Receiver address\n    amount: Transaction amount\n    timestamp: Transaction timestamp\n    \nReturns:\n    Hexadecimal hash string");
-static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_5fast_transaction_hash = {"fast_transaction_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_5fast_transaction_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_4fast_transaction_hash};
-static PyObject *__pyx_pw_14cython_modules_11block_utils_5fast_transaction_hash(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_find_nonce, "find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0, long long max_attempts=0) -> tuple\n\nSearch for a nonce such that SHA256(prefix + str(nonce) + suffix) has\n`difficulty` leading hex zeros. The search loop runs without the GIL,\nso other Python threads (sync, HTTP server) keep running while mining.\n\nThe SHA-256 state after `prefix` is computed once and reused for every\nnonce, so each attempt only hashes the tail of the block header.\n\nArgs:\n    prefix: Serialized block header bytes before the nonce\n    suffix: Serialized block header bytes after the nonce\n    difficulty: Number of leading hex zeros required (max 64)\n    start_nonce: Starting nonce value\n    max_attempts: Give up after this many nonces (0 = search until found)\n    \nReturns:\n    Tuple of (hash, nonce) when valid proof found, or\n    (None, next_nonce) when max_attempts ran out");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_1find_nonce = {"find_nonce", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_1find_nonce, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_find_nonce};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_1find_nonce(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_sender = 0;
-  PyObject *__pyx_v_receiver = 0;
-  double __pyx_v_amount;
-  double __pyx_v_timestamp;
+  PyObject *__pyx_v_prefix = 0;
+  PyObject *__pyx_v_suffix = 0;
+  int __pyx_v_difficulty;
+  PY_LONG_LONG __pyx_v_start_nonce;
+  PY_LONG_LONG __pyx_v_max_attempts;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[4] = {0,0,0,0};
+  PyObject* values[5] = {0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("fast_transaction_hash (wrapper)", 0);
+  __Pyx_RefNannySetupContext("find_nonce (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4297,68 +4742,90 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_sender,&__pyx_mstate_global->__pyx_n_u_receiver,&__pyx_mstate_global->__pyx_n_u_amount,&__pyx_mstate_global->__pyx_n_u_timestamp,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_prefix,&__pyx_mstate_global->__pyx_n_u_suffix,&__pyx_mstate_global->__pyx_n_u_difficulty,&__pyx_mstate_global->__pyx_n_u_start_nonce,&__pyx_mstate_global->__pyx_n_u_max_attempts,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 91, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 160, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 160, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 160, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 160, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 160, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 91, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 160, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fast_transaction_hash", 0) < (0)) __PYX_ERR(0, 91, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 4; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fast_transaction_hash", 1, 4, 4, i); __PYX_ERR(0, 91, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "find_nonce", 0) < (0)) __PYX_ERR(0, 160, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("find_nonce", 0, 3, 5, i); __PYX_ERR(0, 160, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 4)) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 91, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 91, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 91, __pyx_L3_error)
-      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 91, __pyx_L3_error)
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 160, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 160, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 160, __pyx_L3_error)
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 160, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 160, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_prefix = ((PyObject*)values[0]);
+    __pyx_v_suffix = ((PyObject*)values[1]);
+    __pyx_v_difficulty = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_difficulty == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 160, __pyx_L3_error)
+    if (values[3]) {
+      __pyx_v_start_nonce = __Pyx_PyLong_As_PY_LONG_LONG(values[3]); if (unlikely((__pyx_v_start_nonce == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 160, __pyx_L3_error)
+    } else {
+      __pyx_v_start_nonce = ((PY_LONG_LONG)0);
+    }
+    if (values[4]) {
+      __pyx_v_max_attempts = __Pyx_PyLong_As_PY_LONG_LONG(values[4]); if (unlikely((__pyx_v_max_attempts == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 161, __pyx_L3_error)
+    } else {
+      __pyx_v_max_attempts = ((PY_LONG_LONG)0);
     }
-    __pyx_v_sender = ((PyObject*)values[0]);
-    __pyx_v_receiver = ((PyObject*)values[1]);
-    __pyx_v_amount = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
-    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fast_transaction_hash", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 91, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("find_nonce", 0, 3, 5, __pyx_nargs); __PYX_ERR(0, 160, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.find_nonce", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sender), (&PyUnicode_Type), 1, "sender", 1))) __PYX_ERR(0, 91, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_receiver), (&PyUnicode_Type), 1, "receiver", 1))) __PYX_ERR(0, 91, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14cython_modules_11block_utils_4fast_transaction_hash(__pyx_self, __pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_prefix), (&PyBytes_Type), 1, "prefix", 1))) __PYX_ERR(0, 160, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_suffix), (&PyBytes_Type), 1, "suffix", 1))) __PYX_ERR(0, 160, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_find_nonce(__pyx_self, __pyx_v_prefix, __pyx_v_suffix, __pyx_v_difficulty, __pyx_v_start_nonce, __pyx_v_max_attempts);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4377,16 +4844,20 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_14cython_modules_11block_utils_4fast_transaction_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp) {
+static PyObject *__pyx_pf_14cython_modules_11block_utils_find_nonce(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_prefix, PyObject *__pyx_v_suffix, int __pyx_v_difficulty, PY_LONG_LONG __pyx_v_start_nonce, PY_LONG_LONG __pyx_v_max_attempts) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fast_transaction_hash", 0);
+  __Pyx_RefNannySetupContext("find_nonce", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_fast_transaction_hash(__pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __pyx_t_2.__pyx_n = 2;
+  __pyx_t_2.start_nonce = __pyx_v_start_nonce;
+  __pyx_t_2.max_attempts = __pyx_v_max_attempts;
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_find_nonce(__pyx_v_prefix, __pyx_v_suffix, __pyx_v_difficulty, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4395,7 +4866,7 @@ static PyObject *__pyx_pf_14cython_modules_11block_utils_4fast_transaction_hash(
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.find_nonce", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4403,23 +4874,25 @@ static PyObject *__pyx_pf_14cython_modules_11block_utils_4fast_transaction_hash(
   return __pyx_r;
 }
 
-/* "cython_modules/block_utils.pyx":114
+/* "cython_modules/block_utils.pyx":217
  * 
  * 
- * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ * cpdef tuple split_block_header(object index, double timestamp, object data, str previous_hash):             # <<<<<<<<<<<<<<
  *     """
- *     Calculate transaction hash as bytes for signing.
+ *     Serialize a block header exactly as calculate_block_hash does and split
 */
 
-static PyObject *__pyx_pw_14cython_modules_11block_utils_7fast_transaction_hash_bytes(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_3split_block_header(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash_bytes(PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp, CYTHON_UNUSED int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_tx_string = 0;
+static PyObject *__pyx_f_14cython_modules_11block_utils_split_block_header(PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_header = 0;
+  PyObject *__pyx_v_marker = 0;
+  Py_ssize_t __pyx_v_pos;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4428,76 +4901,74 @@ static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash_by
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   size_t __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  Py_ssize_t __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes", 0);
+  __Pyx_RefNannySetupContext("split_block_header", 0);
 
-  /* "cython_modules/block_utils.pyx":127
- *         Raw hash bytes (32 bytes)
+  /* "cython_modules/block_utils.pyx":225
+ *         Tuple of (prefix_bytes, suffix_bytes)
  *     """
- *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "sender": sender,
- *         "receiver": receiver,
+ *     cdef str header = json.dumps({             # <<<<<<<<<<<<<<
+ *         "index": index,
+ *         "timestamp": timestamp,
 */
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 225, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "cython_modules/block_utils.pyx":128
+  /* "cython_modules/block_utils.pyx":226
  *     """
- *     cdef str tx_string = json.dumps({
- *         "sender": sender,             # <<<<<<<<<<<<<<
- *         "receiver": receiver,
- *         "amount": amount,
+ *     cdef str header = json.dumps({
+ *         "index": index,             # <<<<<<<<<<<<<<
+ *         "timestamp": timestamp,
+ *         "data": data,
 */
-  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_sender, __pyx_v_sender) < (0)) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_index, __pyx_v_index) < (0)) __PYX_ERR(0, 226, __pyx_L1_error)
 
-  /* "cython_modules/block_utils.pyx":129
- *     cdef str tx_string = json.dumps({
- *         "sender": sender,
- *         "receiver": receiver,             # <<<<<<<<<<<<<<
- *         "amount": amount,
- *         "timestamp": timestamp
-*/
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_receiver, __pyx_v_receiver) < (0)) __PYX_ERR(0, 128, __pyx_L1_error)
-
-  /* "cython_modules/block_utils.pyx":130
- *         "sender": sender,
- *         "receiver": receiver,
- *         "amount": amount,             # <<<<<<<<<<<<<<
- *         "timestamp": timestamp
- *     }, sort_keys=True)
+  /* "cython_modules/block_utils.pyx":227
+ *     cdef str header = json.dumps({
+ *         "index": index,
+ *         "timestamp": timestamp,             # <<<<<<<<<<<<<<
+ *         "data": data,
+ *         "previous_hash": previous_hash,
 */
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 227, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_amount, __pyx_t_5) < (0)) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 226, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "cython_modules/block_utils.pyx":131
- *         "receiver": receiver,
- *         "amount": amount,
- *         "timestamp": timestamp             # <<<<<<<<<<<<<<
+  /* "cython_modules/block_utils.pyx":228
+ *         "index": index,
+ *         "timestamp": timestamp,
+ *         "data": data,             # <<<<<<<<<<<<<<
+ *         "previous_hash": previous_hash,
+ *         "nonce": 0
+*/
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_data, __pyx_v_data) < (0)) __PYX_ERR(0, 226, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":229
+ *         "timestamp": timestamp,
+ *         "data": data,
+ *         "previous_hash": previous_hash,             # <<<<<<<<<<<<<<
+ *         "nonce": 0
  *     }, sort_keys=True)
- * 
 */
-  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_previous_hash, __pyx_v_previous_hash) < (0)) __PYX_ERR(0, 226, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 226, __pyx_L1_error)
 
-  /* "cython_modules/block_utils.pyx":132
- *         "amount": amount,
- *         "timestamp": timestamp
+  /* "cython_modules/block_utils.pyx":231
+ *         "previous_hash": previous_hash,
+ *         "nonce": 0
  *     }, sort_keys=True)             # <<<<<<<<<<<<<<
  * 
- *     return hashlib.sha256(tx_string.encode('utf-8')).digest()
+ *     # Keys are sorted, so the top-level nonce is the last '"nonce": 0' before
 */
   __pyx_t_6 = 1;
   #if CYTHON_UNPACK_METHODS
@@ -4513,92 +4984,103 @@ static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash_by
   #endif
   {
     PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
-    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 127, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 225, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 127, __pyx_L1_error)
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 225, __pyx_L1_error)
     __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
 
-  /* "cython_modules/block_utils.pyx":127
- *         Raw hash bytes (32 bytes)
+  /* "cython_modules/block_utils.pyx":225
+ *         Tuple of (prefix_bytes, suffix_bytes)
  *     """
- *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
- *         "sender": sender,
- *         "receiver": receiver,
+ *     cdef str header = json.dumps({             # <<<<<<<<<<<<<<
+ *         "index": index,
+ *         "timestamp": timestamp,
 */
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 127, __pyx_L1_error)
-  __pyx_v_tx_string = ((PyObject*)__pyx_t_1);
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_v_header = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "cython_modules/block_utils.pyx":134
- *     }, sort_keys=True)
+  /* "cython_modules/block_utils.pyx":235
+ *     # Keys are sorted, so the top-level nonce is the last '"nonce": 0' before
+ *     # "previous_hash" (transaction data is serialized earlier, under "data")
+ *     cdef str marker = '"nonce": 0, "previous_hash": '             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t pos = header.rindex(marker) + len('"nonce": ')
  * 
- *     return hashlib.sha256(tx_string.encode('utf-8')).digest()             # <<<<<<<<<<<<<<
+*/
+  __Pyx_INCREF(__pyx_mstate_global->__pyx_kp_u_nonce_0_previous_hash);
+  __pyx_v_marker = __pyx_mstate_global->__pyx_kp_u_nonce_0_previous_hash;
+
+  /* "cython_modules/block_utils.pyx":236
+ *     # "previous_hash" (transaction data is serialized earlier, under "data")
+ *     cdef str marker = '"nonce": 0, "previous_hash": '
+ *     cdef Py_ssize_t pos = header.rindex(marker) + len('"nonce": ')             # <<<<<<<<<<<<<<
+ * 
+ *     return (header[:pos].encode('utf-8'), header[pos + 1:].encode('utf-8'))
+*/
+  __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_mstate_global->__pyx_umethod_PyUnicode_Type__rindex, __pyx_v_header, __pyx_v_marker); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = __Pyx_PyUnicode_GET_LENGTH(__pyx_mstate_global->__pyx_kp_u_nonce_2); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_t_4 = PyLong_FromSsize_t(__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyNumber_Add(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_t_5); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 236, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_pos = __pyx_t_7;
+
+  /* "cython_modules/block_utils.pyx":238
+ *     cdef Py_ssize_t pos = header.rindex(marker) + len('"nonce": ')
+ * 
+ *     return (header[:pos].encode('utf-8'), header[pos + 1:].encode('utf-8'))             # <<<<<<<<<<<<<<
  * 
  * 
 */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 134, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_7);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_v_tx_string == Py_None)) {
-    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
-    __PYX_ERR(0, 134, __pyx_L1_error)
+  if (unlikely(__pyx_v_header == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 238, __pyx_L1_error)
   }
-  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_tx_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = 1;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_7))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
-    assert(__pyx_t_3);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
-    __Pyx_INCREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
-    __pyx_t_6 = 0;
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
-    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-  }
-  __pyx_t_4 = __pyx_t_5;
-  __Pyx_INCREF(__pyx_t_4);
-  __pyx_t_6 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
-    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_digest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyUnicode_Substring(__pyx_v_header, 0, __pyx_v_pos); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_4 = PyUnicode_AsUTF8String(((PyObject*)__pyx_t_5)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(__pyx_v_header == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 238, __pyx_L1_error)
   }
-  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 134, __pyx_L1_error)
-  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_5 = __Pyx_PyUnicode_Substring(__pyx_v_header, (__pyx_v_pos + 1), PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = PyUnicode_AsUTF8String(((PyObject*)__pyx_t_5)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4) != (0)) __PYX_ERR(0, 238, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 238, __pyx_L1_error);
+  __pyx_t_4 = 0;
   __pyx_t_1 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":114
+  /* "cython_modules/block_utils.pyx":217
  * 
  * 
- * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ * cpdef tuple split_block_header(object index, double timestamp, object data, str previous_hash):             # <<<<<<<<<<<<<<
  *     """
- *     Calculate transaction hash as bytes for signing.
+ *     Serialize a block header exactly as calculate_block_hash does and split
 */
 
   /* function exit code */
@@ -4608,37 +5090,37 @@ static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash_by
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.split_block_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_tx_string);
+  __Pyx_XDECREF(__pyx_v_header);
+  __Pyx_XDECREF(__pyx_v_marker);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_14cython_modules_11block_utils_7fast_transaction_hash_bytes(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_3split_block_header(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_6fast_transaction_hash_bytes, "fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp) -> bytes\n\nCalculate transaction hash as bytes for signing.\n\nArgs:\n    sender: Sender address\n    receiver: Receiver address\n    amount: Transaction amount\n    timestamp: Transaction timestamp\n    \nReturns:\n    Raw hash bytes (32 bytes)");
-static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_7fast_transaction_hash_bytes = {"fast_transaction_hash_bytes", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_7fast_transaction_hash_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_6fast_transaction_hash_bytes};
-static PyObject *__pyx_pw_14cython_modules_11block_utils_7fast_transaction_hash_bytes(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_2split_block_header, "split_block_header(index, double timestamp, data, str previous_hash) -> tuple\n\nSerialize a block header exactly as calculate_block_hash does and split\nit around the nonce value, for use with find_nonce.\n\nReturns:\n    Tuple of (prefix_bytes, suffix_bytes)");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_3split_block_header = {"split_block_header", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_3split_block_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_2split_block_header};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_3split_block_header(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_sender = 0;
-  PyObject *__pyx_v_receiver = 0;
-  double __pyx_v_amount;
+  PyObject *__pyx_v_index = 0;
   double __pyx_v_timestamp;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_previous_hash = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
@@ -4649,7 +5131,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes (wrapper)", 0);
+  __Pyx_RefNannySetupContext("split_block_header (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4659,68 +5141,67 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_sender,&__pyx_mstate_global->__pyx_n_u_receiver,&__pyx_mstate_global->__pyx_n_u_amount,&__pyx_mstate_global->__pyx_n_u_timestamp,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 114, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 217, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 114, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 217, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 114, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 217, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 114, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 217, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 114, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 217, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fast_transaction_hash_bytes", 0) < (0)) __PYX_ERR(0, 114, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "split_block_header", 0) < (0)) __PYX_ERR(0, 217, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 4; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fast_transaction_hash_bytes", 1, 4, 4, i); __PYX_ERR(0, 114, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("split_block_header", 1, 4, 4, i); __PYX_ERR(0, 217, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 4)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 114, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 217, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 114, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 217, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 114, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 217, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 114, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 217, __pyx_L3_error)
     }
-    __pyx_v_sender = ((PyObject*)values[0]);
-    __pyx_v_receiver = ((PyObject*)values[1]);
-    __pyx_v_amount = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 114, __pyx_L3_error)
-    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 114, __pyx_L3_error)
+    __pyx_v_index = values[0];
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 217, __pyx_L3_error)
+    __pyx_v_data = values[2];
+    __pyx_v_previous_hash = ((PyObject*)values[3]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("fast_transaction_hash_bytes", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 114, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("split_block_header", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 217, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.split_block_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sender), (&PyUnicode_Type), 1, "sender", 1))) __PYX_ERR(0, 114, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_receiver), (&PyUnicode_Type), 1, "receiver", 1))) __PYX_ERR(0, 114, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14cython_modules_11block_utils_6fast_transaction_hash_bytes(__pyx_self, __pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 217, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_2split_block_header(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4739,16 +5220,16 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_14cython_modules_11block_utils_6fast_transaction_hash_bytes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp) {
+static PyObject *__pyx_pf_14cython_modules_11block_utils_2split_block_header(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes", 0);
+  __Pyx_RefNannySetupContext("split_block_header", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_fast_transaction_hash_bytes(__pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_split_block_header(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4757,7 +5238,7 @@ static PyObject *__pyx_pf_14cython_modules_11block_utils_6fast_transaction_hash_
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.split_block_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4765,202 +5246,165 @@ static PyObject *__pyx_pf_14cython_modules_11block_utils_6fast_transaction_hash_
   return __pyx_r;
 }
 
-/* "cython_modules/block_utils.pyx":137
+/* "cython_modules/block_utils.pyx":241
  * 
  * 
- * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
- *     """
- *     Verify a segment of the blockchain for hash consistency.
+ * cpdef tuple mine_block_nogil(object index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                              str previous_hash, int difficulty, long long start_nonce=0,
+ *                              long long max_attempts=0):
 */
 
-static PyObject *__pyx_pw_14cython_modules_11block_utils_9verify_chain_segment(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_5mine_block_nogil(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-static int __pyx_f_14cython_modules_11block_utils_verify_chain_segment(PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment *__pyx_optional_args) {
-  int __pyx_v_start_index = ((int)1);
-  int __pyx_v_i;
-  int __pyx_v_length;
-  int __pyx_r;
+static PyObject *__pyx_f_14cython_modules_11block_utils_mine_block_nogil(PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_nogil *__pyx_optional_args) {
+  PY_LONG_LONG __pyx_v_start_nonce = ((PY_LONG_LONG)0);
+  PY_LONG_LONG __pyx_v_max_attempts = ((PY_LONG_LONG)0);
+  PyObject *__pyx_v_prefix = NULL;
+  PyObject *__pyx_v_suffix = NULL;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  long __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  struct __pyx_opt_args_14cython_modules_11block_utils_find_nonce __pyx_t_4;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("verify_chain_segment", 0);
+  __Pyx_RefNannySetupContext("mine_block_nogil", 0);
   if (__pyx_optional_args) {
     if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_start_index = __pyx_optional_args->start_index;
+      __pyx_v_start_nonce = __pyx_optional_args->start_nonce;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_max_attempts = __pyx_optional_args->max_attempts;
+      }
     }
   }
 
-  /* "cython_modules/block_utils.pyx":150
+  /* "cython_modules/block_utils.pyx":261
+ *         (None, next_nonce) when max_attempts ran out
  *     """
- *     cdef int i
- *     cdef int length = len(hashes)             # <<<<<<<<<<<<<<
- * 
- *     if length != len(previous_hashes):
-*/
-  if (unlikely(__pyx_v_hashes == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 150, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_hashes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 150, __pyx_L1_error)
-  __pyx_v_length = __pyx_t_1;
-
-  /* "cython_modules/block_utils.pyx":152
- *     cdef int length = len(hashes)
- * 
- *     if length != len(previous_hashes):             # <<<<<<<<<<<<<<
- *         return False
- * 
-*/
-  if (unlikely(__pyx_v_previous_hashes == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 152, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_previous_hashes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 152, __pyx_L1_error)
-  __pyx_t_2 = (__pyx_v_length != __pyx_t_1);
-  if (__pyx_t_2) {
-
-    /* "cython_modules/block_utils.pyx":153
- * 
- *     if length != len(previous_hashes):
- *         return False             # <<<<<<<<<<<<<<
- * 
- *     for i in range(start_index, length):
-*/
-    __pyx_r = 0;
-    goto __pyx_L0;
-
-    /* "cython_modules/block_utils.pyx":152
- *     cdef int length = len(hashes)
- * 
- *     if length != len(previous_hashes):             # <<<<<<<<<<<<<<
- *         return False
- * 
-*/
-  }
-
-  /* "cython_modules/block_utils.pyx":155
- *         return False
- * 
- *     for i in range(start_index, length):             # <<<<<<<<<<<<<<
- *         if previous_hashes[i] != hashes[i - 1]:
- *             return False
-*/
-  __pyx_t_3 = __pyx_v_length;
-  __pyx_t_4 = __pyx_t_3;
-  for (__pyx_t_5 = __pyx_v_start_index; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-    __pyx_v_i = __pyx_t_5;
-
-    /* "cython_modules/block_utils.pyx":156
- * 
- *     for i in range(start_index, length):
- *         if previous_hashes[i] != hashes[i - 1]:             # <<<<<<<<<<<<<<
- *             return False
- * 
-*/
-    if (unlikely(__pyx_v_previous_hashes == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 156, __pyx_L1_error)
-    }
-    if (unlikely(__pyx_v_hashes == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 156, __pyx_L1_error)
-    }
-    __pyx_t_6 = (__pyx_v_i - 1);
-    __pyx_t_7 = PyObject_RichCompare(__Pyx_PyList_GET_ITEM(__pyx_v_previous_hashes, __pyx_v_i), __Pyx_PyList_GET_ITEM(__pyx_v_hashes, __pyx_t_6), Py_NE); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 156, __pyx_L1_error)
-    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 156, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    if (__pyx_t_2) {
-
-      /* "cython_modules/block_utils.pyx":157
- *     for i in range(start_index, length):
- *         if previous_hashes[i] != hashes[i - 1]:
- *             return False             # <<<<<<<<<<<<<<
- * 
- *     return True
-*/
-      __pyx_r = 0;
-      goto __pyx_L0;
-
-      /* "cython_modules/block_utils.pyx":156
- * 
- *     for i in range(start_index, length):
- *         if previous_hashes[i] != hashes[i - 1]:             # <<<<<<<<<<<<<<
- *             return False
+ *     prefix, suffix = split_block_header(index, timestamp, data, previous_hash)             # <<<<<<<<<<<<<<
+ *     return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)
  * 
 */
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_split_block_header(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (likely(__pyx_t_1 != Py_None)) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PyTuple_GET_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 261, __pyx_L1_error)
     }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0);
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_2 = __Pyx_PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 261, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(0, 261, __pyx_L1_error)
   }
+  __pyx_v_prefix = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_suffix = __pyx_t_3;
+  __pyx_t_3 = 0;
 
-  /* "cython_modules/block_utils.pyx":159
- *             return False
+  /* "cython_modules/block_utils.pyx":262
+ *     """
+ *     prefix, suffix = split_block_header(index, timestamp, data, previous_hash)
+ *     return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)             # <<<<<<<<<<<<<<
  * 
- *     return True             # <<<<<<<<<<<<<<
+ * cpdef str calculate_block_hash(int index, double timestamp, object data,
 */
-  __pyx_r = 1;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_v_prefix;
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 262, __pyx_L1_error)
+  __pyx_t_3 = __pyx_v_suffix;
+  __Pyx_INCREF(__pyx_t_3);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_3))) __PYX_ERR(0, 262, __pyx_L1_error)
+  __pyx_t_4.__pyx_n = 2;
+  __pyx_t_4.start_nonce = __pyx_v_start_nonce;
+  __pyx_t_4.max_attempts = __pyx_v_max_attempts;
+  __pyx_t_2 = __pyx_f_14cython_modules_11block_utils_find_nonce(((PyObject*)__pyx_t_1), ((PyObject*)__pyx_t_3), __pyx_v_difficulty, 0, &__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":137
+  /* "cython_modules/block_utils.pyx":241
  * 
  * 
- * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
- *     """
- *     Verify a segment of the blockchain for hash consistency.
+ * cpdef tuple mine_block_nogil(object index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                              str previous_hash, int difficulty, long long start_nonce=0,
+ *                              long long max_attempts=0):
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_nogil", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_prefix);
+  __Pyx_XDECREF(__pyx_v_suffix);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_14cython_modules_11block_utils_9verify_chain_segment(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_14cython_modules_11block_utils_5mine_block_nogil(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_8verify_chain_segment, "verify_chain_segment(list hashes, list previous_hashes, int start_index=1) -> bool\n\nVerify a segment of the blockchain for hash consistency.\n\nArgs:\n    hashes: List of block hashes\n    previous_hashes: List of previous_hash values\n    start_index: Starting index for verification\n    \nReturns:\n    True if chain segment is valid");
-static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_9verify_chain_segment = {"verify_chain_segment", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_9verify_chain_segment, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_8verify_chain_segment};
-static PyObject *__pyx_pw_14cython_modules_11block_utils_9verify_chain_segment(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_4mine_block_nogil, "mine_block_nogil(index, double timestamp, data, str previous_hash, int difficulty, long long start_nonce=0, long long max_attempts=0) -> tuple\n\nMine a block by finding a valid nonce, releasing the GIL during the search.\nProduces the same (hash, nonce) as mine_block_hash.\n\nArgs:\n    index: Block index\n    timestamp: Block timestamp\n    data: Block data (transactions)\n    previous_hash: Hash of previous block\n    difficulty: Number of leading zeros required\n    start_nonce: Starting nonce value\n    max_attempts: Give up after this many nonces (0 = search until found)\n    \nReturns:\n    Tuple of (hash, nonce) when valid proof found, or\n    (None, next_nonce) when max_attempts ran out");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_5mine_block_nogil = {"mine_block_nogil", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_5mine_block_nogil, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_4mine_block_nogil};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_5mine_block_nogil(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_hashes = 0;
-  PyObject *__pyx_v_previous_hashes = 0;
-  int __pyx_v_start_index;
+  PyObject *__pyx_v_index = 0;
+  double __pyx_v_timestamp;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_previous_hash = 0;
+  int __pyx_v_difficulty;
+  PY_LONG_LONG __pyx_v_start_nonce;
+  PY_LONG_LONG __pyx_v_max_attempts;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[7] = {0,0,0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("verify_chain_segment (wrapper)", 0);
+  __Pyx_RefNannySetupContext("mine_block_nogil (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -4970,70 +5414,103 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_hashes,&__pyx_mstate_global->__pyx_n_u_previous_hashes,&__pyx_mstate_global->__pyx_n_u_start_index,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,&__pyx_mstate_global->__pyx_n_u_difficulty,&__pyx_mstate_global->__pyx_n_u_start_nonce,&__pyx_mstate_global->__pyx_n_u_max_attempts,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 137, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 241, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
+        case  7:
+        values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 241, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  6:
+        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 241, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 241, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 241, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 241, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 241, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 241, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "verify_chain_segment", 0) < (0)) __PYX_ERR(0, 137, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("verify_chain_segment", 0, 2, 3, i); __PYX_ERR(0, 137, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "mine_block_nogil", 0) < (0)) __PYX_ERR(0, 241, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("mine_block_nogil", 0, 5, 7, i); __PYX_ERR(0, 241, __pyx_L3_error) }
       }
     } else {
       switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 137, __pyx_L3_error)
+        case  7:
+        values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 241, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
-        case  2:
+        case  6:
+        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 241, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 241, __pyx_L3_error)
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 241, __pyx_L3_error)
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 241, __pyx_L3_error)
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 241, __pyx_L3_error)
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 137, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 241, __pyx_L3_error)
         break;
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_hashes = ((PyObject*)values[0]);
-    __pyx_v_previous_hashes = ((PyObject*)values[1]);
-    if (values[2]) {
-      __pyx_v_start_index = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_start_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L3_error)
+    __pyx_v_index = values[0];
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 241, __pyx_L3_error)
+    __pyx_v_data = values[2];
+    __pyx_v_previous_hash = ((PyObject*)values[3]);
+    __pyx_v_difficulty = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_difficulty == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 242, __pyx_L3_error)
+    if (values[5]) {
+      __pyx_v_start_nonce = __Pyx_PyLong_As_PY_LONG_LONG(values[5]); if (unlikely((__pyx_v_start_nonce == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 242, __pyx_L3_error)
     } else {
-      __pyx_v_start_index = ((int)1);
+      __pyx_v_start_nonce = ((PY_LONG_LONG)0);
+    }
+    if (values[6]) {
+      __pyx_v_max_attempts = __Pyx_PyLong_As_PY_LONG_LONG(values[6]); if (unlikely((__pyx_v_max_attempts == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L3_error)
+    } else {
+      __pyx_v_max_attempts = ((PY_LONG_LONG)0);
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("verify_chain_segment", 0, 2, 3, __pyx_nargs); __PYX_ERR(0, 137, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("mine_block_nogil", 0, 5, 7, __pyx_nargs); __PYX_ERR(0, 241, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_nogil", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_hashes), (&PyList_Type), 1, "hashes", 1))) __PYX_ERR(0, 137, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hashes), (&PyList_Type), 1, "previous_hashes", 1))) __PYX_ERR(0, 137, __pyx_L1_error)
-  __pyx_r = __pyx_pf_14cython_modules_11block_utils_8verify_chain_segment(__pyx_self, __pyx_v_hashes, __pyx_v_previous_hashes, __pyx_v_start_index);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 242, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_4mine_block_nogil(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, __pyx_v_start_nonce, __pyx_v_max_attempts);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5052,674 +5529,2796 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_14cython_modules_11block_utils_8verify_chain_segment(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, int __pyx_v_start_index) {
+static PyObject *__pyx_pf_14cython_modules_11block_utils_4mine_block_nogil(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, PY_LONG_LONG __pyx_v_start_nonce, PY_LONG_LONG __pyx_v_max_attempts) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_nogil __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("verify_chain_segment", 0);
+  __Pyx_RefNannySetupContext("mine_block_nogil", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2.__pyx_n = 1;
-  __pyx_t_2.start_index = __pyx_v_start_index;
-  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_verify_chain_segment(__pyx_v_hashes, __pyx_v_previous_hashes, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_2.__pyx_n = 2;
+  __pyx_t_2.start_nonce = __pyx_v_start_nonce;
+  __pyx_t_2.max_attempts = __pyx_v_max_attempts;
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_mine_block_nogil(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_nogil", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-/* #### Code section: module_exttypes ### */
 
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-/* #### Code section: initfunc_declarations ### */
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
-/* #### Code section: init_module ### */
-
-static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
-  /*--- Global init code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
-  /*--- Variable export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
-  /*--- Function export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
-
-static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
-  /*--- Type init code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+/* "cython_modules/block_utils.pyx":264
+ *     return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)
+ * 
+ * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                                 str previous_hash, long nonce):
+ *     """
+*/
 
-static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
+static PyObject *__pyx_pw_14cython_modules_11block_utils_7calculate_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_calculate_block_hash(int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_block_string = 0;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
-  /*--- Type import code ---*/
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_mstate->__pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type",
-  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyTypeObject),
-  #elif CYTHON_COMPILING_IN_LIMITED_API
-  0, 0,
-  #else
-  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyHeapTypeObject),
-  #endif
-  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 8, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_mstate->__pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool",
-  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyLongObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyLongObject),
-  #elif CYTHON_COMPILING_IN_LIMITED_API
-  0, 0,
-  #else
-  sizeof(PyLongObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyLongObject),
-  #endif
-  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(3, 8, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_mstate->__pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex",
-  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyComplexObject),
-  #elif CYTHON_COMPILING_IN_LIMITED_API
-  0, 0,
-  #else
-  sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyComplexObject),
-  #endif
-  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(4, 16, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
+  __Pyx_RefNannySetupContext("calculate_block_hash", 0);
 
-static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
-  /*--- Variable import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+  /* "cython_modules/block_utils.pyx":279
+ *         Hexadecimal hash string
+ *     """
+ *     cdef str block_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "index": index,
+ *         "timestamp": timestamp,
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 279, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-static int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
-  /*--- Function import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+  /* "cython_modules/block_utils.pyx":280
+ *     """
+ *     cdef str block_string = json.dumps({
+ *         "index": index,             # <<<<<<<<<<<<<<
+ *         "timestamp": timestamp,
+ *         "data": data,
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_index, __pyx_t_5) < (0)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
-static int __pyx_pymod_exec_block_utils(PyObject* module); /*proto*/
-static PyModuleDef_Slot __pyx_moduledef_slots[] = {
-  {Py_mod_create, (void*)__pyx_pymod_create},
-  {Py_mod_exec, (void*)__pyx_pymod_exec_block_utils},
-  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
-  #endif
-  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
-  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
-  #endif
-  {0, NULL}
-};
-#endif
+  /* "cython_modules/block_utils.pyx":281
+ *     cdef str block_string = json.dumps({
+ *         "index": index,
+ *         "timestamp": timestamp,             # <<<<<<<<<<<<<<
+ *         "data": data,
+ *         "previous_hash": previous_hash,
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-#ifdef __cplusplus
-namespace {
-  struct PyModuleDef __pyx_moduledef =
-  #else
-  static struct PyModuleDef __pyx_moduledef =
+  /* "cython_modules/block_utils.pyx":282
+ *         "index": index,
+ *         "timestamp": timestamp,
+ *         "data": data,             # <<<<<<<<<<<<<<
+ *         "previous_hash": previous_hash,
+ *         "nonce": nonce
+*/
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_data, __pyx_v_data) < (0)) __PYX_ERR(0, 280, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":283
+ *         "timestamp": timestamp,
+ *         "data": data,
+ *         "previous_hash": previous_hash,             # <<<<<<<<<<<<<<
+ *         "nonce": nonce
+ *     }, sort_keys=True)
+*/
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_previous_hash, __pyx_v_previous_hash) < (0)) __PYX_ERR(0, 280, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":284
+ *         "data": data,
+ *         "previous_hash": previous_hash,
+ *         "nonce": nonce             # <<<<<<<<<<<<<<
+ *     }, sort_keys=True)
+ * 
+*/
+  __pyx_t_5 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_t_5) < (0)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_modules/block_utils.pyx":285
+ *         "previous_hash": previous_hash,
+ *         "nonce": nonce
+ *     }, sort_keys=True)             # <<<<<<<<<<<<<<
+ * 
+ *     return hashlib.sha256(block_string.encode('utf-8')).hexdigest()
+*/
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_6 = 0;
+  }
   #endif
   {
-      PyModuleDef_HEAD_INIT,
-      "block_utils",
-      __pyx_k_High_performance_block_utilitie, /* m_doc */
-    #if CYTHON_USE_MODULE_STATE
-      sizeof(__pyx_mstatetype), /* m_size */
-    #else
-      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
-    #endif
-      __pyx_methods /* m_methods */,
-    #if CYTHON_PEP489_MULTI_PHASE_INIT
-      __pyx_moduledef_slots, /* m_slots */
-    #else
-      NULL, /* m_reload */
-    #endif
-    #if CYTHON_USE_MODULE_STATE
-      __pyx_m_traverse, /* m_traverse */
-      __pyx_m_clear, /* m_clear */
-      NULL /* m_free */
-    #else
-      NULL, /* m_traverse */
-      NULL, /* m_clear */
-      NULL /* m_free */
-    #endif
-  };
-  #ifdef __cplusplus
-} /* anonymous namespace */
-#endif
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
 
-/* PyModInitFuncType */
-#ifndef CYTHON_NO_PYINIT_EXPORT
-  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#else
-  #ifdef __cplusplus
-  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
-  #else
-  #define __Pyx_PyMODINIT_FUNC PyObject *
-  #endif
-#endif
+  /* "cython_modules/block_utils.pyx":279
+ *         Hexadecimal hash string
+ *     """
+ *     cdef str block_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "index": index,
+ *         "timestamp": timestamp,
+*/
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 279, __pyx_L1_error)
+  __pyx_v_block_string = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-__Pyx_PyMODINIT_FUNC PyInit_block_utils(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC PyInit_block_utils(void)
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-{
-  return PyModuleDef_Init(&__pyx_moduledef);
-}
-/* ModuleCreationPEP489 */
-#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
-      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
-static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
-    {
-        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
-        if (!module) {
-            PyErr_Clear(); // just try the 3.8-3.12 version
-            module = PyImport_ImportModule("_xxsubinterpreters");
-            if (!module) goto bad;
-        }
-        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
-        Py_DECREF(module);
-        if (!current) goto bad;
-        if (PyTuple_Check(current)) {
-            PyObject *new_current = PySequence_GetItem(current, 0);
-            Py_DECREF(current);
-            current = new_current;
-            if (!new_current) goto bad;
-        }
-        long long as_c_int = PyLong_AsLongLong(current);
-        Py_DECREF(current);
-        return as_c_int;
-    }
-  bad:
-    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
-    return -1;
+  /* "cython_modules/block_utils.pyx":287
+ *     }, sort_keys=True)
+ * 
+ *     return hashlib.sha256(block_string.encode('utf-8')).hexdigest()             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_block_string == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
+    __PYX_ERR(0, 287, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_block_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 287, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
+    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_4 = __pyx_t_5;
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_6 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 287, __pyx_L1_error)
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "cython_modules/block_utils.pyx":264
+ *     return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)
+ * 
+ * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                                 str previous_hash, long nonce):
+ *     """
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_block_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
-#if !CYTHON_USE_MODULE_STATE
-static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
-    static PY_INT64_T main_interpreter_id = -1;
-#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
-    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
-#elif CYTHON_COMPILING_IN_GRAAL
-    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
-#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
-      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
-    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
-#elif CYTHON_COMPILING_IN_LIMITED_API
-    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14cython_modules_11block_utils_7calculate_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
-#endif
-    if (unlikely(current_id == -1)) {
-        return -1;
-    }
-    if (main_interpreter_id == -1) {
-        main_interpreter_id = current_id;
-        return 0;
-    } else if (unlikely(main_interpreter_id != current_id)) {
-        PyErr_SetString(
-            PyExc_ImportError,
-            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
-        return -1;
-    }
-    return 0;
-}
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
-{
-    PyObject *value = PyObject_GetAttrString(spec, from_name);
-    int result = 0;
-    if (likely(value)) {
-        if (allow_none || value != Py_None) {
-            result = PyDict_SetItemString(moddict, to_name, value);
-        }
-        Py_DECREF(value);
-    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Clear();
-    } else {
-        result = -1;
-    }
-    return result;
-}
-static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
-    PyObject *module = NULL, *moddict, *modname;
-    CYTHON_UNUSED_VAR(def);
-    #if !CYTHON_USE_MODULE_STATE
-    if (__Pyx_check_single_interpreter())
-        return NULL;
-    #endif
-    if (__pyx_m)
-        return __Pyx_NewRef(__pyx_m);
-    modname = PyObject_GetAttrString(spec, "name");
-    if (unlikely(!modname)) goto bad;
-    module = PyModule_NewObject(modname);
-    Py_DECREF(modname);
-    if (unlikely(!module)) goto bad;
-    moddict = PyModule_GetDict(module);
-    if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
-    return module;
-bad:
-    Py_XDECREF(module);
-    return NULL;
-}
-
-
-static CYTHON_SMALL_CODE int __pyx_pymod_exec_block_utils(PyObject *__pyx_pyinit_module)
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_6calculate_block_hash, "calculate_block_hash(int index, double timestamp, data, str previous_hash, long nonce) -> str\n\nCalculate block hash with optimized JSON serialization.\n\nArgs:\n    index: Block index\n    timestamp: Block timestamp\n    data: Block data (transactions)\n    previous_hash: Hash of previous block\n    nonce: Mining nonce\n    \nReturns:\n    Hexadecimal hash string");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_7calculate_block_hash = {"calculate_block_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_7calculate_block_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_6calculate_block_hash};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_7calculate_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-{
-  int stringtab_initialized = 0;
-  #if CYTHON_USE_MODULE_STATE
-  int pystate_addmodule_run = 0;
+) {
+  int __pyx_v_index;
+  double __pyx_v_timestamp;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_previous_hash = 0;
+  long __pyx_v_nonce;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
-  __pyx_mstatetype *__pyx_mstate = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[5] = {0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m) {
-    if (__pyx_m == __pyx_pyinit_module) return 0;
-    PyErr_SetString(PyExc_RuntimeError, "Module 'block_utils' has already been imported. Re-initialisation is not supported.");
-    return -1;
-  }
+  __Pyx_RefNannySetupContext("calculate_block_hash (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
-  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
   #endif
-  /*--- Module creation code ---*/
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  __pyx_t_1 = __pyx_pyinit_module;
-  Py_INCREF(__pyx_t_1);
-  #else
-  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  #if CYTHON_USE_MODULE_STATE
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
-    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "block_utils" pseudovariable */
-    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-    pystate_addmodule_run = 1;
-  }
-  #else
-  __pyx_m = __pyx_t_1;
-  #endif
-  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
-  #endif
-  __pyx_mstate = __pyx_mstate_global;
-  CYTHON_UNUSED_VAR(__pyx_t_1);
-  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_mstate->__pyx_d);
-  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /* ImportRefnannyAPI */
-  #if CYTHON_REFNANNY
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-  if (!__Pyx_RefNanny) {
-    PyErr_Clear();
-    __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-    if (!__Pyx_RefNanny)
-        Py_FatalError("failed to import 'refnanny' module");
-  }
-  #endif
-  
-__Pyx_RefNannySetupContext("PyInit_block_utils", 0);
-  __Pyx_init_runtime_version();
-  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Library function declarations ---*/
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  stringtab_initialized = 1;
-  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (__pyx_module_is_main_cython_modules__block_utils) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  }
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "cython_modules.block_utils")) {
-      if (unlikely((PyDict_SetItemString(modules, "cython_modules.block_utils", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,&__pyx_mstate_global->__pyx_n_u_nonce,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 264, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 264, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 264, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 264, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 264, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 264, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "calculate_block_hash", 0) < (0)) __PYX_ERR(0, 264, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("calculate_block_hash", 1, 5, 5, i); __PYX_ERR(0, 264, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 5)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 264, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 264, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 264, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 264, __pyx_L3_error)
+      values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 264, __pyx_L3_error)
     }
+    __pyx_v_index = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 264, __pyx_L3_error)
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 264, __pyx_L3_error)
+    __pyx_v_data = values[2];
+    __pyx_v_previous_hash = ((PyObject*)values[3]);
+    __pyx_v_nonce = __Pyx_PyLong_As_long(values[4]); if (unlikely((__pyx_v_nonce == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L3_error)
   }
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Global type/function init code ---*/
-  (void)__Pyx_modinit_global_init_code(__pyx_mstate);
-  (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
-  (void)__Pyx_modinit_function_export_code(__pyx_mstate);
-  (void)__Pyx_modinit_type_init_code(__pyx_mstate);
-  if (unlikely((__Pyx_modinit_type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
-  (void)__Pyx_modinit_function_import_code(__pyx_mstate);
-  /*--- Execution code ---*/
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("calculate_block_hash", 1, 5, 5, __pyx_nargs); __PYX_ERR(0, 264, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_6calculate_block_hash(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_nonce);
 
-  /* "cython_modules/block_utils.pyx":10
- * """
- * 
- * import hashlib             # <<<<<<<<<<<<<<
- * import json
- * from cpython cimport bool
-*/
-  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_hashlib, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __pyx_t_2 = __pyx_t_1;
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_hashlib, __pyx_t_2) < (0)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "cython_modules/block_utils.pyx":11
- * 
- * import hashlib
- * import json             # <<<<<<<<<<<<<<
- * from cpython cimport bool
- * 
-*/
-  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_json, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
-  __pyx_t_2 = __pyx_t_1;
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_json, __pyx_t_2) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+static PyObject *__pyx_pf_14cython_modules_11block_utils_6calculate_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, long __pyx_v_nonce) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("calculate_block_hash", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_calculate_block_hash(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_nonce, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "cython_modules/block_utils.pyx":14
- * from cpython cimport bool
- * 
- * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                                 str previous_hash, long nonce):
- *     """
-*/
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_1calculate_block_hash, 0, __pyx_mstate_global->__pyx_n_u_calculate_block_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
-  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
-  #endif
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_calculate_block_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 14, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_modules.block_utils.calculate_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "cython_modules/block_utils.pyx":40
+/* "cython_modules/block_utils.pyx":290
  * 
  * 
  * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
  *                             str previous_hash, int difficulty, long start_nonce=0):
  *     """
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_3mine_block_hash, 0, __pyx_mstate_global->__pyx_n_u_mine_block_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
-  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
-  #endif
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_mine_block_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "cython_modules/block_utils.pyx":91
- * 
- * 
- * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+static PyObject *__pyx_pw_14cython_modules_11block_utils_9mine_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_mine_block_hash(int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash *__pyx_optional_args) {
+  long __pyx_v_start_nonce = ((long)0);
+  long __pyx_v_nonce;
+  PyObject *__pyx_v_block_hash = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_target = 0;
+  int __pyx_v_i;
+  int __pyx_v_valid;
+  PyObject *__pyx_v_block_template = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  size_t __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_UCS4 __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("mine_block_hash", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_start_nonce = __pyx_optional_args->start_nonce;
+    }
+  }
+
+  /* "cython_modules/block_utils.pyx":307
+ *         Tuple of (hash, nonce) when valid proof found
  *     """
- *     Calculate transaction hash efficiently.
+ *     cdef long nonce = start_nonce             # <<<<<<<<<<<<<<
+ *     cdef str block_hash
+ *     cdef str target = '0' * difficulty
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_5fast_transaction_hash, 0, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 91, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
-  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
-  #endif
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 91, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_nonce = __pyx_v_start_nonce;
 
-  /* "cython_modules/block_utils.pyx":114
- * 
- * 
- * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
- *     """
- *     Calculate transaction hash as bytes for signing.
+  /* "cython_modules/block_utils.pyx":309
+ *     cdef long nonce = start_nonce
+ *     cdef str block_hash
+ *     cdef str target = '0' * difficulty             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     cdef bint valid
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_7fast_transaction_hash_bytes, 0, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash_bytes, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
-  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
-  #endif
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash_bytes, __pyx_t_2) < (0)) __PYX_ERR(0, 114, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PySequence_Multiply(__pyx_mstate_global->__pyx_kp_u_0, __pyx_v_difficulty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_target = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "cython_modules/block_utils.pyx":137
- * 
- * 
- * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
- *     """
- *     Verify a segment of the blockchain for hash consistency.
+  /* "cython_modules/block_utils.pyx":315
+ *     # Pre-build the static parts of the block
+ *     cdef dict block_template = {
+ *         "index": index,             # <<<<<<<<<<<<<<
+ *         "timestamp": timestamp,
+ *         "data": data,
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_9verify_chain_segment, 0, __pyx_mstate_global->__pyx_n_u_verify_chain_segment, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
-  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
-  #endif
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[1]);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_verify_chain_segment, __pyx_t_2) < (0)) __PYX_ERR(0, 137, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_index, __pyx_t_2) < (0)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "cython_modules/block_utils.pyx":1
- * # cython: language_level=3             # <<<<<<<<<<<<<<
- * # cython: boundscheck=False
- * # cython: wraparound=False
+  /* "cython_modules/block_utils.pyx":316
+ *     cdef dict block_template = {
+ *         "index": index,
+ *         "timestamp": timestamp,             # <<<<<<<<<<<<<<
+ *         "data": data,
+ *         "previous_hash": previous_hash,
 */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_2) < (0)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /*--- Wrapped vars code ---*/
+  /* "cython_modules/block_utils.pyx":317
+ *         "index": index,
+ *         "timestamp": timestamp,
+ *         "data": data,             # <<<<<<<<<<<<<<
+ *         "previous_hash": previous_hash,
+ *         "nonce": 0
+*/
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_data, __pyx_v_data) < (0)) __PYX_ERR(0, 315, __pyx_L1_error)
 
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  if (__pyx_m) {
-    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
-      __Pyx_AddTraceback("init cython_modules.block_utils", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  /* "cython_modules/block_utils.pyx":318
+ *         "timestamp": timestamp,
+ *         "data": data,
+ *         "previous_hash": previous_hash,             # <<<<<<<<<<<<<<
+ *         "nonce": 0
+ *     }
+*/
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_previous_hash, __pyx_v_previous_hash) < (0)) __PYX_ERR(0, 315, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_mstate_global->__pyx_int_0) < (0)) __PYX_ERR(0, 315, __pyx_L1_error)
+  __pyx_v_block_template = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "cython_modules/block_utils.pyx":322
+ *     }
+ * 
+ *     while True:             # <<<<<<<<<<<<<<
+ *         block_template["nonce"] = nonce
+ *         block_hash = hashlib.sha256(
+*/
+  while (1) {
+
+    /* "cython_modules/block_utils.pyx":323
+ * 
+ *     while True:
+ *         block_template["nonce"] = nonce             # <<<<<<<<<<<<<<
+ *         block_hash = hashlib.sha256(
+ *             json.dumps(block_template, sort_keys=True).encode('utf-8')
+*/
+    __pyx_t_1 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely((PyDict_SetItem(__pyx_v_block_template, __pyx_mstate_global->__pyx_n_u_nonce, __pyx_t_1) < 0))) __PYX_ERR(0, 323, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "cython_modules/block_utils.pyx":324
+ *     while True:
+ *         block_template["nonce"] = nonce
+ *         block_hash = hashlib.sha256(             # <<<<<<<<<<<<<<
+ *             json.dumps(block_template, sort_keys=True).encode('utf-8')
+ *         ).hexdigest()
+*/
+    __pyx_t_4 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "cython_modules/block_utils.pyx":325
+ *         block_template["nonce"] = nonce
+ *         block_hash = hashlib.sha256(
+ *             json.dumps(block_template, sort_keys=True).encode('utf-8')             # <<<<<<<<<<<<<<
+ *         ).hexdigest()
+ * 
+*/
+    __pyx_t_9 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    __pyx_t_11 = __Pyx_PyObject_GetAttrStr(__pyx_t_10, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 325, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    __pyx_t_12 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_11))) {
+      __pyx_t_9 = PyMethod_GET_SELF(__pyx_t_11);
+      assert(__pyx_t_9);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
+      __Pyx_INCREF(__pyx_t_9);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
+      __pyx_t_12 = 0;
     }
-    #if !CYTHON_USE_MODULE_STATE
-    Py_CLEAR(__pyx_m);
-    #else
-    Py_DECREF(__pyx_m);
-    if (pystate_addmodule_run) {
-      PyObject *tp, *value, *tb;
-      PyErr_Fetch(&tp, &value, &tb);
-      PyState_RemoveModule(&__pyx_moduledef);
-      PyErr_Restore(tp, value, tb);
+    #endif
+    {
+      PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_9, __pyx_v_block_template};
+      __pyx_t_10 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_10);
+      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_10, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 325, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_11, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_10);
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+    }
+    __pyx_t_7 = __pyx_t_8;
+    __Pyx_INCREF(__pyx_t_7);
+    __pyx_t_12 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_mstate_global->__pyx_kp_u_utf_8};
+      __pyx_t_5 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_encode, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __pyx_t_12 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+      assert(__pyx_t_4);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
+      __pyx_t_12 = 0;
     }
     #endif
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init cython_modules.block_utils");
-  }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  return (__pyx_m != NULL) ? 0 : -1;
-  #else
-  return __pyx_m;
-  #endif
-}
-/* #### Code section: pystring_table ### */
-/* #### Code section: cached_builtins ### */
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_5};
+      __pyx_t_3 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_12, (2-__pyx_t_12) | (__pyx_t_12*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 324, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+    }
+    __pyx_t_2 = __pyx_t_3;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_12 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_12, (1-__pyx_t_12) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
 
-static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
-  CYTHON_UNUSED_VAR(__pyx_mstate);
+    /* "cython_modules/block_utils.pyx":326
+ *         block_hash = hashlib.sha256(
+ *             json.dumps(block_template, sort_keys=True).encode('utf-8')
+ *         ).hexdigest()             # <<<<<<<<<<<<<<
+ * 
+ *         # Check if hash meets difficulty requirement
+*/
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 326, __pyx_L1_error)
+    __Pyx_XDECREF_SET(__pyx_v_block_hash, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
 
-  /* Cached unbound methods */
-  __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
-  __pyx_mstate->__pyx_umethod_PyDict_Type_items.method_name = &__pyx_mstate->__pyx_n_u_items;
-  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
-  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
-  __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
-  __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
-  return 0;
-}
-/* #### Code section: cached_constants ### */
+    /* "cython_modules/block_utils.pyx":329
+ * 
+ *         # Check if hash meets difficulty requirement
+ *         valid = True             # <<<<<<<<<<<<<<
+ *         for i in range(difficulty):
+ *             if block_hash[i] != '0':
+*/
+    __pyx_v_valid = 1;
 
-static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
-  __Pyx_RefNannyDeclarations
-  CYTHON_UNUSED_VAR(__pyx_mstate);
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+    /* "cython_modules/block_utils.pyx":330
+ *         # Check if hash meets difficulty requirement
+ *         valid = True
+ *         for i in range(difficulty):             # <<<<<<<<<<<<<<
+ *             if block_hash[i] != '0':
+ *                 valid = False
+*/
+    __pyx_t_13 = __pyx_v_difficulty;
+    __pyx_t_14 = __pyx_t_13;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_i = __pyx_t_15;
 
-  /* "cython_modules/block_utils.pyx":40
- * 
- * 
- * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
- *                             str previous_hash, int difficulty, long start_nonce=0):
- *     """
+      /* "cython_modules/block_utils.pyx":331
+ *         valid = True
+ *         for i in range(difficulty):
+ *             if block_hash[i] != '0':             # <<<<<<<<<<<<<<
+ *                 valid = False
+ *                 break
 */
-  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+      __pyx_t_16 = __Pyx_GetItemInt_Unicode(__pyx_v_block_hash, __pyx_v_i, int, 1, __Pyx_PyLong_From_int, 0, 0, 0, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(__pyx_t_16 == (Py_UCS4)-1)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_t_17 = (__pyx_t_16 != 48);
+      if (__pyx_t_17) {
 
-  /* "cython_modules/block_utils.pyx":137
+        /* "cython_modules/block_utils.pyx":332
+ *         for i in range(difficulty):
+ *             if block_hash[i] != '0':
+ *                 valid = False             # <<<<<<<<<<<<<<
+ *                 break
  * 
+*/
+        __pyx_v_valid = 0;
+
+        /* "cython_modules/block_utils.pyx":333
+ *             if block_hash[i] != '0':
+ *                 valid = False
+ *                 break             # <<<<<<<<<<<<<<
  * 
- * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
- *     """
- *     Verify a segment of the blockchain for hash consistency.
+ *         if valid:
+*/
+        goto __pyx_L6_break;
+
+        /* "cython_modules/block_utils.pyx":331
+ *         valid = True
+ *         for i in range(difficulty):
+ *             if block_hash[i] != '0':             # <<<<<<<<<<<<<<
+ *                 valid = False
+ *                 break
 */
-  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_int_1); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
-  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
-  #if CYTHON_IMMORTAL_CONSTANTS
-  {
-    PyObject **table = __pyx_mstate->__pyx_tuple;
-    for (Py_ssize_t i=0; i<2; ++i) {
-      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-      #if PY_VERSION_HEX < 0x030E0000
-      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
-      #else
-      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
-      #endif
-      {
-        Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
       }
-      #else
-      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
-      #endif
     }
-  }
-  #endif
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-/* #### Code section: init_constants ### */
+    __pyx_L6_break:;
 
-static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+    /* "cython_modules/block_utils.pyx":335
+ *                 break
+ * 
+ *         if valid:             # <<<<<<<<<<<<<<
+ *             return (block_hash, nonce)
+ * 
+*/
+    if (__pyx_v_valid) {
+
+      /* "cython_modules/block_utils.pyx":336
+ * 
+ *         if valid:
+ *             return (block_hash, nonce)             # <<<<<<<<<<<<<<
+ * 
+ *         nonce += 1
+*/
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_1 = __Pyx_PyLong_From_long(__pyx_v_nonce); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 336, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_v_block_hash);
+      __Pyx_GIVEREF(__pyx_v_block_hash);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_block_hash) != (0)) __PYX_ERR(0, 336, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_1);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_1) != (0)) __PYX_ERR(0, 336, __pyx_L1_error);
+      __pyx_t_1 = 0;
+      __pyx_r = ((PyObject*)__pyx_t_3);
+      __pyx_t_3 = 0;
+      goto __pyx_L0;
+
+      /* "cython_modules/block_utils.pyx":335
+ *                 break
+ * 
+ *         if valid:             # <<<<<<<<<<<<<<
+ *             return (block_hash, nonce)
+ * 
+*/
+    }
+
+    /* "cython_modules/block_utils.pyx":338
+ *             return (block_hash, nonce)
+ * 
+ *         nonce += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+    __pyx_v_nonce = (__pyx_v_nonce + 1);
+  }
+
+  /* "cython_modules/block_utils.pyx":290
+ * 
+ * 
+ * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                             str previous_hash, int difficulty, long start_nonce=0):
+ *     """
+*/
+
+  /* function exit code */
+  __pyx_r = ((PyObject*)Py_None); __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_block_hash);
+  __Pyx_XDECREF(__pyx_v_target);
+  __Pyx_XDECREF(__pyx_v_block_template);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14cython_modules_11block_utils_9mine_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_8mine_block_hash, "mine_block_hash(int index, double timestamp, data, str previous_hash, int difficulty, long start_nonce=0) -> tuple\n\nMine a block by finding a valid nonce.\nThis is the most CPU-intensive operation in the blockchain.\n\nArgs:\n    index: Block index\n    timestamp: Block timestamp\n    data: Block data (transactions)\n    previous_hash: Hash of previous block\n    difficulty: Number of leading zeros required\n    start_nonce: Starting nonce value\n    \nReturns:\n    Tuple of (hash, nonce) when valid proof found");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_9mine_block_hash = {"mine_block_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_9mine_block_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_8mine_block_hash};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_9mine_block_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  int __pyx_v_index;
+  double __pyx_v_timestamp;
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_previous_hash = 0;
+  int __pyx_v_difficulty;
+  long __pyx_v_start_nonce;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[6] = {0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("mine_block_hash (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_index,&__pyx_mstate_global->__pyx_n_u_timestamp,&__pyx_mstate_global->__pyx_n_u_data,&__pyx_mstate_global->__pyx_n_u_previous_hash,&__pyx_mstate_global->__pyx_n_u_difficulty,&__pyx_mstate_global->__pyx_n_u_start_nonce,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 290, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  6:
+        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "mine_block_hash", 0) < (0)) __PYX_ERR(0, 290, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 5; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("mine_block_hash", 0, 5, 6, i); __PYX_ERR(0, 290, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  6:
+        values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 290, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 290, __pyx_L3_error)
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 290, __pyx_L3_error)
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 290, __pyx_L3_error)
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 290, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 290, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_index = __Pyx_PyLong_As_int(values[0]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L3_error)
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L3_error)
+    __pyx_v_data = values[2];
+    __pyx_v_previous_hash = ((PyObject*)values[3]);
+    __pyx_v_difficulty = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_difficulty == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 291, __pyx_L3_error)
+    if (values[5]) {
+      __pyx_v_start_nonce = __Pyx_PyLong_As_long(values[5]); if (unlikely((__pyx_v_start_nonce == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 291, __pyx_L3_error)
+    } else {
+      __pyx_v_start_nonce = ((long)0);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("mine_block_hash", 0, 5, 6, __pyx_nargs); __PYX_ERR(0, 290, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hash), (&PyUnicode_Type), 1, "previous_hash", 1))) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_8mine_block_hash(__pyx_self, __pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, __pyx_v_start_nonce);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14cython_modules_11block_utils_8mine_block_hash(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_index, double __pyx_v_timestamp, PyObject *__pyx_v_data, PyObject *__pyx_v_previous_hash, int __pyx_v_difficulty, long __pyx_v_start_nonce) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_14cython_modules_11block_utils_mine_block_hash __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("mine_block_hash", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.start_nonce = __pyx_v_start_nonce;
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_mine_block_hash(__pyx_v_index, __pyx_v_timestamp, __pyx_v_data, __pyx_v_previous_hash, __pyx_v_difficulty, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_modules.block_utils.mine_block_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_modules/block_utils.pyx":341
+ * 
+ * 
+ * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash efficiently.
+*/
+
+static PyObject *__pyx_pw_14cython_modules_11block_utils_11fast_transaction_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash(PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_tx_string = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fast_transaction_hash", 0);
+
+  /* "cython_modules/block_utils.pyx":354
+ *         Hexadecimal hash string
+ *     """
+ *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "sender": sender,
+ *         "receiver": receiver,
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "cython_modules/block_utils.pyx":355
+ *     """
+ *     cdef str tx_string = json.dumps({
+ *         "sender": sender,             # <<<<<<<<<<<<<<
+ *         "receiver": receiver,
+ *         "amount": amount,
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_sender, __pyx_v_sender) < (0)) __PYX_ERR(0, 355, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":356
+ *     cdef str tx_string = json.dumps({
+ *         "sender": sender,
+ *         "receiver": receiver,             # <<<<<<<<<<<<<<
+ *         "amount": amount,
+ *         "timestamp": timestamp
+*/
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_receiver, __pyx_v_receiver) < (0)) __PYX_ERR(0, 355, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":357
+ *         "sender": sender,
+ *         "receiver": receiver,
+ *         "amount": amount,             # <<<<<<<<<<<<<<
+ *         "timestamp": timestamp
+ *     }, sort_keys=True)
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 357, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_amount, __pyx_t_5) < (0)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_modules/block_utils.pyx":358
+ *         "receiver": receiver,
+ *         "amount": amount,
+ *         "timestamp": timestamp             # <<<<<<<<<<<<<<
+ *     }, sort_keys=True)
+ * 
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 355, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_modules/block_utils.pyx":359
+ *         "amount": amount,
+ *         "timestamp": timestamp
+ *     }, sort_keys=True)             # <<<<<<<<<<<<<<
+ * 
+ *     return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()
+*/
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 354, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+
+  /* "cython_modules/block_utils.pyx":354
+ *         Hexadecimal hash string
+ *     """
+ *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "sender": sender,
+ *         "receiver": receiver,
+*/
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 354, __pyx_L1_error)
+  __pyx_v_tx_string = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "cython_modules/block_utils.pyx":361
+ *     }, sort_keys=True)
+ * 
+ *     return hashlib.sha256(tx_string.encode('utf-8')).hexdigest()             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_tx_string == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
+    __PYX_ERR(0, 361, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_tx_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
+    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_4 = __pyx_t_5;
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_6 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_hexdigest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 361, __pyx_L1_error)
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "cython_modules/block_utils.pyx":341
+ * 
+ * 
+ * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash efficiently.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_tx_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14cython_modules_11block_utils_11fast_transaction_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_10fast_transaction_hash, "fast_transaction_hash(str sender, str receiver, double amount, double timestamp) -> str\n\nCalculate transaction hash efficiently.\n\nArgs:\n    sender: Sender address\n    receiver: Receiver address\n    amount: Transaction amount\n    timestamp: Transaction timestamp\n    \nReturns:\n    Hexadecimal hash string");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_11fast_transaction_hash = {"fast_transaction_hash", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_11fast_transaction_hash, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_10fast_transaction_hash};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_11fast_transaction_hash(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_sender = 0;
+  PyObject *__pyx_v_receiver = 0;
+  double __pyx_v_amount;
+  double __pyx_v_timestamp;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[4] = {0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fast_transaction_hash (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_sender,&__pyx_mstate_global->__pyx_n_u_receiver,&__pyx_mstate_global->__pyx_n_u_amount,&__pyx_mstate_global->__pyx_n_u_timestamp,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 341, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 341, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 341, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 341, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 341, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fast_transaction_hash", 0) < (0)) __PYX_ERR(0, 341, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 4; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fast_transaction_hash", 1, 4, 4, i); __PYX_ERR(0, 341, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 4)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 341, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 341, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 341, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 341, __pyx_L3_error)
+    }
+    __pyx_v_sender = ((PyObject*)values[0]);
+    __pyx_v_receiver = ((PyObject*)values[1]);
+    __pyx_v_amount = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 341, __pyx_L3_error)
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 341, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fast_transaction_hash", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 341, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sender), (&PyUnicode_Type), 1, "sender", 1))) __PYX_ERR(0, 341, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_receiver), (&PyUnicode_Type), 1, "receiver", 1))) __PYX_ERR(0, 341, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_10fast_transaction_hash(__pyx_self, __pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14cython_modules_11block_utils_10fast_transaction_hash(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fast_transaction_hash", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_fast_transaction_hash(__pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_modules/block_utils.pyx":364
+ * 
+ * 
+ * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash as bytes for signing.
+*/
+
+static PyObject *__pyx_pw_14cython_modules_11block_utils_13fast_transaction_hash_bytes(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_14cython_modules_11block_utils_fast_transaction_hash_bytes(PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_tx_string = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes", 0);
+
+  /* "cython_modules/block_utils.pyx":377
+ *         Raw hash bytes (32 bytes)
+ *     """
+ *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "sender": sender,
+ *         "receiver": receiver,
+*/
+  __pyx_t_2 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_json); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_dumps); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 377, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "cython_modules/block_utils.pyx":378
+ *     """
+ *     cdef str tx_string = json.dumps({
+ *         "sender": sender,             # <<<<<<<<<<<<<<
+ *         "receiver": receiver,
+ *         "amount": amount,
+*/
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_sender, __pyx_v_sender) < (0)) __PYX_ERR(0, 378, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":379
+ *     cdef str tx_string = json.dumps({
+ *         "sender": sender,
+ *         "receiver": receiver,             # <<<<<<<<<<<<<<
+ *         "amount": amount,
+ *         "timestamp": timestamp
+*/
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_receiver, __pyx_v_receiver) < (0)) __PYX_ERR(0, 378, __pyx_L1_error)
+
+  /* "cython_modules/block_utils.pyx":380
+ *         "sender": sender,
+ *         "receiver": receiver,
+ *         "amount": amount,             # <<<<<<<<<<<<<<
+ *         "timestamp": timestamp
+ *     }, sort_keys=True)
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_amount); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 380, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_amount, __pyx_t_5) < (0)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_modules/block_utils.pyx":381
+ *         "receiver": receiver,
+ *         "amount": amount,
+ *         "timestamp": timestamp             # <<<<<<<<<<<<<<
+ *     }, sort_keys=True)
+ * 
+*/
+  __pyx_t_5 = PyFloat_FromDouble(__pyx_v_timestamp); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 381, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_mstate_global->__pyx_n_u_timestamp, __pyx_t_5) < (0)) __PYX_ERR(0, 378, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "cython_modules/block_utils.pyx":382
+ *         "amount": amount,
+ *         "timestamp": timestamp
+ *     }, sort_keys=True)             # <<<<<<<<<<<<<<
+ * 
+ *     return hashlib.sha256(tx_string.encode('utf-8')).digest()
+*/
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_4);
+    assert(__pyx_t_2);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_2, __pyx_t_3};
+    __pyx_t_5 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_sort_keys, Py_True, __pyx_t_5, __pyx_callargs+2, 0) < (0)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+
+  /* "cython_modules/block_utils.pyx":377
+ *         Raw hash bytes (32 bytes)
+ *     """
+ *     cdef str tx_string = json.dumps({             # <<<<<<<<<<<<<<
+ *         "sender": sender,
+ *         "receiver": receiver,
+*/
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(0, 377, __pyx_L1_error)
+  __pyx_v_tx_string = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "cython_modules/block_utils.pyx":384
+ *     }, sort_keys=True)
+ * 
+ *     return hashlib.sha256(tx_string.encode('utf-8')).digest()             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = NULL;
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_hashlib); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_sha256); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_tx_string == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "encode");
+    __PYX_ERR(0, 384, __pyx_L1_error)
+  }
+  __pyx_t_2 = PyUnicode_AsUTF8String(__pyx_v_tx_string); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = 1;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_7))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_7);
+    assert(__pyx_t_3);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_7, __pyx__function);
+    __pyx_t_6 = 0;
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
+    __pyx_t_5 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_7, __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+  }
+  __pyx_t_4 = __pyx_t_5;
+  __Pyx_INCREF(__pyx_t_4);
+  __pyx_t_6 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_digest, __pyx_callargs+__pyx_t_6, (1-__pyx_t_6) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 384, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+  }
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 384, __pyx_L1_error)
+  __pyx_r = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "cython_modules/block_utils.pyx":364
+ * 
+ * 
+ * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash as bytes for signing.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_tx_string);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14cython_modules_11block_utils_13fast_transaction_hash_bytes(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_12fast_transaction_hash_bytes, "fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp) -> bytes\n\nCalculate transaction hash as bytes for signing.\n\nArgs:\n    sender: Sender address\n    receiver: Receiver address\n    amount: Transaction amount\n    timestamp: Transaction timestamp\n    \nReturns:\n    Raw hash bytes (32 bytes)");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_13fast_transaction_hash_bytes = {"fast_transaction_hash_bytes", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_13fast_transaction_hash_bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_12fast_transaction_hash_bytes};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_13fast_transaction_hash_bytes(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_sender = 0;
+  PyObject *__pyx_v_receiver = 0;
+  double __pyx_v_amount;
+  double __pyx_v_timestamp;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[4] = {0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_sender,&__pyx_mstate_global->__pyx_n_u_receiver,&__pyx_mstate_global->__pyx_n_u_amount,&__pyx_mstate_global->__pyx_n_u_timestamp,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 364, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  4:
+        values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 364, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 364, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 364, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 364, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "fast_transaction_hash_bytes", 0) < (0)) __PYX_ERR(0, 364, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 4; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("fast_transaction_hash_bytes", 1, 4, 4, i); __PYX_ERR(0, 364, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 4)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 364, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 364, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 364, __pyx_L3_error)
+      values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 364, __pyx_L3_error)
+    }
+    __pyx_v_sender = ((PyObject*)values[0]);
+    __pyx_v_receiver = ((PyObject*)values[1]);
+    __pyx_v_amount = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_amount == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 364, __pyx_L3_error)
+    __pyx_v_timestamp = __Pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_timestamp == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 364, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("fast_transaction_hash_bytes", 1, 4, 4, __pyx_nargs); __PYX_ERR(0, 364, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_sender), (&PyUnicode_Type), 1, "sender", 1))) __PYX_ERR(0, 364, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_receiver), (&PyUnicode_Type), 1, "receiver", 1))) __PYX_ERR(0, 364, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_12fast_transaction_hash_bytes(__pyx_self, __pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14cython_modules_11block_utils_12fast_transaction_hash_bytes(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_sender, PyObject *__pyx_v_receiver, double __pyx_v_amount, double __pyx_v_timestamp) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("fast_transaction_hash_bytes", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_fast_transaction_hash_bytes(__pyx_v_sender, __pyx_v_receiver, __pyx_v_amount, __pyx_v_timestamp, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("cython_modules.block_utils.fast_transaction_hash_bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "cython_modules/block_utils.pyx":387
+ * 
+ * 
+ * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verify a segment of the blockchain for hash consistency.
+*/
+
+static PyObject *__pyx_pw_14cython_modules_11block_utils_15verify_chain_segment(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static int __pyx_f_14cython_modules_11block_utils_verify_chain_segment(PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, CYTHON_UNUSED int __pyx_skip_dispatch, struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment *__pyx_optional_args) {
+  int __pyx_v_start_index = ((int)1);
+  int __pyx_v_i;
+  int __pyx_v_length;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  long __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("verify_chain_segment", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_start_index = __pyx_optional_args->start_index;
+    }
+  }
+
+  /* "cython_modules/block_utils.pyx":400
+ *     """
+ *     cdef int i
+ *     cdef int length = len(hashes)             # <<<<<<<<<<<<<<
+ * 
+ *     if length != len(previous_hashes):
+*/
+  if (unlikely(__pyx_v_hashes == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 400, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_hashes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 400, __pyx_L1_error)
+  __pyx_v_length = __pyx_t_1;
+
+  /* "cython_modules/block_utils.pyx":402
+ *     cdef int length = len(hashes)
+ * 
+ *     if length != len(previous_hashes):             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+*/
+  if (unlikely(__pyx_v_previous_hashes == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 402, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyList_GET_SIZE(__pyx_v_previous_hashes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 402, __pyx_L1_error)
+  __pyx_t_2 = (__pyx_v_length != __pyx_t_1);
+  if (__pyx_t_2) {
+
+    /* "cython_modules/block_utils.pyx":403
+ * 
+ *     if length != len(previous_hashes):
+ *         return False             # <<<<<<<<<<<<<<
+ * 
+ *     for i in range(start_index, length):
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "cython_modules/block_utils.pyx":402
+ *     cdef int length = len(hashes)
+ * 
+ *     if length != len(previous_hashes):             # <<<<<<<<<<<<<<
+ *         return False
+ * 
+*/
+  }
+
+  /* "cython_modules/block_utils.pyx":405
+ *         return False
+ * 
+ *     for i in range(start_index, length):             # <<<<<<<<<<<<<<
+ *         if previous_hashes[i] != hashes[i - 1]:
+ *             return False
+*/
+  __pyx_t_3 = __pyx_v_length;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = __pyx_v_start_index; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "cython_modules/block_utils.pyx":406
+ * 
+ *     for i in range(start_index, length):
+ *         if previous_hashes[i] != hashes[i - 1]:             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+*/
+    if (unlikely(__pyx_v_previous_hashes == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 406, __pyx_L1_error)
+    }
+    if (unlikely(__pyx_v_hashes == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 406, __pyx_L1_error)
+    }
+    __pyx_t_6 = (__pyx_v_i - 1);
+    __pyx_t_7 = PyObject_RichCompare(__Pyx_PyList_GET_ITEM(__pyx_v_previous_hashes, __pyx_v_i), __Pyx_PyList_GET_ITEM(__pyx_v_hashes, __pyx_t_6), Py_NE); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 406, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 406, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (__pyx_t_2) {
+
+      /* "cython_modules/block_utils.pyx":407
+ *     for i in range(start_index, length):
+ *         if previous_hashes[i] != hashes[i - 1]:
+ *             return False             # <<<<<<<<<<<<<<
+ * 
+ *     return True
+*/
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "cython_modules/block_utils.pyx":406
+ * 
+ *     for i in range(start_index, length):
+ *         if previous_hashes[i] != hashes[i - 1]:             # <<<<<<<<<<<<<<
+ *             return False
+ * 
+*/
+    }
+  }
+
+  /* "cython_modules/block_utils.pyx":409
+ *             return False
+ * 
+ *     return True             # <<<<<<<<<<<<<<
+*/
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "cython_modules/block_utils.pyx":387
+ * 
+ * 
+ * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verify a segment of the blockchain for hash consistency.
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_14cython_modules_11block_utils_15verify_chain_segment(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_14cython_modules_11block_utils_14verify_chain_segment, "verify_chain_segment(list hashes, list previous_hashes, int start_index=1) -> bool\n\nVerify a segment of the blockchain for hash consistency.\n\nArgs:\n    hashes: List of block hashes\n    previous_hashes: List of previous_hash values\n    start_index: Starting index for verification\n    \nReturns:\n    True if chain segment is valid");
+static PyMethodDef __pyx_mdef_14cython_modules_11block_utils_15verify_chain_segment = {"verify_chain_segment", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_14cython_modules_11block_utils_15verify_chain_segment, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_14cython_modules_11block_utils_14verify_chain_segment};
+static PyObject *__pyx_pw_14cython_modules_11block_utils_15verify_chain_segment(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_hashes = 0;
+  PyObject *__pyx_v_previous_hashes = 0;
+  int __pyx_v_start_index;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("verify_chain_segment (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_hashes,&__pyx_mstate_global->__pyx_n_u_previous_hashes,&__pyx_mstate_global->__pyx_n_u_start_index,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 387, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 387, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 387, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 387, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "verify_chain_segment", 0) < (0)) __PYX_ERR(0, 387, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("verify_chain_segment", 0, 2, 3, i); __PYX_ERR(0, 387, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 387, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 387, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 387, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_hashes = ((PyObject*)values[0]);
+    __pyx_v_previous_hashes = ((PyObject*)values[1]);
+    if (values[2]) {
+      __pyx_v_start_index = __Pyx_PyLong_As_int(values[2]); if (unlikely((__pyx_v_start_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 387, __pyx_L3_error)
+    } else {
+      __pyx_v_start_index = ((int)1);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("verify_chain_segment", 0, 2, 3, __pyx_nargs); __PYX_ERR(0, 387, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_hashes), (&PyList_Type), 1, "hashes", 1))) __PYX_ERR(0, 387, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_hashes), (&PyList_Type), 1, "previous_hashes", 1))) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_r = __pyx_pf_14cython_modules_11block_utils_14verify_chain_segment(__pyx_self, __pyx_v_hashes, __pyx_v_previous_hashes, __pyx_v_start_index);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_14cython_modules_11block_utils_14verify_chain_segment(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_hashes, PyObject *__pyx_v_previous_hashes, int __pyx_v_start_index) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  struct __pyx_opt_args_14cython_modules_11block_utils_verify_chain_segment __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("verify_chain_segment", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.start_index = __pyx_v_start_index;
+  __pyx_t_1 = __pyx_f_14cython_modules_11block_utils_verify_chain_segment(__pyx_v_hashes, __pyx_v_previous_hashes, 1, &__pyx_t_2); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("cython_modules.block_utils.verify_chain_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyTypeObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  0, 0,
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyLongObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyLongObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  0, 0,
+  #else
+  sizeof(PyLongObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyLongObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(3, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_2_4(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyComplexObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  0, 0,
+  #else
+  sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(PyComplexObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(4, 16, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_block_utils(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_block_utils},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "block_utils",
+      __pyx_k_High_performance_block_utilitie, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit_block_utils(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_block_utils(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_block_utils(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  static uint32_t __pyx_t_3[64];
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'block_utils' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "block_utils" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    PyErr_Clear();
+    __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit_block_utils", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_cython_modules__block_utils) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "cython_modules.block_utils")) {
+      if (unlikely((PyDict_SetItemString(modules, "cython_modules.block_utils", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_function_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_type_init_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_function_import_code(__pyx_mstate);
+  /*--- Execution code ---*/
+
+  /* "cython_modules/block_utils.pyx":10
+ * """
+ * 
+ * import hashlib             # <<<<<<<<<<<<<<
+ * import json
+ * from cpython cimport bool
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_hashlib, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_hashlib, __pyx_t_2) < (0)) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":11
+ * 
+ * import hashlib
+ * import json             # <<<<<<<<<<<<<<
+ * from cpython cimport bool
+ * from libc.stdint cimport uint8_t, uint32_t, uint64_t
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_json, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_json, __pyx_t_2) < (0)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":22
+ * 
+ * cdef uint32_t[64] _K
+ * _K[:] = [             # <<<<<<<<<<<<<<
+ *     0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+ *     0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+*/
+  __pyx_t_3[0] = 0x428a2f98;
+  __pyx_t_3[1] = 0x71374491;
+  __pyx_t_3[2] = 0xb5c0fbcf;
+  __pyx_t_3[3] = 0xe9b5dba5;
+  __pyx_t_3[4] = 0x3956c25b;
+  __pyx_t_3[5] = 0x59f111f1;
+  __pyx_t_3[6] = 0x923f82a4;
+  __pyx_t_3[7] = 0xab1c5ed5;
+  __pyx_t_3[8] = 0xd807aa98;
+  __pyx_t_3[9] = 0x12835b01;
+  __pyx_t_3[10] = 0x243185be;
+  __pyx_t_3[11] = 0x550c7dc3;
+  __pyx_t_3[12] = 0x72be5d74;
+  __pyx_t_3[13] = 0x80deb1fe;
+  __pyx_t_3[14] = 0x9bdc06a7;
+  __pyx_t_3[15] = 0xc19bf174;
+  __pyx_t_3[16] = 0xe49b69c1;
+  __pyx_t_3[17] = 0xefbe4786;
+  __pyx_t_3[18] = 0x0fc19dc6;
+  __pyx_t_3[19] = 0x240ca1cc;
+  __pyx_t_3[20] = 0x2de92c6f;
+  __pyx_t_3[21] = 0x4a7484aa;
+  __pyx_t_3[22] = 0x5cb0a9dc;
+  __pyx_t_3[23] = 0x76f988da;
+  __pyx_t_3[24] = 0x983e5152;
+  __pyx_t_3[25] = 0xa831c66d;
+  __pyx_t_3[26] = 0xb00327c8;
+  __pyx_t_3[27] = 0xbf597fc7;
+  __pyx_t_3[28] = 0xc6e00bf3;
+  __pyx_t_3[29] = 0xd5a79147;
+  __pyx_t_3[30] = 0x06ca6351;
+  __pyx_t_3[31] = 0x14292967;
+  __pyx_t_3[32] = 0x27b70a85;
+  __pyx_t_3[33] = 0x2e1b2138;
+  __pyx_t_3[34] = 0x4d2c6dfc;
+  __pyx_t_3[35] = 0x53380d13;
+  __pyx_t_3[36] = 0x650a7354;
+  __pyx_t_3[37] = 0x766a0abb;
+  __pyx_t_3[38] = 0x81c2c92e;
+  __pyx_t_3[39] = 0x92722c85;
+  __pyx_t_3[40] = 0xa2bfe8a1;
+  __pyx_t_3[41] = 0xa81a664b;
+  __pyx_t_3[42] = 0xc24b8b70;
+  __pyx_t_3[43] = 0xc76c51a3;
+  __pyx_t_3[44] = 0xd192e819;
+  __pyx_t_3[45] = 0xd6990624;
+  __pyx_t_3[46] = 0xf40e3585;
+  __pyx_t_3[47] = 0x106aa070;
+  __pyx_t_3[48] = 0x19a4c116;
+  __pyx_t_3[49] = 0x1e376c08;
+  __pyx_t_3[50] = 0x2748774c;
+  __pyx_t_3[51] = 0x34b0bcb5;
+  __pyx_t_3[52] = 0x391c0cb3;
+  __pyx_t_3[53] = 0x4ed8aa4a;
+  __pyx_t_3[54] = 0x5b9cca4f;
+  __pyx_t_3[55] = 0x682e6ff3;
+  __pyx_t_3[56] = 0x748f82ee;
+  __pyx_t_3[57] = 0x78a5636f;
+  __pyx_t_3[58] = 0x84c87814;
+  __pyx_t_3[59] = 0x8cc70208;
+  __pyx_t_3[60] = 0x90befffa;
+  __pyx_t_3[61] = 0xa4506ceb;
+  __pyx_t_3[62] = 0xbef9a3f7;
+  __pyx_t_3[63] = 0xc67178f2;
+  memcpy(&(__pyx_v_14cython_modules_11block_utils__K[0]), __pyx_t_3, sizeof(__pyx_v_14cython_modules_11block_utils__K[0]) * (64));
+
+  /* "cython_modules/block_utils.pyx":160
+ * 
+ * 
+ * cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,             # <<<<<<<<<<<<<<
+ *                        long long max_attempts=0):
+ *     """
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_1find_nonce, 0, __pyx_mstate_global->__pyx_n_u_find_nonce, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_find_nonce, __pyx_t_2) < (0)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":217
+ * 
+ * 
+ * cpdef tuple split_block_header(object index, double timestamp, object data, str previous_hash):             # <<<<<<<<<<<<<<
+ *     """
+ *     Serialize a block header exactly as calculate_block_hash does and split
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_3split_block_header, 0, __pyx_mstate_global->__pyx_n_u_split_block_header, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_split_block_header, __pyx_t_2) < (0)) __PYX_ERR(0, 217, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":241
+ * 
+ * 
+ * cpdef tuple mine_block_nogil(object index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                              str previous_hash, int difficulty, long long start_nonce=0,
+ *                              long long max_attempts=0):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_5mine_block_nogil, 0, __pyx_mstate_global->__pyx_n_u_mine_block_nogil, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[0]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_mine_block_nogil, __pyx_t_2) < (0)) __PYX_ERR(0, 241, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":264
+ *     return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)
+ * 
+ * cpdef str calculate_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                                 str previous_hash, long nonce):
+ *     """
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_7calculate_block_hash, 0, __pyx_mstate_global->__pyx_n_u_calculate_block_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_calculate_block_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 264, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":290
+ * 
+ * 
+ * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                             str previous_hash, int difficulty, long start_nonce=0):
+ *     """
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_9mine_block_hash, 0, __pyx_mstate_global->__pyx_n_u_mine_block_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[1]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_mine_block_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":341
+ * 
+ * 
+ * cpdef str fast_transaction_hash(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash efficiently.
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_11fast_transaction_hash, 0, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[5])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash, __pyx_t_2) < (0)) __PYX_ERR(0, 341, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":364
+ * 
+ * 
+ * cpdef bytes fast_transaction_hash_bytes(str sender, str receiver, double amount, double timestamp):             # <<<<<<<<<<<<<<
+ *     """
+ *     Calculate transaction hash as bytes for signing.
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_13fast_transaction_hash_bytes, 0, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash_bytes, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[6])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_fast_transaction_hash_bytes, __pyx_t_2) < (0)) __PYX_ERR(0, 364, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":387
+ * 
+ * 
+ * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verify a segment of the blockchain for hash consistency.
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_14cython_modules_11block_utils_15verify_chain_segment, 0, __pyx_mstate_global->__pyx_n_u_verify_chain_segment, NULL, __pyx_mstate_global->__pyx_n_u_cython_modules_block_utils, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[7])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_mstate_global->__pyx_tuple[2]);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_verify_chain_segment, __pyx_t_2) < (0)) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "cython_modules/block_utils.pyx":1
+ * # cython: language_level=3             # <<<<<<<<<<<<<<
+ * # cython: boundscheck=False
+ * # cython: wraparound=False
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init cython_modules.block_utils", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init cython_modules.block_utils");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+
+  /* Cached unbound methods */
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.method_name = &__pyx_mstate->__pyx_n_u_items;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
+  __pyx_mstate->__pyx_umethod_PyUnicode_Type__rindex.type = (PyObject*)(&PyUnicode_Type);
+  __pyx_mstate->__pyx_umethod_PyUnicode_Type__rindex.method_name = &__pyx_mstate->__pyx_n_u_rindex;
+  return 0;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "cython_modules/block_utils.pyx":160
+ * 
+ * 
+ * cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,             # <<<<<<<<<<<<<<
+ *                        long long max_attempts=0):
+ *     """
+*/
+  __pyx_mstate_global->__pyx_tuple[0] = PyTuple_Pack(2, __pyx_mstate_global->__pyx_int_0, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_mstate_global->__pyx_tuple[0])) __PYX_ERR(0, 160, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[0]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[0]);
+
+  /* "cython_modules/block_utils.pyx":290
+ * 
+ * 
+ * cpdef tuple mine_block_hash(int index, double timestamp, object data,             # <<<<<<<<<<<<<<
+ *                             str previous_hash, int difficulty, long start_nonce=0):
+ *     """
+*/
+  __pyx_mstate_global->__pyx_tuple[1] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_int_0); if (unlikely(!__pyx_mstate_global->__pyx_tuple[1])) __PYX_ERR(0, 290, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[1]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[1]);
+
+  /* "cython_modules/block_utils.pyx":387
+ * 
+ * 
+ * cpdef bint verify_chain_segment(list hashes, list previous_hashes, int start_index=1):             # <<<<<<<<<<<<<<
+ *     """
+ *     Verify a segment of the blockchain for hash consistency.
+*/
+  __pyx_mstate_global->__pyx_tuple[2] = PyTuple_Pack(1, __pyx_mstate_global->__pyx_int_1); if (unlikely(!__pyx_mstate_global->__pyx_tuple[2])) __PYX_ERR(0, 387, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_mstate_global->__pyx_tuple[2]);
+  __Pyx_GIVEREF(__pyx_mstate_global->__pyx_tuple[2]);
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_tuple;
+    for (Py_ssize_t i=0; i<3; ++i) {
+      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+      }
+      #else
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 8; } index[] = {{1},{1},{179},{8},{30},{5},{20},{6},{18},{20},{18},{26},{4},{10},{6},{5},{6},{21},{27},{8},{6},{7},{9},{5},{13},{5},{4},{8},{15},{10},{8},{5},{3},{13},{15},{12},{8},{6},{12},{10},{6},{9},{11},{11},{8},{9},{6},{20},{64},{155},{82},{59},{59}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (805 bytes) */
-const char* const cstring = "BZh91AY&SYDT\244\311\000\000w\377\377\367\374\377\363\370\247\377\342\257\265\177\200\277\377\377\370@@@@@@@@@\000@@@\000@\000@\002\234\212\314J\306\032\201\032S\305=\0325=O@F\217Ph\3204\000\003L\206\206\201\240\321\246\236\243Ch\322\rA\251\246\231\020\364M!\246OHh\000\000\000\000\000\000\000\000\000\340\000h44\032\0004\31042\006\232\000\0002\0002\003 \000\323D4\220\325<\236\232L\324#G\250\000\006 \310\320\001\220\000\000d=\t\246\324\242Y\370\2239\267\374[\231\023qr\022\233\274\010\224\242oe\023{\343*W5@H@\026j\355\232P\260\004X\241B\345\261\200\261\r\344\024\202\n\r\002\300<\231\203D*\006\210\313\306r8]@\321\016B\2421\274\277 \327\203z\327\346\302?N\237t_@\376e\223\231UWw\037 \030\007N\016[\231\252\022\232\tefY,r\212\357\341h\206`|1_\226\267BH\260\230\243\201u\3251\016\274\231F\222\252\016\371\212\232U\273\224\244\200\304\224\22019\366y-F8J\351\300`\361f\314\202\200\372B\n\371\024\021\014Q\236I\226fY=\263\024\210P\274\222\030\200X\027\024Wo\367lsg\272\361\250\372\337\305%\025\223>\223A\001\000\010a\t\010C\210U\nJ&{\206z8\274\036\036.\266y\030\345\273\201\004|\020\n\230\242O@\320\240\261\"l\323Z\205f\025\204\366O\244\347\314SLJ2\233\032*1\323\032h\224tT\037D\347\275\243\014J\326O\210T\030\242z\312 \2414\340\250\032t3\024UY\251\027\034\3773\253\375[\276\344hc\321[\304C\037J\352a\2650\214UH#\t\n\207\000\333\277M\365\"B\2624E\2458ha\212\225K\005\0349\325\023\3207\246\202$SIH\346\302\025\001\200)\220Y:\246|X\006\211\211\261b\244\200A\354T\357\001\306y\231\201x\2438\246t\005\251\301L\002t\246e\007( \036\021+\341\344\325<\370\037\026\001\204\"t0\254W\216\245\255x\004\206;\323\242`y\350A\345A\324\222\215\006\242s\024\242@\222\rd\213\020\220hj\324&f?\263&\010\2504r\024ZC\000[\024n\010\025\021)v\250\262\300\232\236\325\332\256\000\223 &8\022\024\026w\302\214\362T\010\232\317\267\302\252.\320\314B+,\316h@\245A\247p\346\220`\n\326\253\017-$\301-\3756\026\305\22772u\213a\232\274\226\001*\324\301\3341+\020\240\006\370a\360\002\002Y\036\345\363'\240\272P-Y\355\006\244=\232\212""\251-\213C\305\312e\001\273\227\"\201\301w\367\276\032\3620\341\027\357\t\220\314{\226\200\205\320\355\210\247\340\031u#\253\022S=\373r\324\010\210\030\206S\030\333B\210\314\001\201\203\211V\356`\222\203:H\304\264\262\301(\377\213\271\"\234(H\"*Rd\200";
-    PyObject *data = __Pyx_DecompressString(cstring, 805, 2);
+    const struct { const unsigned int length: 8; } index[] = {{1},{1},{179},{8},{30},{35},{29},{9},{5},{20},{6},{18},{20},{18},{26},{4},{10},{6},{5},{6},{21},{27},{10},{8},{6},{7},{3},{9},{5},{13},{5},{4},{8},{12},{15},{16},{10},{8},{5},{3},{6},{13},{15},{12},{8},{6},{6},{12},{10},{6},{9},{18},{11},{11},{6},{8},{9},{6},{20},{64},{155},{82},{59},{59},{45},{253},{100}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1143 bytes) */
+const char* const cstring = "BZh91AY&SY\260\316.\275\000\000\326\177\377\377\377\377\377\377\247\377\362\277\265\177\260\277\377\377\374@@@@@@@@@\000@@@\000@\000P\003\3142\320\325%1\353\241\251\351\024\023M4\032\000`M\000\032\000\000\000\320\r\000\r4\032\000\365\014i\251\240h\211\204d\324\301C\304jm(\323M\000h\001\246\200\000\365\r4\000\000\000h\000\006\232\020\021\032\236\2056\223i\251\224oP\230L\t\210i\243CA\200L\214\230\230&L#&\312d\323\3248\000\000\001\240\000\000\006\200\032\000\001\240\000\006\200\000\000\003 \000\000\000\003@\r\032\000\000\000\000\000\000\000\000\032\001\363\311\017\243[\301#\0063\307\004\2724(\251\267\022\221*,\005\260A\001\333\265\323\000S\004\222\021r\"\017~\330\250\2543\t\001\231\035\354\225b\204\240$\000\221v\253\3029\345\224\200a\"\2003\032\325\205\347\\V@21\276\252\023t\204\315\021\356\300\010d)\251\244\250\254\242\223\002\013Gth\014X\035\003\230:\213\205cp\026\t\271\212\\\220\014%X\271,!5\275\271\377/\213\322\336?g\365\365C_\237\t\371}\234\351{\266\236\313a\007\033T\253,c\206\315<w\013\000\306\020\005\251O\305\302\235\270`XY\337f!\210DJ\377|\243\214\270\272\212`\270\374\325B\275*\021q\213\351\300;{\210O\002MduD>\010P\355k\315\326\326VQv\rx@\214D\327\214\251\013\272j\024\007\026,\353\277g\017\232N\342,\315\252\356\257\312\317\335\2167\020\025\266yUC\002\220\027\367\314\221\001[\363\253*\230\022\243\321\346/\265c\367\020C7!\2541=wg\030\275\250(\020\311\317\032\232l\25331\214\246b\221\013\017\221\331T9\000\260.)_\356\243\205d\366\245w/\313\356\300\234y\313@\371\356\016\035\000\366\351\211\007|\217\027\311\033\267\231\302oAS\240\344\3064\277\302j\007\203+\266\357q\271)\310\252\210\036PG\326\031^\025\264DLi\260\316\333\313\306\032\207;\233\253v\245\361r\232\353\260\257\024\215\203\0266\335l\013q\256d\206\024\233\347\036\330b\217\373\263\220J\330Q\236d\331\030\034\305.\020\010X\311\200F\366\240\344\343\207g\306O\201>0c\353\2073bZ\030b\340\375\003\001}\210b\"\257\240n\346\230\255\240F!T\251Q\237\032\243!\326\330\324\036\254\267\214\241LW\030\250\306A\006%\211\264I\020""\303:\013\021>\366\2635f\341\246\212vn\"m\250\023\316e-g\322\206P\222\nd\213-=Z\207M9`\266\t\nQN,*\331\226\212H\004\036\016JQ\320h\224\304\324\204\251F\227$\024\327,),\242V\004\334j\245\225\322\276AAd\031\254\nN\310\346\215\205\210I\020d\264:\211q\270\264j\276\333KI6\3123\210\331L(2R\251\234 X\203bUJ\n\263\021XY\3011\007\272\246\211b\013pr\020ERv\272\215QY\006\244\033\355Qj\020\372\014\332\032\315\212b\005\204Jb\307\006W&\351O\005\370p\200\310\241\261\310\220\261\031\260,\224\225\322\267\2441\222\345\207\355\301\207\221\372\004\364\004h4\n\345\224$`\241\3071S51AI0\223%M\301\202c\225\001s\354P\033\0149\366\317v\215\376\034\316\347\270O\254]\177\002L+\205]r\332\311\230%\210\034\212\005J\026\232\375\255\220)\351\264\255\317\000|P\214\321f\342\353\272\272\002\025\017\"f\216\252KAA\021q\325\245\3523\245'\265\255;n\0251W\276a\331\023b\215Hh\205\205P\207\316\252\010a\250\202\"\017\250\242x\337\211\2132`\324\243<-\311\332\361\203\250\360\204#\024aw\nT\033\r\362\206\335\017@\3228\t0\263\347\2056\276\370\n\342\t\013\360@\004\203?Qm\317\034\006x/\314\232\366\000l@\014\254M\267\331t^\301\375{\367\006\266>h\217+\327[.x\312j\335\324\002_\003\242B\006\006,\0060-\222V\301\2647\373\340\035\014\243$[\247J,\313E\310s\267\316Q\n\322\224\2320/\025%\315\033l\251\354_\257\361w$S\205\t\013\014\342\353\320";
+    PyObject *data = __Pyx_DecompressString(cstring, 1143, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (715 bytes) */
-const char* const cstring = "x\332\235\221\317O\023A\024\307\251\241X\204\004*\277\224D\231\342\2411\221*\212\202\007C\210 \321\030\002\342\217\343d:\373\332\016\354\316\264;\263\330\305\013\307\036\347\270\307=\366\310\221\243\177\002\307=\366O\350\237\340\233\226($zq\223}\363v\346\275\357\373|w6\237\355)\003\3044\230!oc\323P\222\010M<\360E\025Bf\300\217\2116\241\340\006BW$\311\376\316\376\312\332\306\032a\322#!\034\0017\232\350\250\312}\2465h\242j\244\032\t\337\010IL\334\004]!\357k$V\021\221\000\0361\2124\261\356z\203i\200$\032\214KH\231I\251\0143BI\212\355B\326\313\304\023!\016\021'\340\272\3371_C\205y\036\305:\340\003`\032(/\362A?\255\372\212\037\323\310\010_W\232q;2\265\225\rJ\367\3436\276\333h\201\356A\333|\202\032\013T$\r\323\261\344BU\270\n\025\366H\320\234\371<\362\3214\035*5\230np\037O\250@\234\220q\2502~|sh\345\332P\217\031\346\211ZM\240\212\211=Q\007m\274(hj\220\\y8W\033'#5\343\003\207N\377\257\233\264\032\033\320\224\326\"\311\351`\007\264\213x)\rh\017\205\205\364\240M\205\246\277\371\205\201@\037i\324\240\001\023.:\364?V\350\0253\305G\262\000W\251$\207\246j6C8\021*\322\203\262\033\037\216\242\0251\177X\217\027\001x\021!\032\362 \244\024\257\355J\t3g\020}#\350\363\227\257\264\n\r=\206Xk\3030\033\300\016\323\301LJ\321\237\301(\002\\Y\320<a~\004\032\245E-\246\274\341\3605\324\003\220\346,\327\1778\222\177\220l\247c)\313\nE[\314\ns\366 +L\333\\V\270\237\024\207{\2671\364F':\353\266\234\024\223'i\275{\320\025\347\247?\213g\271l\377\240OF\362\013\226\365F\347\255\227,'[\375;#\371\261\177\212\365\307\006\247\363\226\331\037i\311U|Kv\323\325lr\332\216Yv\271PNO\317\347\316\353\027\007\027,\033\237\261\253X?^t\002\223\235\035;\207]\255lr\252s\212\034\217\222\3034\227M\337K0\024{\205\211\016\212\314\332\217i\256\347\346\\\216,].\035^\036~\356/:<\216\r\245\336\350\355\263\357\035ng\354\226\343\232\352\264z\243\205N\276\363\305\226\354\033\324B\215\315\244\224\274Hx:\237\266\272\267\272\313\335\255l\022!\234\371U\374Y(\265\230\314&_\221\267p\327\"\375\254\335\272\312\234\323\233\377\351q\272""\336-u_\237\357^\374w\353\207\013\366\013\227\232\240n";
-    PyObject *data = __Pyx_DecompressString(cstring, 715, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1064 bytes) */
+const char* const cstring = "x\332\235\222\317O\033G\024\307\355\324\306\2068\005'@\010I\312\330i\260*\005\007\247@\322HUD\nD\251\252\010\2076(\275\214\306\273c{`\275k{f\211\r=p\334\343\034\347\270\307=\356\321G\376\004\037\367\350?\301\177B\337,\020@j{\250\265\236\235\235y?\276\357\363\336\233\325\017\216\240H4\211@\277\364E\323\261\021\343\310\244\026\253\321.\021\324\352#.\272\314\020\264\253\215l\264\273\275\273\262\366j\r\021\333D]z@\r\301\021wk\206E8\247\0349uTs\231%\230\215D\277My\031\275\257\243\276\343\"\233R\023\t\007\265\301\356\272\203hR\033q*\364\006\225\210m;\202\010\346\330\030\334\231\335(!\223u!\t;\242\332{\207X\234\226\211ib\260\243F,\030\267\034\323\265(\177^\263\034\343\020\273\202Y\274\334\356\367LV\2573\303\265D\037\265\\.P\215\302#\276P\310\267\032\313\337X+\332\216m\320\342k\264\372\014\025\333]z\304\034\227\343&\341M8\373z\351\212\372\312+\214w\373=\370o\001\013\374\201\366\304GZ'-\307\265\005\341}\333`N\331p\272\016$\267)7\210\005y\201\036>\227\244\003\032\026\334`\006uu\211Ak\3048\274\251\276|M\275I\004\271Ro\262\006\345\302t[mNm\3031!/\027:\214\315\211\021\243\322\361\377\361\020\327\372\202\362:\2635/(\006\343\272k\0338\276\243\\\257\320\347&\355\301s\236\005,i\0173\216\277\026\303\004m\361\003\016\001q\213\260x\355a\"\340\264-xK\327tU\343\265O\333i0\013_\024\207\341g\223\026\274c\025m\247\r\254\353\254w\203\370\215\017\3121\356\270\304:\367\202\001\2400\000\335n,\017(\230\264\2131\014\315ET\330i*\000\013jz\261\276\301\235\256\300\207\264\317y\333b\342R %\340\306\005\201\273\3638\3616V\304]\200\335\303\030`\tXY\013\336\244\325>\"\226K9$f\365>6\232\272|N\033-j\213\323\344\370\273D\372\261\332\362'|\022e\3632\037e\347d5\312\316\310d\224}\240\362\347g\031XF\251\333\336KYRy\365\314o\004\325\200\205\307g\371\323d\264[\035\243D\372\276$\243\324\2744UQm\216\247\022\351\211\177\r6\236\210o\347%\221'~A[\354\253w~%\312\315\310\tI\206\367K\376q8\0276\006\325\001\211&\357\311\n\330O\346u\200\234\267-\347\300\253\023\345\246\275c\320\361D\355\371\311hfA\301\222\037eo{\020dV\376""\346'G:\3170\2614\\\332\033\356\375>^\324\362\014p(\214R\231\323/\236!\357\311M\255k\332\353\214RY/\355\375!\013\362g\210\0051\336\250\202\372Q\031\376\274\337\tn\005\305`3\312\201\010]|\005`A\250E5\253>\201\336\354]\t\352g\345\346\305NWz\223\323\017\376\313\240\020\374\024\276\033\374o\327_\007\004\020\177\332\217\326\326\307\337'\322w\274\367\303\271\022(\313\004'\203\345\263d\004\016\257eU6U\323\267\302\225Ag\230\370<\374\374gT~>^M\244\037\251J\224z:|\272\036V\257\336\21754?\177m\263\244\376\n^\004p5\257{\2309=\221E\371\026x=\364\337\352\231\370\326;PI\225\037MN\305\222!\0339\357^GM(+(\214\300\242\005\310j\3767\376Fp7\200&,\250;~U\017I\224\203\372dEnCI\313\3007\267\010t+j\333\177\250\271^~<\322\206\017t\177\324:4/7=\234F m!\310_67\312\001\"\255M@\217\263\361\240D\251\234\267\351\355\313\035\230\270-?\345o\005I\200<\243[m\306\271\376s\230\307\331xd\243\324\"\330f\000h6\274\025>\t\253!\020\310y;@`KeT\307\237\n\226\303d8\033~\014\371\240t\226?+\374\r\371qn\212";
+    PyObject *data = __Pyx_DecompressString(cstring, 1064, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (1092 bytes) */
-const char* const bytes = "?0Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.add_notecython_modules/block_utils.pyxutf-8__Pyx_PyDict_NextRefamountasyncio.coroutinescalculate_block_hashcline_in_tracebackcython_modules.block_utilsdatadifficultydigestdumpsencodefast_transaction_hashfast_transaction_hash_bytes__func__hasheshashlibhexdigestindex_is_coroutineitemsjson__main__mine_block_hash__module____name__noncepopprevious_hashprevious_hashes__qualname__receiversender__set_name__setdefaultsha256sort_keysstart_indexstart_nonce__test__timestampvaluesverify_chain_segment\200\001\360\036\000\005\035\230D\240\006\240a\330\010\021\220\021\330\010\025\220Q\330\010\020\220\001\330\010\031\230\021\330\010\021\220\021\330\007\021\220\021\340\004\013\2107\220'\230\021\230,\240g\250Q\250i\260z\300\021\200\001\330PQ\360 \000\005\027\220a\340\004\026\220d\230\"\230A\360\n\000\005\006\330\010\021\220\021\330\010\025\220Q\330\010\020\220\001\330\010\031\230\021\330\010\021\220\021\360\006\000\005\006\330\010\026\220a\220{\240!\330\010\025\220W\230G\2401\330\014\020\220\006\220a\320\027'\240z\260\025\260g\270Q\270a\330\t\023\2201\360\006\000\t\021\220\001\330\010\014\210E\220\025\220a\220q\330\014\017\210z\230\021\230#\230S\240\001\330\020\030\230\001\330\020\021\340\010\013\2101\330\014\024\220L\240\001\340\010\021\220\021\320\000\037\320\037S\320ST\360\032\000\005\027\220c\230\021\230!\340\004\007\200w\210c\220\023\220A\220Q\330\010\017\210q\340\004\010\210\005\210U\220!\220=\240\001\330\010\013\210?\230!\2303\230c\240\026\240q\250\002\250\"\250A\330\014\023\2201\340\004\013\2101\200\001\360\032\000\005\032\230\024\230V\2401\330\010\022\220!\330\010\024\220A\330\010\022\220!\330\010\025\220Q\330\007\021\220\021\340\004\013\2107\220'\230\021\230)\2407\250!\2509\260G\2701\200\001\360\032\000\005\032\230\024\230V\2401\330\010\022\220!\330\010\024\220A\330\010\022\220!\330\010\025\220Q""\330\007\021\220\021\340\004\013\2107\220'\230\021\230)\2407\250!\2509\260J\270a";
+    #else /* compression: none (1640 bytes) */
+const char* const bytes = "?0Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.add_notecython_modules/block_utils.pyxdifficulty must be between 0 and 64\"nonce\": 0, \"previous_hash\": \"nonce\": utf-8__Pyx_PyDict_NextRefamountasyncio.coroutinescalculate_block_hashcline_in_tracebackcython_modules.block_utilsdatadifficultydigestdumpsencodefast_transaction_hashfast_transaction_hash_bytesfind_nonce__func__hasheshashlibhexhexdigestindex_is_coroutineitemsjson__main__max_attemptsmine_block_hashmine_block_nogil__module____name__noncepopprefixprevious_hashprevious_hashes__qualname__receiverrindexsender__set_name__setdefaultsha256sort_keyssplit_block_headerstart_indexstart_noncesuffix__test__timestampvaluesverify_chain_segment\200\001\360\036\000\005\035\230D\240\006\240a\330\010\021\220\021\330\010\025\220Q\330\010\020\220\001\330\010\031\230\021\330\010\021\220\021\330\007\021\220\021\340\004\013\2107\220'\230\021\230,\240g\250Q\250i\260z\300\021\200\001\330PQ\360 \000\005\027\220a\340\004\026\220d\230\"\230A\360\n\000\005\006\330\010\021\220\021\330\010\025\220Q\330\010\020\220\001\330\010\031\230\021\330\010\021\220\021\360\006\000\005\006\330\010\026\220a\220{\240!\330\010\025\220W\230G\2401\330\014\020\220\006\220a\320\027'\240z\260\025\260g\270Q\270a\330\t\023\2201\360\006\000\t\021\220\001\330\010\014\210E\220\025\220a\220q\330\014\017\210z\230\021\230#\230S\240\001\330\020\030\230\001\330\020\021\340\010\013\2101\330\014\024\220L\240\001\340\010\021\220\021\320\000\037\320\037S\320ST\360\032\000\005\027\220c\230\021\230!\340\004\007\200w\210c\220\023\220A\220Q\330\010\017\210q\340\004\010\210\005\210U\220!\220=\240\001\330\010\013\210?\230!\2303\230c\240\026\240q\250\002\250\"\250A\330\014\023\2201\340\004\013\2101\200\001\360\032\000\005\032\230\024\230V\2401\330\010\022\220!\330\010\024\220A\330\010\022\220!\330\010\025\220Q\330\007\021\220\021\340\004\013\2107""\220'\230\021\230)\2407\250!\2509\260G\2701\200\001\360\032\000\005\032\230\024\230V\2401\330\010\022\220!\330\010\024\220A\330\010\022\220!\330\010\025\220Q\330\007\021\220\021\340\004\013\2107\220'\230\021\230)\2407\250!\2509\260J\270a\200\001\330VW\33045\360$\000\005\r\210I\320\025'\240q\250\007\250{\270&\300\001\330\004\013\210:\220Q\220h\230h\240l\260-\270q\320\000Y\320YZ\330./\3600\000\005\034\2301\330\004%\320%5\260Q\330\004%\320%5\260Q\330\004\035\230S\240\001\240\021\330\004\035\230S\240\001\240\021\330\004\037\230|\2502\250Q\330\004\026\220a\340\004\007\200{\220\"\220B\220c\230\033\240B\240a\330\010\016\210j\230\001\230\021\340\t\n\330\010\024\220A\220Q\220a\330\010\026\220a\220q\230\006\230l\250!\340\010\016\210m\2303\230b\240\003\2406\250\022\2501\330\014\030\230\r\240Q\240g\250Q\330\014\022\220!\2201\220E\230\021\230&\240\001\330\014\032\230!\2301\230E\240\033\250A\330\014\032\230!\2301\230E\240\034\250Q\330\014\031\230\021\230!\2305\240\001\340\014\017\320\017 \240\001\240\030\250\021\330\020\030\230\001\330\020\021\330\014\025\220Q\340\004\007\200t\2101\330\010\020\220\006\220a\330\004\014\210A\210W\220F\230\"\230D\240\004\240D\250\001\200\001\360\020\000\005\027\220d\230&\240\001\330\010\021\220\021\330\010\025\220Q\330\010\020\220\001\330\010\031\230\021\330\010\021\220\021\330\007\021\220\021\360\010\000\005\027\220a\330\004\032\230&\240\007\240q\250\010\260\002\260#\260Q\260a\340\004\014\210F\220\"\220D\230\007\230q\240\n\250&\260\001\260\024\260R\260s\270'\300\021\300!";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 48; i++) {
+    for (int i = 0; i < 59; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
-      if (likely(string) && i >= 6) PyUnicode_InternInPlace(&string);
+      if (likely(string) && i >= 9) PyUnicode_InternInPlace(&string);
       if (unlikely(!string)) {
         Py_XDECREF(data);
         __PYX_ERR(0, 1, __pyx_L1_error)
@@ -5727,7 +8326,7 @@ const char* const bytes = "?0Note that Cython is deliberately stricter than PEP-
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 48; i < 53; i++) {
+    for (int i = 59; i < 67; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -5738,15 +8337,15 @@ const char* const bytes = "?0Note that Cython is deliberately stricter than PEP-
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 53; i++) {
+    for (Py_ssize_t i = 0; i < 67; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 48;
-      for (Py_ssize_t i=0; i<5; ++i) {
+      PyObject **table = stringtab + 59;
+      for (Py_ssize_t i=0; i<8; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         #if PY_VERSION_HEX < 0x030E0000
         if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
@@ -5801,7 +8400,7 @@ typedef struct {
     unsigned int num_kwonly_args : 1;
     unsigned int nlocals : 3;
     unsigned int flags : 10;
-    unsigned int first_line : 8;
+    unsigned int first_line : 9;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -5818,317 +8417,121 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
   PyObject* tuple_dedup_map = PyDict_New();
   if (unlikely(!tuple_dedup_map)) return -1;
   {
-    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 14};
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 160};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_prefix, __pyx_mstate->__pyx_n_u_suffix, __pyx_mstate->__pyx_n_u_difficulty, __pyx_mstate->__pyx_n_u_start_nonce, __pyx_mstate->__pyx_n_u_max_attempts};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_find_nonce, __pyx_mstate->__pyx_kp_b_iso88591_YYZ_0_1_5Q_5Q_S_S_2Q_a_Bc_Ba_j, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 217};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_index, __pyx_mstate->__pyx_n_u_timestamp, __pyx_mstate->__pyx_n_u_data, __pyx_mstate->__pyx_n_u_previous_hash};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_split_block_header, __pyx_mstate->__pyx_kp_b_iso88591_d_Q_a_q_Qa_F_D_q_Rs, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 7, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 241};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_index, __pyx_mstate->__pyx_n_u_timestamp, __pyx_mstate->__pyx_n_u_data, __pyx_mstate->__pyx_n_u_previous_hash, __pyx_mstate->__pyx_n_u_difficulty, __pyx_mstate->__pyx_n_u_start_nonce, __pyx_mstate->__pyx_n_u_max_attempts};
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_mine_block_nogil, __pyx_mstate->__pyx_kp_b_iso88591_VW45_I_q_Qhhl_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {5, 0, 0, 5, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 264};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_index, __pyx_mstate->__pyx_n_u_timestamp, __pyx_mstate->__pyx_n_u_data, __pyx_mstate->__pyx_n_u_previous_hash, __pyx_mstate->__pyx_n_u_nonce};
-    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_calculate_block_hash, __pyx_mstate->__pyx_kp_b_iso88591_D_a_Q_7_gQiz, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_calculate_block_hash, __pyx_mstate->__pyx_kp_b_iso88591_D_a_Q_7_gQiz, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 40};
+    const __Pyx_PyCode_New_function_description descr = {6, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 290};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_index, __pyx_mstate->__pyx_n_u_timestamp, __pyx_mstate->__pyx_n_u_data, __pyx_mstate->__pyx_n_u_previous_hash, __pyx_mstate->__pyx_n_u_difficulty, __pyx_mstate->__pyx_n_u_start_nonce};
-    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_mine_block_hash, __pyx_mstate->__pyx_kp_b_iso88591_PQ_a_d_A_Q_a_WG1_a_z_gQa_1_E_aq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_mine_block_hash, __pyx_mstate->__pyx_kp_b_iso88591_PQ_a_d_A_Q_a_WG1_a_z_gQa_1_E_aq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 91};
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 341};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_sender, __pyx_mstate->__pyx_n_u_receiver, __pyx_mstate->__pyx_n_u_amount, __pyx_mstate->__pyx_n_u_timestamp};
-    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_fast_transaction_hash, __pyx_mstate->__pyx_kp_b_iso88591_V1_A_Q_7_7_9Ja, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[5] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_fast_transaction_hash, __pyx_mstate->__pyx_kp_b_iso88591_V1_A_Q_7_7_9Ja, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[5])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 114};
+    const __Pyx_PyCode_New_function_description descr = {4, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 364};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_sender, __pyx_mstate->__pyx_n_u_receiver, __pyx_mstate->__pyx_n_u_amount, __pyx_mstate->__pyx_n_u_timestamp};
-    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_fast_transaction_hash_bytes, __pyx_mstate->__pyx_kp_b_iso88591_V1_A_Q_7_7_9G1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[6] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_fast_transaction_hash_bytes, __pyx_mstate->__pyx_kp_b_iso88591_V1_A_Q_7_7_9G1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[6])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 137};
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 387};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_hashes, __pyx_mstate->__pyx_n_u_previous_hashes, __pyx_mstate->__pyx_n_u_start_index};
-    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_verify_chain_segment, __pyx_mstate->__pyx_kp_b_iso88591_SST_c_wc_AQ_q_U_3c_q_A_1_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[7] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_cython_modules_block_utils_pyx, __pyx_mstate->__pyx_n_u_verify_chain_segment, __pyx_mstate->__pyx_kp_b_iso88591_SST_c_wc_AQ_q_U_3c_q_A_1_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[7])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
   bad:
-  Py_DECREF(tuple_dedup_map);
-  return -1;
-}
-/* #### Code section: init_globals ### */
-
-static int __Pyx_InitGlobals(void) {
-  /* PythonCompatibility.init */
-  if (likely(__Pyx_init_co_variables() == 0)); else
-  
-  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
-
-  /* CommonTypesMetaclass.init */
-  if (likely(__pyx_CommonTypesMetaclass_init(__pyx_m) == 0)); else
-  
-  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
-
-  /* CachedMethodType.init */
-  #if CYTHON_COMPILING_IN_LIMITED_API
-  {
-      PyObject *typesModule=NULL;
-      typesModule = PyImport_ImportModule("types");
-      if (typesModule) {
-          __pyx_mstate_global->__Pyx_CachedMethodType = PyObject_GetAttrString(typesModule, "MethodType");
-          Py_DECREF(typesModule);
-      }
-  } // error handling follows
-  #endif
-  
-  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
-
-  /* CythonFunctionShared.init */
-  if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
-  
-  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
-
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-/* #### Code section: cleanup_globals ### */
-/* #### Code section: cleanup_module ### */
-/* #### Code section: main_method ### */
-/* #### Code section: utility_code_pragmas ### */
-#ifdef _MSC_VER
-#pragma warning( push )
-/* Warning 4127: conditional expression is constant
- * Cython uses constant conditional expressions to allow in inline functions to be optimized at
- * compile-time, so this warning is not useful
- */
-#pragma warning( disable : 4127 )
-#endif
-
-
-
-/* #### Code section: utility_code_def ### */
-
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule(modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, "RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
-}
-#endif
-
-/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    int result;
-    PyObject *exc_type;
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *current_exception = tstate->current_exception;
-    if (unlikely(!current_exception)) return 0;
-    exc_type = (PyObject*) Py_TYPE(current_exception);
-    if (exc_type == err) return 1;
-#else
-    exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
-#endif
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_INCREF(exc_type);
-    #endif
-    if (unlikely(PyTuple_Check(err))) {
-        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
-    } else {
-        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
-    }
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_DECREF(exc_type);
-    #endif
-    return result;
-}
-#endif
-
-/* PyErrFetchRestore (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *tmp_value;
-    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
-    if (value) {
-        #if CYTHON_COMPILING_IN_CPYTHON
-        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
-        #endif
-            PyException_SetTraceback(value, tb);
-    }
-    tmp_value = tstate->current_exception;
-    tstate->current_exception = value;
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-#else
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#endif
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject* exc_value;
-    exc_value = tstate->current_exception;
-    tstate->current_exception = 0;
-    *value = exc_value;
-    *type = NULL;
-    *tb = NULL;
-    if (exc_value) {
-        *type = (PyObject*) Py_TYPE(exc_value);
-        Py_INCREF(*type);
-        #if CYTHON_COMPILING_IN_CPYTHON
-        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
-        Py_XINCREF(*tb);
-        #else
-        *tb = PyException_GetTraceback(exc_value);
-        #endif
-    }
-#else
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#endif
-}
-#endif
-
-/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-    return PyObject_GetAttr(obj, attr_name);
+  Py_DECREF(tuple_dedup_map);
+  return -1;
 }
-#endif
+/* #### Code section: init_globals ### */
 
-/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
-static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
-}
-#endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
-    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
-    return result;
-#else
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
-    }
-#endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
-    }
-    return result;
-#endif
-}
+static int __Pyx_InitGlobals(void) {
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
 
-/* GetBuiltinName (used by GetModuleGlobalName) */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
-    if (unlikely(!result) && !PyErr_Occurred()) {
-        PyErr_Format(PyExc_NameError,
-            "name '%U' is not defined", name);
-    }
-    return result;
-}
+  /* CommonTypesMetaclass.init */
+  if (likely(__pyx_CommonTypesMetaclass_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
 
-/* PyDictVersioning (used by GetModuleGlobalName) */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
-#else
-        dictptr = _PyObject_GetDictPtr(obj);
-#endif
-    }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+  /* CachedMethodType.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *typesModule=NULL;
+      typesModule = PyImport_ImportModule("types");
+      if (typesModule) {
+          __pyx_mstate_global->__Pyx_CachedMethodType = PyObject_GetAttrString(typesModule, "MethodType");
+          Py_DECREF(typesModule);
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CythonFunctionShared.init */
+  if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
 }
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
 #endif
 
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
-{
-    PyObject *result;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(!__pyx_m)) {
-        if (!PyErr_Occurred())
-            PyErr_SetNone(PyExc_NameError);
-        return NULL;
-    }
-    result = PyObject_GetAttr(__pyx_m, name);
-    if (likely(result)) {
-        return result;
-    }
-    PyErr_Clear();
-#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
-    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
-    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return result;
-    }
-#else
-    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
 }
+#endif
 
 /* PyObjectCall (used by PyObjectFastCall) */
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -6170,7 +8573,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 }
 #endif
 
-/* PyObjectFastCall (used by PyObjectVectorCallKwBuilder) */
+/* PyObjectFastCall */
 #if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
 static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
     PyObject *argstuple;
@@ -6247,47 +8650,171 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObj
     #endif
 }
 
-/* PyObjectVectorCallKwBuilder */
-#if CYTHON_VECTORCALL
-static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_PyObject_FastCallDict;
-    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
-    Py_INCREF(key);
-    args[n] = value;
-    return 0;
-}
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    (void)__Pyx_VectorcallBuilder_AddArgStr;
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
+/* PyErrFetchRestore (used by RaiseException) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
     }
-    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
 }
-static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
-    PyObject *pyKey = PyUnicode_FromString(key);
-    if (!pyKey) return -1;
-    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
 }
-#else // CYTHON_VECTORCALL
-CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
-    if (unlikely(!PyUnicode_Check(key))) {
-        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
-        return -1;
+#endif
+
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
     }
-    return PyDict_SetItem(builder, key, value);
-}
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
-
-/* RaiseUnexpectedTypeError */
-static int
-__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
-{
-    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
-    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
-                 expected, obj_type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-    return 0;
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
 
 /* PyObjectFastCallMethod */
@@ -6548,6 +9075,16 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
     return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
 }
 
+/* PyObjectGetAttrStr (used by UnpackUnboundCMethod) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
 /* UnpackUnboundCMethod (used by CallUnboundCMethod0) */
 #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
 static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
@@ -7258,9 +9795,303 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
         PyErr_SetRaisedException(vargs[0]);
     }
 #endif
-    __Pyx_DECREF_TypeName(type_name);
-    __Pyx_DECREF_TypeName(obj_type_name);
-    return 0;
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    PyErr_Clear();
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyObjectVectorCallKwBuilder */
+#if CYTHON_VECTORCALL
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_PyObject_FastCallDict;
+    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
+    Py_INCREF(key);
+    args[n] = value;
+    return 0;
+}
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_VectorcallBuilder_AddArgStr;
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+}
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    PyObject *pyKey = PyUnicode_FromString(key);
+    if (!pyKey) return -1;
+    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+}
+#else // CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return PyDict_SetItem(builder, key, value);
+}
+#endif
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyObjectCall2Args (used by CallUnboundCMethod1) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args[3] = {NULL, arg1, arg2};
+    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* CallUnboundCMethod1 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
+    int was_initialized =  __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        int flag = cfunc->flag;
+        if (flag == METH_O) {
+            return __Pyx_CallCFunction(cfunc, self, arg);
+        } else if (flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, &arg, 1);
+        } else if (flag == (METH_FASTCALL | METH_KEYWORDS)) {
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, &arg, 1, NULL);
+        }
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod1(&tmp_cfunc, self, arg);
+    }
+#endif
+    PyObject* result = __Pyx__CallUnboundCMethod1(cfunc, self, arg);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg){
+    PyObject *result = NULL;
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *args = PyTuple_New(1);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg);
+        PyTuple_SET_ITEM(args, 0, arg);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+    } else
+#endif
+    {
+        result = __Pyx_PyObject_Call2Args(cfunc->method, self, arg);
+    }
+    return result;
+}
+
+/* PyUnicode_Substring */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop) {
+    Py_ssize_t length;
+    #if !CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(__Pyx_PyUnicode_READY(text) == -1)) return NULL;
+    #endif
+    length = __Pyx_PyUnicode_GET_LENGTH(text);
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(length < 0)) return NULL;
+    #endif
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    if (stop <= start)
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_unicode);
+    if (start == 0 && stop == length)
+        return __Pyx_NewRef(text);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyUnicode_Substring(text, start, stop);
+#else
+    return PyUnicode_FromKindAndData(PyUnicode_KIND(text),
+        PyUnicode_1BYTE_DATA(text) + start*PyUnicode_KIND(text), stop-start);
+#endif
+}
+
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* RaiseNoneIterError */
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
 }
 
 /* PySequenceMultiply */
@@ -9074,339 +11905,839 @@ static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qual
     }
     return op;
 }
-
-/* CLineInTraceback (used by AddTraceback) */
-#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
-#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
-#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
-#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    PyErr_Clear();
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
 #else
-PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
-    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
-    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
 }
-#endif
-static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
-    PyObject *use_cline = NULL;
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
     PyObject *ptype, *pvalue, *ptraceback;
-    PyObject *cython_runtime_dict;
-    CYTHON_MAYBE_UNUSED_VAR(tstate);
-    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
-        return c_line;
-    }
-    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
-    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
-    if (likely(cython_runtime_dict)) {
-        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
-            use_cline, cython_runtime_dict,
-            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
-    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
-        c_line = 0;
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
-    Py_XDECREF(use_cline);
-    Py_XDECREF(cython_runtime_dict);
-    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
-    return c_line;
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
 }
 #endif
 
-/* CodeObjectCache (used by AddTraceback) */
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
     }
-    while (start < end) {
-        mid = start + (end - start) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyLong_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
         } else {
-            return mid;
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
         }
-    }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
-}
-static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
-    __Pyx_CachedCodeObjectType* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
-    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
-        return NULL;
-    }
-    code_object = code_cache->entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
-}
-static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
-    (void)__pyx__find_code_object;
-    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
-#else
-    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
-    if (old_count < 0) {
-        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
-        return NULL;
-    }
 #endif
-    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
 #endif
-    return result;
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
 #endif
-}
-static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
-{
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
-    if (unlikely(!code_line)) {
-        return;
-    }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            code_cache->entries = entries;
-            code_cache->max_count = 64;
-            code_cache->count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
         }
-        return;
-    }
-    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
-    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
-        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
-        Py_INCREF(code_object);
-        Py_DECREF(tmp);
-        return;
     }
-    if (code_cache->count == code_cache->max_count) {
-        int new_max = code_cache->max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
+    {
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
         }
-        code_cache->entries = entries;
-        code_cache->max_count = new_max;
-    }
-    for (i=code_cache->count; i>pos; i--) {
-        entries[i] = entries[i-1];
-    }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    code_cache->count++;
-    Py_INCREF(code_object);
-}
-static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
-    (void)__pyx__insert_code_object;
-    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
 #else
-    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-    __pyx_nonatomic_int_type expected = 0;
-    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
-        return;
-    }
-#endif
-    __pyx__insert_code_object(code_cache, code_line, code_object);
-#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
-    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
-#endif
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
 #endif
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
 }
 
-/* AddTraceback */
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
-  #ifndef Py_BUILD_CORE
-    #define Py_BUILD_CORE 1
-  #endif
-  #include "internal/pycore_frame.h"
+/* CIntFromPy */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyLong_As_PY_LONG_LONG(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
 #endif
-#if CYTHON_COMPILING_IN_LIMITED_API
-static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
-                                                       PyObject *firstlineno, PyObject *name) {
-    PyObject *replace = NULL;
-    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
-    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
-    replace = PyObject_GetAttrString(code, "replace");
-    if (likely(replace)) {
-        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
-        Py_DECREF(replace);
-        return result;
-    }
-    PyErr_Clear();
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
-    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
-    PyObject *exc_type, *exc_value, *exc_traceback;
-    int success = 0;
-    if (c_line) {
-        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (PY_LONG_LONG) -1;
+        val = __Pyx_PyLong_As_PY_LONG_LONG(tmp);
+        Py_DECREF(tmp);
+        return val;
     }
-    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
-    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
-    if (!code_object) {
-        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
-        if (unlikely(!code_object)) goto bad;
-        py_py_line = PyLong_FromLong(py_line);
-        if (unlikely(!py_py_line)) goto bad;
-        if (c_line) {
-            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
         } else {
-            py_funcname = PyUnicode_FromString(funcname);
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+            }
         }
-        if (unlikely(!py_funcname)) goto bad;
-        dict = PyDict_New();
-        if (unlikely(!dict)) goto bad;
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
         {
-            PyObject *old_code_object = code_object;
-            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
-            Py_DECREF(old_code_object);
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (PY_LONG_LONG) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(PY_LONG_LONG) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
         }
-        if (unlikely(!code_object)) goto bad;
-        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
     } else {
-        dict = PyDict_New();
-    }
-    getframe = PySys_GetObject("_getframe");
-    if (unlikely(!getframe)) goto bad;
-    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
-    frame = PyEval_EvalCode(code_object, dict, dict);
-    if (unlikely(!frame) || frame == Py_None) goto bad;
-    success = 1;
-  bad:
-    PyErr_Restore(exc_type, exc_value, exc_traceback);
-    Py_XDECREF(code_object);
-    Py_XDECREF(py_py_line);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(dict);
-    Py_XDECREF(replace);
-    if (success) {
-        PyTraceBack_Here(
-            (struct _frame*)frame);
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(PY_LONG_LONG) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, long, PyLong_AsLong(x))
+        } else if ((sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
     }
-    Py_XDECREF(frame);
-}
+    {
+        PY_LONG_LONG val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
 #else
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = NULL;
-    PyObject *py_funcname = NULL;
-    if (c_line) {
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        if (!py_funcname) goto bad;
-        funcname = PyUnicode_AsUTF8(py_funcname);
-        if (!funcname) goto bad;
-    }
-    py_code = PyCode_NewEmpty(filename, funcname, py_line);
-    Py_XDECREF(py_funcname);
-    return py_code;
-bad:
-    Py_XDECREF(py_funcname);
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject *ptype, *pvalue, *ptraceback;
-    if (c_line) {
-        c_line = __Pyx_CLineForTraceback(tstate, c_line);
-    }
-    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
-    if (!py_code) {
-        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) {
-            /* If the code object creation fails, then we should clear the
-               fetched exception references and propagate the new exception */
-            Py_XDECREF(ptype);
-            Py_XDECREF(pvalue);
-            Py_XDECREF(ptraceback);
-            goto bad;
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (PY_LONG_LONG) -1;
+            assert(PyLong_CheckExact(v));
         }
-        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
-        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
-    }
-    py_frame = PyFrame_New(
-        tstate,            /*PyThreadState *tstate,*/
-        py_code,           /*PyCodeObject *code,*/
-        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
-        0                  /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (PY_LONG_LONG) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (PY_LONG_LONG) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (PY_LONG_LONG) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(PY_LONG_LONG) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((PY_LONG_LONG) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(PY_LONG_LONG) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((PY_LONG_LONG) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((PY_LONG_LONG) 1) << (sizeof(PY_LONG_LONG) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
 #endif
-
-/* CIntFromPyVerify */
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
+        if (unlikely(ret))
+            return (PY_LONG_LONG) -1;
+        return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
+}
 
 /* CIntFromPy */
-static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
+    const long neg_one = (long) -1, const_zero = (long) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
     if (unlikely(!PyLong_Check(x))) {
-        int val;
+        long val;
         PyObject *tmp = __Pyx_PyNumber_Long(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyLong_As_int(tmp);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyLong_As_long(tmp);
         Py_DECREF(tmp);
         return val;
     }
@@ -9415,35 +12746,35 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
         if (unlikely(__Pyx_PyLong_IsNeg(x))) {
             goto raise_neg_overflow;
         } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_DigitCount(x)) {
                 case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
                         }
                     }
                     break;
@@ -9458,89 +12789,89 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
         {
             int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
             if (unlikely(result < 0))
-                return (int) -1;
+                return (long) -1;
             if (unlikely(result == 1))
                 goto raise_neg_overflow;
         }
 #endif
-        if ((sizeof(int) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        if ((sizeof(long) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
         }
     } else {
 #if CYTHON_USE_PYLONG_INTERNALS
         if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_SignedDigitCount(x)) {
                 case -2:
-                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
                         }
                     }
                     break;
             }
         }
 #endif
-        if ((sizeof(int) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+        if ((sizeof(long) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
         }
     }
     {
-        int val;
+        long val;
         int ret = -1;
 #if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
         Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
@@ -9566,14 +12897,14 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
             v = __Pyx_NewRef(x);
         } else {
             v = PyNumber_Long(x);
-            if (unlikely(!v)) return (int) -1;
+            if (unlikely(!v)) return (long) -1;
             assert(PyLong_CheckExact(v));
         }
         {
             int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
             if (unlikely(result < 0)) {
                 Py_DECREF(v);
-                return (int) -1;
+                return (long) -1;
             }
             is_negative = result == 1;
         }
@@ -9584,15 +12915,15 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
             stepval = PyNumber_Invert(v);
             Py_DECREF(v);
             if (unlikely(!stepval))
-                return (int) -1;
+                return (long) -1;
         } else {
             stepval = v;
         }
         v = NULL;
-        val = (int) 0;
+        val = (long) 0;
         mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
         shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
             PyObject *tmp, *digit;
             long idigit;
             digit = PyNumber_And(stepval, mask);
@@ -9600,7 +12931,7 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
             idigit = PyLong_AsLong(digit);
             Py_DECREF(digit);
             if (unlikely(idigit < 0)) goto done;
-            val |= ((int) idigit) << bits;
+            val |= ((long) idigit) << bits;
             tmp = PyNumber_Rshift(stepval, shift);
             if (unlikely(!tmp)) goto done;
             Py_DECREF(stepval); stepval = tmp;
@@ -9610,13 +12941,13 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
         {
             long idigit = PyLong_AsLong(stepval);
             if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
             if (unlikely(idigit >= (1L << remaining_bits)))
                 goto raise_overflow;
-            val |= ((int) idigit) << bits;
+            val |= ((long) idigit) << bits;
         }
         if (!is_unsigned) {
-            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
                 goto raise_overflow;
             if (is_negative)
                 val = ~val;
@@ -9628,35 +12959,35 @@ static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
         Py_XDECREF(stepval);
 #endif
         if (unlikely(ret))
-            return (int) -1;
+            return (long) -1;
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+        "value too large to convert to long");
+    return (long) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
+        "can't convert negative value to long");
+    return (long) -1;
 }
 
 /* CIntFromPy */
-static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+static CYTHON_INLINE size_t __Pyx_PyLong_As_size_t(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
     if (unlikely(!PyLong_Check(x))) {
-        long val;
+        size_t val;
         PyObject *tmp = __Pyx_PyNumber_Long(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyLong_As_long(tmp);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyLong_As_size_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
@@ -9665,35 +12996,35 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
         if (unlikely(__Pyx_PyLong_IsNeg(x))) {
             goto raise_neg_overflow;
         } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+            __PYX_VERIFY_RETURN_INT(size_t, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_DigitCount(x)) {
                 case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) >= 2 * PyLong_SHIFT)) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) >= 3 * PyLong_SHIFT)) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) >= 4 * PyLong_SHIFT)) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
@@ -9708,89 +13039,89 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
         {
             int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
             if (unlikely(result < 0))
-                return (long) -1;
+                return (size_t) -1;
             if (unlikely(result == 1))
                 goto raise_neg_overflow;
         }
 #endif
-        if ((sizeof(long) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
-        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        if ((sizeof(size_t) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
         }
     } else {
 #if CYTHON_USE_PYLONG_INTERNALS
         if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+            __PYX_VERIFY_RETURN_INT(size_t, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_SignedDigitCount(x)) {
                 case -2:
-                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT)) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT)) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT)) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT)) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT)) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(size_t) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT)) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
             }
         }
 #endif
-        if ((sizeof(long) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
-        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+        if ((sizeof(size_t) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+        } else if ((sizeof(size_t) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
         }
     }
     {
-        long val;
+        size_t val;
         int ret = -1;
 #if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
         Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
@@ -9816,14 +13147,14 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
             v = __Pyx_NewRef(x);
         } else {
             v = PyNumber_Long(x);
-            if (unlikely(!v)) return (long) -1;
+            if (unlikely(!v)) return (size_t) -1;
             assert(PyLong_CheckExact(v));
         }
         {
             int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
             if (unlikely(result < 0)) {
                 Py_DECREF(v);
-                return (long) -1;
+                return (size_t) -1;
             }
             is_negative = result == 1;
         }
@@ -9834,15 +13165,15 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
             stepval = PyNumber_Invert(v);
             Py_DECREF(v);
             if (unlikely(!stepval))
-                return (long) -1;
+                return (size_t) -1;
         } else {
             stepval = v;
         }
         v = NULL;
-        val = (long) 0;
+        val = (size_t) 0;
         mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
         shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        for (bits = 0; bits < (int) sizeof(size_t) * 8 - chunk_size; bits += chunk_size) {
             PyObject *tmp, *digit;
             long idigit;
             digit = PyNumber_And(stepval, mask);
@@ -9850,7 +13181,7 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
             idigit = PyLong_AsLong(digit);
             Py_DECREF(digit);
             if (unlikely(idigit < 0)) goto done;
-            val |= ((long) idigit) << bits;
+            val |= ((size_t) idigit) << bits;
             tmp = PyNumber_Rshift(stepval, shift);
             if (unlikely(!tmp)) goto done;
             Py_DECREF(stepval); stepval = tmp;
@@ -9860,13 +13191,13 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
         {
             long idigit = PyLong_AsLong(stepval);
             if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            remaining_bits = ((int) sizeof(size_t) * 8) - bits - (is_unsigned ? 0 : 1);
             if (unlikely(idigit >= (1L << remaining_bits)))
                 goto raise_overflow;
-            val |= ((long) idigit) << bits;
+            val |= ((size_t) idigit) << bits;
         }
         if (!is_unsigned) {
-            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            if (unlikely(val & (((size_t) 1) << (sizeof(size_t) * 8 - 1))))
                 goto raise_overflow;
             if (is_negative)
                 val = ~val;
@@ -9878,17 +13209,17 @@ static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
         Py_XDECREF(stepval);
 #endif
         if (unlikely(ret))
-            return (long) -1;
+            return (size_t) -1;
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+        "value too large to convert to size_t");
+    return (size_t) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
+        "can't convert negative value to size_t");
+    return (size_t) -1;
 }
 
 /* CIntToPy */
@@ -9960,6 +13291,75 @@ static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
     }
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_PY_LONG_LONG(PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(PY_LONG_LONG));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
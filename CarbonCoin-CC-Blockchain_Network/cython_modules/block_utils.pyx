@@ -10,6 +10,256 @@ Optimized for mining and block hash calculations.
 import hashlib
 import json
 from cpython cimport bool
+from libc.stdint cimport uint8_t, uint32_t, uint64_t
+from libc.string cimport memcpy
+
+
+# =============================================================================
+# GIL-FREE SHA-256 (used by the mining kernel)
+# =============================================================================
+
+cdef uint32_t[64] _K
+_K[:] = [
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+]
+
+cdef struct Sha256Ctx:
+    uint32_t state[8]
+    uint64_t bitlen
+    uint8_t data[64]
+    uint32_t datalen
+
+
+cdef inline uint32_t _rotr(uint32_t x, uint32_t n) noexcept nogil:
+    return (x >> n) | (x << (32 - n))
+
+
+cdef void _sha256_transform(Sha256Ctx* ctx, const uint8_t* chunk) noexcept nogil:
+    cdef uint32_t w[64]
+    cdef uint32_t a, b, c, d, e, f, g, h, t1, t2, s0, s1
+    cdef int i
+    
+    for i in range(16):
+        w[i] = ((<uint32_t>chunk[i * 4] << 24) | (<uint32_t>chunk[i * 4 + 1] << 16) |
+                (<uint32_t>chunk[i * 4 + 2] << 8) | (<uint32_t>chunk[i * 4 + 3]))
+    for i in range(16, 64):
+        s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+        s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+        w[i] = w[i - 16] + s0 + w[i - 7] + s1
+    
+    a = ctx.state[0]; b = ctx.state[1]; c = ctx.state[2]; d = ctx.state[3]
+    e = ctx.state[4]; f = ctx.state[5]; g = ctx.state[6]; h = ctx.state[7]
+    
+    for i in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        t1 = h + s1 + ((e & f) ^ ((~e) & g)) + _K[i] + w[i]
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        t2 = s0 + ((a & b) ^ (a & c) ^ (b & c))
+        h = g; g = f; f = e; e = d + t1
+        d = c; c = b; b = a; a = t1 + t2
+    
+    ctx.state[0] += a; ctx.state[1] += b; ctx.state[2] += c; ctx.state[3] += d
+    ctx.state[4] += e; ctx.state[5] += f; ctx.state[6] += g; ctx.state[7] += h
+
+
+cdef void _sha256_init(Sha256Ctx* ctx) noexcept nogil:
+    ctx.datalen = 0
+    ctx.bitlen = 0
+    ctx.state[0] = 0x6a09e667; ctx.state[1] = 0xbb67ae85
+    ctx.state[2] = 0x3c6ef372; ctx.state[3] = 0xa54ff53a
+    ctx.state[4] = 0x510e527f; ctx.state[5] = 0x9b05688c
+    ctx.state[6] = 0x1f83d9ab; ctx.state[7] = 0x5be0cd19
+
+
+cdef void _sha256_update(Sha256Ctx* ctx, const uint8_t* data, size_t length) noexcept nogil:
+    cdef size_t i
+    for i in range(length):
+        ctx.data[ctx.datalen] = data[i]
+        ctx.datalen += 1
+        if ctx.datalen == 64:
+            _sha256_transform(ctx, ctx.data)
+            ctx.bitlen += 512
+            ctx.datalen = 0
+
+
+cdef void _sha256_final(Sha256Ctx* ctx, uint8_t* digest) noexcept nogil:
+    cdef uint32_t i = ctx.datalen
+    cdef int j
+    
+    ctx.data[i] = 0x80
+    i += 1
+    if ctx.datalen < 56:
+        while i < 56:
+            ctx.data[i] = 0
+            i += 1
+    else:
+        while i < 64:
+            ctx.data[i] = 0
+            i += 1
+        _sha256_transform(ctx, ctx.data)
+        for j in range(56):
+            ctx.data[j] = 0
+    
+    ctx.bitlen += <uint64_t>ctx.datalen * 8
+    for j in range(8):
+        ctx.data[63 - j] = <uint8_t>(ctx.bitlen >> (8 * j))
+    _sha256_transform(ctx, ctx.data)
+    
+    for j in range(8):
+        digest[j * 4] = <uint8_t>(ctx.state[j] >> 24)
+        digest[j * 4 + 1] = <uint8_t>(ctx.state[j] >> 16)
+        digest[j * 4 + 2] = <uint8_t>(ctx.state[j] >> 8)
+        digest[j * 4 + 3] = <uint8_t>(ctx.state[j])
+
+
+cdef inline int _format_nonce(long long nonce, uint8_t* buf) noexcept nogil:
+    """Write nonce as ASCII decimal (same as json.dumps) into buf, return length."""
+    cdef uint8_t tmp[24]
+    cdef int n = 0, k = 0
+    cdef unsigned long long v
+    
+    if nonce < 0:
+        buf[k] = 45  # '-'
+        k += 1
+        v = <unsigned long long>(-(nonce + 1)) + 1
+    else:
+        v = <unsigned long long>nonce
+    
+    while True:
+        tmp[n] = <uint8_t>(48 + v % 10)
+        n += 1
+        v //= 10
+        if v == 0:
+            break
+    while n > 0:
+        n -= 1
+        buf[k] = tmp[n]
+        k += 1
+    return k
+
+
+cdef inline bint _meets_difficulty(const uint8_t* digest, int difficulty) noexcept nogil:
+    """Check the hex digest would start with `difficulty` zero characters."""
+    cdef int i
+    for i in range(difficulty):
+        if i & 1:
+            if digest[i >> 1] & 0x0F:
+                return False
+        elif digest[i >> 1] & 0xF0:
+            return False
+    return True
+
+
+cpdef tuple find_nonce(bytes prefix, bytes suffix, int difficulty, long long start_nonce=0,
+                       long long max_attempts=0):
+    """
+    Search for a nonce such that SHA256(prefix + str(nonce) + suffix) has
+    `difficulty` leading hex zeros. The search loop runs without the GIL,
+    so other Python threads (sync, HTTP server) keep running while mining.
+    
+    The SHA-256 state after `prefix` is computed once and reused for every
+    nonce, so each attempt only hashes the tail of the block header.
+    
+    Args:
+        prefix: Serialized block header bytes before the nonce
+        suffix: Serialized block header bytes after the nonce
+        difficulty: Number of leading hex zeros required (max 64)
+        start_nonce: Starting nonce value
+        max_attempts: Give up after this many nonces (0 = search until found)
+        
+    Returns:
+        Tuple of (hash, nonce) when valid proof found, or
+        (None, next_nonce) when max_attempts ran out
+    """
+    cdef Sha256Ctx base, ctx
+    cdef uint8_t digest[32]
+    cdef uint8_t nonce_buf[24]
+    cdef int nonce_len
+    cdef long long nonce = start_nonce
+    cdef const uint8_t* prefix_ptr = <const uint8_t*>prefix
+    cdef const uint8_t* suffix_ptr = <const uint8_t*>suffix
+    cdef size_t prefix_len = len(prefix)
+    cdef size_t suffix_len = len(suffix)
+    cdef long long end_nonce = start_nonce + max_attempts
+    cdef bint found = False
+    
+    if difficulty < 0 or difficulty > 64:
+        raise ValueError("difficulty must be between 0 and 64")
+    
+    with nogil:
+        _sha256_init(&base)
+        _sha256_update(&base, prefix_ptr, prefix_len)
+        
+        while max_attempts <= 0 or nonce < end_nonce:
+            nonce_len = _format_nonce(nonce, nonce_buf)
+            memcpy(&ctx, &base, sizeof(Sha256Ctx))
+            _sha256_update(&ctx, nonce_buf, nonce_len)
+            _sha256_update(&ctx, suffix_ptr, suffix_len)
+            _sha256_final(&ctx, digest)
+            
+            if _meets_difficulty(digest, difficulty):
+                found = True
+                break
+            nonce += 1
+    
+    if not found:
+        return (None, nonce)
+    return ((<bytes>digest[:32]).hex(), nonce)
+
+
+cpdef tuple split_block_header(object index, double timestamp, object data, str previous_hash):
+    """
+    Serialize a block header exactly as calculate_block_hash does and split
+    it around the nonce value, for use with find_nonce.
+    
+    Returns:
+        Tuple of (prefix_bytes, suffix_bytes)
+    """
+    cdef str header = json.dumps({
+        "index": index,
+        "timestamp": timestamp,
+        "data": data,
+        "previous_hash": previous_hash,
+        "nonce": 0
+    }, sort_keys=True)
+    
+    # Keys are sorted, so the top-level nonce is the last '"nonce": 0' before
+    # "previous_hash" (transaction data is serialized earlier, under "data")
+    cdef str marker = '"nonce": 0, "previous_hash": '
+    cdef Py_ssize_t pos = header.rindex(marker) + len('"nonce": ')
+    
+    return (header[:pos].encode('utf-8'), header[pos + 1:].encode('utf-8'))
+
+
+cpdef tuple mine_block_nogil(object index, double timestamp, object data,
+                             str previous_hash, int difficulty, long long start_nonce=0,
+                             long long max_attempts=0):
+    """
+    Mine a block by finding a valid nonce, releasing the GIL during the search.
+    Produces the same (hash, nonce) as mine_block_hash.
+    
+    Args:
+        index: Block index
+        timestamp: Block timestamp
+        data: Block data (transactions)
+        previous_hash: Hash of previous block
+        difficulty: Number of leading zeros required
+        start_nonce: Starting nonce value
+        max_attempts: Give up after this many nonces (0 = search until found)
+        
+    Returns:
+        Tuple of (hash, nonce) when valid proof found, or
+        (None, next_nonce) when max_attempts ran out
+    """
+    prefix, suffix = split_block_header(index, timestamp, data, previous_hash)
+    return find_nonce(prefix, suffix, difficulty, start_nonce, max_attempts)
 
 cpdef str calculate_block_hash(int index, double timestamp, object data, 
                                 str previous_hash, long nonce):
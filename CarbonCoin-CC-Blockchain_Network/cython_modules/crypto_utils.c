@@ -6,7 +6,11 @@
         "depends": [],
         "extra_compile_args": [
             "/O2",
-            "/arch:AVX2"
+            "/arch:AVX2",
+            "/GL"
+        ],
+        "extra_link_args": [
+            "/LTCG"
         ],
         "name": "cython_modules.crypto_utils",
         "sources": [
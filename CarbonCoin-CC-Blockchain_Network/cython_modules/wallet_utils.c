@@ -5,7 +5,11 @@
     "distutils": {
         "extra_compile_args": [
             "/O2",
-            "/arch:AVX2"
+            "/arch:AVX2",
+            "/GL"
+        ],
+        "extra_link_args": [
+            "/LTCG"
         ],
         "name": "cython_modules.wallet_utils",
         "sources": [
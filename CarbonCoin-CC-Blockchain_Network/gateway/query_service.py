@@ -251,7 +251,8 @@ def health_check():
         "status": "healthy",
         "service": "gateway",
         "port": GATEWAY_PORT,
-        "collection_node": collection_status
+        "collection_node": collection_status,
+        "mongodb": "online" if mongo_storage.healthcheck() else "offline"
     })
 
 
@@ -5,16 +5,19 @@ This module provides the REST API endpoints for the blockchain network.
 Different endpoints are available based on node type (Miner, Collection, User).
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, make_response
 from functools import wraps
 import requests
 import sys
+import gzip
+import atexit
 import logging
 import traceback
 
 from node.node import Node
 from blockchain.block import Block
 from transaction.transaction import Transaction
+from transaction.bloom import TxIdBloomFilter
 from config import (
     NodeType, COIN_SYMBOL, MINING_REWARD, MINER_AUTO_TRANSFER_THRESHOLD,
     get_node_type_from_port, COINBASE_ADDRESS, ASSIGN_REWARD, TransactionType
@@ -111,6 +114,35 @@ def handle_exceptions(f):
     return decorated_function
 
 
+# Bodies smaller than this aren't worth compressing
+GZIP_MIN_SIZE = 1024
+
+def gzip_response(f):
+    """
+    Decorator to gzip large JSON responses when the client accepts it.
+    Level 1: nearly free CPU-wise, and still shrinks hash-heavy JSON several-fold.
+    (requests sends Accept-Encoding: gzip and decodes it transparently.)
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        response = make_response(f(*args, **kwargs))
+        response.headers.add('Vary', 'Accept-Encoding')
+        
+        if (response.status_code != 200 or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+            return response
+        
+        body = response.get_data()
+        if len(body) < GZIP_MIN_SIZE:
+            return response
+        
+        response.set_data(gzip.compress(body, compresslevel=1))
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
+    return decorated_function
+
+
 def create_app(port: int = 5000, private_key: str = None):
     """
     Create and configure the Flask app with the node.
@@ -128,6 +160,9 @@ def create_app(port: int = 5000, private_key: str = None):
     global node
     node = Node(port=port, private_key=private_key)
     
+    # Close keep-alive connections and worker pools when the process exits
+    atexit.register(node.close)
+    
     # Connect to bootstrap peers on startup (all nodes)
     # This ensures new nodes discover the network automatically
     node.connect_to_bootstrap_peers()
@@ -161,7 +196,7 @@ def home():
         "balance": node.get_balance(),
         "chain_length": len(node.blockchain.chain),
         "pending_transactions": len(node.blockchain.pending_transactions),
-        "peers_count": len(node.peers),
+        "peers_count": len(node.get_peers()),
         "sync_active": node.sync_active,
         "mining_active": node.mining_active if node.is_miner() else None,
         "auto_transfer_active": node.auto_transfer_active if node.is_miner() else None
@@ -280,8 +315,8 @@ def get_peers():
     """Get list of connected peers."""
     return jsonify({
         "success": True,
-        "count": len(node.peers),
-        "peers": list(node.peers)
+        "count": len(node.get_peers()),
+        "peers": list(node.get_peers())
     })
 
 @app.route('/add_peer', methods=['POST'])
@@ -299,7 +334,7 @@ def add_peer():
     return jsonify({
         "success": success,
         "message": "Peer added" if success else "Failed to add peer",
-        "peers": list(node.peers)
+        "peers": list(node.get_peers())
     })
 
 @app.route('/announce_peer', methods=['POST'])
@@ -346,7 +381,7 @@ def register_node():
     return jsonify({
         "success": True,
         "message": f"Node {new_node_url} registered",
-        "peers": list(node.peers),
+        "peers": list(node.get_peers()),
         "chain_length": len(node.blockchain.chain)
     }), 201
 
@@ -415,14 +450,13 @@ def create_transaction():
     
     # Check for duplicates
     tx_id = tx.hash_hex()
-    if any(t.get("tx_id") == tx_id for t in node.blockchain.pending_transactions):
+    if node.blockchain.is_transaction_pending(tx_id):
         raise APIError("Duplicate transaction", 400)
     
-    # Add to pending
-    node.blockchain.pending_transactions.append(tx_dict)
-    
-    # Broadcast to peers
-    node._broadcast_transaction(tx_dict)
+    # Add to pending and queue for batched broadcast to peers (the add re-checks
+    # for duplicates under the chain lock, in case a peer relayed it meanwhile)
+    if not node._admit_and_broadcast(tx_dict, tx.to_json_bytes()):
+        raise APIError("Duplicate transaction", 400)
     
     return jsonify({
         "success": True,
@@ -430,34 +464,81 @@ def create_transaction():
         "tx_id": tx_id
     }), 201
 
+def _ingest_peer_transaction(tx: dict) -> tuple:
+    """
+    Add a transaction gossiped by a peer to our pending pool.
+    
+    Args:
+        tx: Transaction dict from the peer
+        
+    Returns:
+        (status_code, message): 201 if admitted, 200 if already mined or
+        pending, 400 if rejected by validation
+    """
+    tx_id = tx.get("tx_id")
+    
+    # CRITICAL: Check if transaction is already mined in blockchain
+    if node.blockchain.is_transaction_mined(tx_id):
+        return 200, "Transaction already mined"
+    
+    # Check if already in pending
+    if node.blockchain.is_transaction_pending(tx_id):
+        return 200, "Transaction already pending"
+    
+    # Validate before adding (this also checks chain)
+    is_valid, error = node.blockchain.validate_transaction(tx)
+    if not is_valid:
+        # Auto-transfers may bypass some validation but still check for duplicates.
+        # They're kept locally only: never relay a transaction that failed
+        # validation, or it would spread across the whole network
+        if tx.get("tx_type") == "auto_transfer":
+            if node.blockchain.add_pending(tx):
+                return 201, "Transaction received"
+            return 200, "Transaction already pending or mined"
+        return 400, f"Transaction rejected: {error}"
+    
+    # Add to pending and relay onward: senders only gossip to a subset of peers.
+    # The add re-checks for duplicates under the chain lock, since the same
+    # transaction can arrive from several peers at once
+    if not node._admit_and_broadcast(tx):
+        return 200, "Transaction already pending or mined"
+    
+    return 201, "Transaction received"
+
 @app.route('/receive_transaction', methods=['POST'])
 @handle_exceptions
 def receive_transaction():
     """Receive a transaction from a peer."""
     tx = request.json or {}
-    tx_id = tx.get("tx_id")
     
-    if not tx_id:
+    if not tx.get("tx_id"):
         raise APIError("Invalid transaction", 400)
     
-    # CRITICAL: Check if transaction is already mined in blockchain
-    if node.blockchain.is_transaction_mined(tx_id):
-        return jsonify({"success": True, "message": "Transaction already mined"}), 200
+    status, message = _ingest_peer_transaction(tx)
+    if status == 400:
+        raise APIError(message, 400)
     
-    # Check if already in pending
-    if any(t.get("tx_id") == tx_id for t in node.blockchain.pending_transactions):
-        return jsonify({"success": True, "message": "Transaction already pending"}), 200
+    return jsonify({"success": True, "message": message}), status
+
+@app.route('/tx_batch', methods=['POST'])
+@handle_exceptions
+def receive_transaction_batch():
+    """Receive a batch of transactions gossiped by a peer."""
+    data = request.json or {}
+    txs = data.get("txs")
     
-    # Validate before adding (this also checks chain)
-    is_valid, error = node.blockchain.validate_transaction(tx)
-    if is_valid:
-        node.blockchain.pending_transactions.append(tx)
-    elif tx.get("tx_type") == "auto_transfer":
-        # Auto-transfers may bypass some validation but still check for duplicates
-        if not node.blockchain.is_transaction_mined(tx_id):
-            node.blockchain.pending_transactions.append(tx)
+    if not isinstance(txs, list):
+        raise APIError("Invalid transaction batch", 400)
     
-    return jsonify({"success": True, "message": "Transaction received"}), 201
+    # Count only transactions actually admitted (not duplicates or rejects)
+    received = 0
+    for tx in txs:
+        if isinstance(tx, dict) and tx.get("tx_id"):
+            status, _ = _ingest_peer_transaction(tx)
+            if status == 201:
+                received += 1
+    
+    return jsonify({"success": True, "received": received, "total": len(txs)}), 201
 
 @app.route('/transfer', methods=['POST'])
 @handle_exceptions
@@ -509,8 +590,11 @@ def mine_once():
     block = node.blockchain.mine_block(node.wallet.address())
     
     if block:
+        node.persist_block(block)
+        
         # Broadcast block
         accepted = node._broadcast_block(block)
+        node.notify_balance_changed()
         
         return jsonify({
             "success": True,
@@ -635,7 +719,6 @@ def assign_reward():
     
     # Create transfer from collection to user
     from transaction.transaction import Transaction
-    import threading
     
     tx = Transaction(
         sender=node.wallet.address(),
@@ -643,18 +726,15 @@ def assign_reward():
         amount=amount,
         tx_type=TransactionType.TRANSFER
     )
-    tx.sign(node.wallet)
+    node.sign_transaction(tx)
     tx_dict = tx.to_dict()
     
-    # Add to pending
-    node.blockchain.pending_transactions.append(tx_dict)
-    
-    # Broadcast in background thread (don't block response)
-    threading.Thread(
-        target=node._broadcast_transaction, 
-        args=(tx_dict,), 
-        daemon=True
-    ).start()
+    # Reserve atomically (concurrent rewards could otherwise over-spend the
+    # collection wallet), then queue for batched broadcast (doesn't block response)
+    if not node.blockchain.reserve_pending(tx_dict):
+        available = node.get_available_balance()
+        raise APIError(f"Collection has insufficient balance. Available: {available:.2f} {COIN_SYMBOL}, Need: {amount} {COIN_SYMBOL}", 400)
+    node.queue_transaction(tx_dict, tx.to_json_bytes())
     
     logger.info(f"[Reward] Assigned {amount} {COIN_SYMBOL} to {user_address[:16]}...")
     
@@ -682,12 +762,15 @@ def receive_block():
             data['timestamp'],
             data['data'],
             data['previous_hash'],
-            data['nonce']
+            data['nonce'],
+            data['hash']
         )
-        block.hash = data['hash']
     except KeyError as e:
         raise APIError(f"Missing block field: {e}", 400)
     
+    # Keep the original wire bytes so a rebroadcast doesn't re-serialize
+    block.attach_json_bytes(request.get_data())
+    
     last_block = node.blockchain.get_latest_block()
     
     # Case 1: Block is next in sequence - try to add directly
@@ -696,6 +779,8 @@ def receive_block():
             # CRITICAL: Clean up ALL already-mined transactions from pending
             # This uses the proper deduplication method
             node.blockchain.cleanup_pending_transactions()
+            node.persist_block(block)
+            node.notify_balance_changed()
             
             logger.info(f"[Block] Accepted block #{block.index} from peer")
             return jsonify({
@@ -703,6 +788,9 @@ def receive_block():
                 "message": "Block accepted",
                 "block_index": block.index
             }), 201
+        
+        # Next index but doesn't link to our tip - a fork; wake the background sync
+        node.request_sync()
     
     # Case 2: Block is ahead or conflicts - need to sync
     if block.index > last_block.index + 1:
@@ -716,7 +804,10 @@ def receive_block():
             "chain_length": len(node.blockchain.chain)
         }), 200
     
-    # Case 3: Block already exists or is old
+    # Case 3: Block already exists or is old (or competes with our tip)
+    if block.index == last_block.index and block.hash != last_block.hash:
+        node.mark_chain_dirty()
+        node.request_sync()
     return jsonify({
         "success": True,
         "message": "Block already processed",
@@ -729,16 +820,42 @@ def receive_block():
 
 @app.route('/chain', methods=['GET'])
 @handle_exceptions
+@gzip_response
 def chain():
-    """Get the full blockchain."""
+    """
+    Get the full blockchain.
+    
+    Query params:
+        since: Only return blocks from this index on, plus the hash of the
+               block before it (anchor_hash) so the caller can splice them in
+    """
+    blocks = node.blockchain.chain
+    since = request.args.get('since')
+    if since is None:
+        return jsonify({
+            "success": True,
+            "length": len(blocks),
+            "chain": [b.to_dict() for b in blocks]
+        })
+    
+    try:
+        since = int(since)
+    except ValueError:
+        raise APIError("Invalid 'since' index", 400)
+    if since < 1:
+        raise APIError("Invalid 'since' index", 400)
+    
     return jsonify({
         "success": True,
-        "length": len(node.blockchain.chain),
-        "chain": [b.__dict__ for b in node.blockchain.chain]
+        "length": len(blocks),
+        "since": since,
+        "anchor_hash": blocks[since - 1].hash if since <= len(blocks) else None,
+        "chain": [b.to_dict() for b in blocks[since:]]
     })
 
 @app.route('/mempool', methods=['GET'])
 @handle_exceptions
+@gzip_response
 def mempool():
     """Get pending transactions."""
     return jsonify({
@@ -747,6 +864,30 @@ def mempool():
         "transactions": node.blockchain.pending_transactions
     })
 
+@app.route('/mempool/missing', methods=['POST'])
+@handle_exceptions
+def mempool_missing():
+    """
+    Get the pending transactions a peer doesn't have yet.
+    
+    Body: Bloom filter of the caller's pending tx_ids (TxIdBloomFilter.to_dict()).
+    Only transactions definitely absent from the filter are returned.
+    """
+    try:
+        known = TxIdBloomFilter.from_dict(request.json or {})
+    except ValueError as e:
+        raise APIError(str(e), 400)
+    
+    missing = [
+        tx for tx in node.blockchain.pending_transactions
+        if (tx.get("tx_id") or "") not in known
+    ]
+    return jsonify({
+        "success": True,
+        "count": len(missing),
+        "transactions": missing
+    })
+
 @app.route('/transactions', methods=['GET'])
 @handle_exceptions
 def get_transactions():
@@ -829,7 +970,7 @@ def full_sync():
         "message": "Full sync completed" if success else "Sync failed",
         "chain_length": len(node.blockchain.chain),
         "pending_transactions": len(node.blockchain.pending_transactions),
-        "peers_count": len(node.peers)
+        "peers_count": len(node.get_peers())
     })
 
 @app.route('/stats', methods=['GET'])
@@ -850,7 +991,7 @@ def stats():
         "total_supply": f"{total_supply:.2f} {COIN_SYMBOL}",
         "difficulty": node.blockchain.difficulty,
         "pending_transactions": len(node.blockchain.pending_transactions),
-        "peers_count": len(node.peers),
+        "peers_count": len(node.get_peers()),
         "sync_active": node.sync_active
     })
 
@@ -873,7 +1014,7 @@ def save_state():
         "port": node.port,
         "chain_length": len(node.blockchain.chain),
         "pending_transactions": len(node.blockchain.pending_transactions),
-        "peers_count": len(node.peers)
+        "peers_count": len(node.get_peers())
     })
 
 @app.route('/shutdown', methods=['POST'])
@@ -1,28 +1,146 @@
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
 import threading
 import time
+import sched
 import os
+import json
+import math
+import random
 import logging
+import logging.handlers
+import queue
+import atexit
+import socket
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from blockchain.block import Block
 from blockchain.blockchain import Blockchain
-from wallet.wallet import Wallet
+from wallet.wallet import Wallet, sign_payload
 from transaction.transaction import Transaction
+from transaction.bloom import TxIdBloomFilter
 from storage.storage import Storage
 from config import (
     NodeType, MINER_AUTO_TRANSFER_THRESHOLD, MINING_REWARD,
     get_node_type_from_port, COIN_SYMBOL, TransactionType,
-    COLLECTION_PORT, BOOTSTRAP_PEERS, AUTO_TRANSFER_ALL
+    COLLECTION_PORT, BOOTSTRAP_PEERS, AUTO_TRANSFER_ALL, TX_BROADCAST_FANOUT,
+    AUTO_TRANSFER_MAX_INTERVAL
 )
 
+# Try to use orjson for fast broadcast serialization
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+def _configure_async_logging():
+    """
+    Configure root logging like basicConfig(), but asynchronously: callers only
+    enqueue records, and a QueueListener thread does the formatting and I/O.
+    No-op if the root logger already has handlers (same rule as basicConfig).
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flush queued records on exit
+    atexit.register(listener.stop)
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+_configure_async_logging()
 logger = logging.getLogger(__name__)
 
+# Accepted peer URL schemes (tuple so str.startswith checks all in one call)
+PEER_URL_PREFIXES = ("http://", "https://")
+
+
+# Process pool for ECDSA signing (CPU-bound; keeps it off request threads and the GIL)
+_sign_pool = None
+_sign_pool_lock = threading.Lock()
+
+
+def _get_sign_pool() -> ProcessPoolExecutor:
+    """Create the signing process pool on first use."""
+    global _sign_pool
+    with _sign_pool_lock:
+        if _sign_pool is None:
+            _sign_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return _sign_pool
+
+
+def _json_bytes(obj) -> bytes:
+    """Serialize obj to JSON bytes once, for reuse across every peer POST."""
+    if USE_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(raw: bytes):
+    """Parse a JSON response body (orjson when available)."""
+    if USE_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class Node:
+    # Collection node health-check backoff window (seconds)
+    _COLLECTION_BACKOFF_MIN = 5.0
+    _COLLECTION_BACKOFF_MAX = 60.0
+    # A successful health probe is trusted for this long (seconds)
+    _COLLECTION_HEALTHY_TTL = 2.0
+    
+    # Broadcast limits: max in-flight peer RPCs, and consecutive failures before a peer is dropped
+    _MAX_INFLIGHT_BROADCASTS = 32
+    _MAX_PEER_FAILURES = 5
+    
+    # Background scheduler pacing (seconds)
+    _CONSENSUS_INTERVAL = 2.0
+    
+    # TCP connect budget for peer reachability checks (seconds); dead hosts
+    # fail fast here instead of holding an HTTP request for its full timeout
+    _PROBE_TIMEOUT = 0.3
+    
+    # Background sync is event-driven; with no peer activity the fallback
+    # poll backs off from _sync_interval up to this many seconds
+    _SYNC_IDLE_MAX = 30.0
+    _MINING_DELAY = 0.1
+    
+    # Auto-transfer runs when our balance changes (new/accepted block, chain
+    # swap); the fallback check starts at this interval and backs off up to
+    # AUTO_TRANSFER_MAX_INTERVAL while nothing happens
+    _AUTO_TRANSFER_MIN_INTERVAL = 0.5
+    # Auto-transfer only forces a consensus round if the last one is older than
+    # this (seconds), or a peer announced a block we couldn't simply append
+    _AUTO_TRANSFER_CONSENSUS_MAX_AGE = 30.0
+    
+    # Mined-block broadcasts run behind the miner: at most this many in flight,
+    # with a full consensus round forced every _RESOLVE_EVERY_BLOCKS blocks
+    _MAX_PENDING_BROADCASTS = 4
+    _RESOLVE_EVERY_BLOCKS = 5
+    
+    # Fold the blockchain WAL into the canonical file every this many blocks
+    _WAL_COMPACT_EVERY = 50
+    
+    # Outgoing transaction gossip batching: flush every interval, or early at max size
+    _TX_BATCH_INTERVAL = 0.1
+    _TX_BATCH_MAX = 100
+    # Broadcast dedup cache: tx IDs already gossiped are skipped for this long
+    _BROADCAST_SEEN_TTL = 300.0
+    _BROADCAST_SEEN_MAX = 100000
+
     def __init__(self, port: int = 5000, private_key: str = None):
         """
         Initialize a blockchain node.
@@ -35,14 +153,18 @@ class Node:
         self.port = port
         self.node_type = get_node_type_from_port(port)
         
+        # Our advertised URL and the netlocs identifying this node (used by _is_me)
+        self.refresh_identity()
+        
         # Initialize storage for persistence (shared across nodes)
         self.storage = Storage(port)
         
         # Initialize wallet based on authentication
         self.wallet = self._init_wallet(private_key)
+        self._address = self.wallet.address()  # Wallet is fixed for the node's lifetime
         
         # Start session (validates port availability and wallet not already active)
-        success, error = self.storage.start_session(port, self.wallet.address())
+        success, error = self.storage.start_session(port, self._address)
         if not success:
             raise RuntimeError(f"Failed to start node: {error}")
         
@@ -50,7 +172,7 @@ class Node:
         label = self._get_wallet_label()
         self.storage.register_wallet(
             self.wallet.get_private_key_hex(),
-            self.wallet.address(),
+            self._address,
             label=label
         )
         
@@ -67,38 +189,107 @@ class Node:
         # Load shared pending transactions - with version tracking
         pending_tx, self._pending_version = self.storage.load_pending_transactions()
         if pending_tx:
-            self.blockchain.pending_transactions = pending_tx
+            self.blockchain.set_pending(pending_tx)
             logger.info(f"[Node] Loaded {len(pending_tx)} pending transactions (v{self._pending_version})")
         
         # Peers are discovered dynamically via BOOTSTRAP_PEERS
+        # self.peers is only mutated under _peers_lock; readers use the
+        # copy-on-write _peers_snapshot tuple, which is republished on every
+        # mutation (attribute assignment is atomic, so no lock is needed to read it)
         self.peers = set()
+        self._peers_snapshot = ()
+        self._peer_routes = {}  # peer -> (receive_block URL, tx_batch URL)
         
-        # Thread safety
-        self._peers_lock = threading.RLock()
-        self._sync_lock = threading.RLock()
+        # Thread safety (plain Lock: never re-acquired by its holder)
+        self._peers_lock = threading.Lock()
         
         # Mining service state (only for miners)
         self.mining_active = False
-        self._mining_thread = None
         
         # Auto-transfer service state (only for miners)
         self.auto_transfer_active = False
-        self._auto_transfer_thread = None
         
         # Sync service state
         self.sync_active = False
-        self._sync_thread = None
+        
+        # Wakes the scheduler early; the flags say which queued task to pull forward
+        self._wakeup = threading.Event()
+        self._sync_requested = False
+        self._balance_changed = False
+        
+        # Single scheduler thread shared by the sync, mining and auto-transfer services
+        self._scheduler = sched.scheduler(time.monotonic, self._scheduler_delay)
+        self._scheduler_lock = threading.Lock()
+        self._scheduler_thread = None
+        self._sync_job = None
+        self._mining_job = None
+        self._auto_transfer_job = None
+        self._last_consensus = 0.0  # monotonic time of the last completed resolve_conflicts()
+        self._chain_dirty = False  # A peer announced a block that may conflict with our chain
         
         # Collection node address (set when collection node registers)
         self.collection_node_address = None
         self.collection_node_url = os.getenv("COLLECTION_NODE_URL", f"http://localhost:{COLLECTION_PORT}")
         
+        # Collection node health backoff (skip probes while known to be down)
+        self._collection_down_until = 0.0
+        self._collection_ok_until = 0.0
+        self._collection_backoff = self._COLLECTION_BACKOFF_MIN
+        
+        # Shared HTTP session (keep-alive connection reuse, no automatic retries)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        
+        # Bare urllib3 pool for the block/transaction broadcast hot path
+        # (skips requests' per-call URL parsing, cookie and hook handling)
+        self._pool = urllib3.PoolManager(
+            num_pools=32,
+            maxsize=32,
+            retries=False,
+            timeout=urllib3.Timeout(connect=1, read=3)
+        )
+        self._json_headers = {"Content-Type": "application/json"}
+        
+        # Cap concurrent broadcast RPCs and track consecutive failures per peer
+        self._broadcast_sem = threading.BoundedSemaphore(self._MAX_INFLIGHT_BROADCASTS)
+        self._peer_failures = {}  # peer -> consecutive failed broadcasts
+        
+        # Worker pool for concurrent peer I/O
+        self._io_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="node-io")
+        
+        # Mined blocks are broadcast on their own small pool (its tasks fan out
+        # over _io_pool, so they must not run on it) while the miner moves on
+        self._broadcast_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="node-broadcast")
+        self._pending_broadcasts = deque()  # Futures of in-flight block broadcasts, oldest first
+        self._blocks_since_resolve = 0
+        
+        # Outgoing transaction queue, gossiped to peers in batches
+        self._out_tx_queue = deque()
+        self._out_tx_ready = threading.Event()  # Set when the queue reaches _TX_BATCH_MAX
+        self._broadcast_seen = OrderedDict()  # tx_id -> expiry (monotonic), oldest first
+        self._broadcast_seen_lock = threading.Lock()
+        self._tx_batch_thread = threading.Thread(
+            target=self._tx_batch_loop, daemon=True, name="node-tx-batch"
+        )
+        self._tx_batch_thread.start()
+        
+        # New blocks are appended to the storage WAL off the mining/API threads
+        self._wal_queue = queue.Queue()
+        self._wal_thread = threading.Thread(
+            target=self._wal_loop, daemon=True, name="node-wal"
+        )
+        self._wal_thread.start()
+        
         # Track last sync time
         self._last_sync_time = 0
         self._sync_interval = 2  # seconds
+        self._sync_delay = self._sync_interval  # Current fallback poll delay
+        self._auto_transfer_delay = self._AUTO_TRANSFER_MIN_INTERVAL
         
         logger.info(f"[Node] Initialized as {self.node_type.upper()} on port {port}")
-        logger.info(f"[Node] Wallet address: {self.wallet.address()[:16]}...")
+        logger.info(f"[Node] Wallet address: {self._address[:16]}...")
     
     def _init_wallet(self, private_key: str = None) -> Wallet:
         """
@@ -140,7 +331,7 @@ class Node:
         - Otherwise generate a new label based on node type
         """
         # First check if wallet already has a label in storage
-        existing_wallet = self.storage.get_wallet_by_address(self.wallet.address())
+        existing_wallet = self.storage.get_wallet_by_address(self._address)
         if existing_wallet and existing_wallet.get("label"):
             return existing_wallet.get("label")
         
@@ -167,7 +358,7 @@ class Node:
 
     def get_balance(self) -> float:
         """Get current wallet balance."""
-        return self.blockchain.get_balance(self.wallet.address())
+        return self.blockchain.get_balance(self._address)
 
     # =========================================================================
     # PERSISTENCE - WITH VERSION CONTROL
@@ -184,6 +375,11 @@ class Node:
         """
         logger.info(f"[Node] Saving state for port {self.port}...")
         
+        # Flush queued WAL appends and fold them into the chain file first,
+        # so save_all finds the chain unchanged unless we switched forks
+        self._wal_queue.join()
+        self.storage.compact_blockchain()
+        
         # Use save_all which handles version conflicts and retries
         success = self.storage.save_all(
             chain=self.blockchain.chain,
@@ -198,6 +394,46 @@ class Node:
         
         return success
     
+    def persist_block(self, block):
+        """Queue a new block (mined or accepted from a peer) for the storage WAL."""
+        self._wal_queue.put(block)
+
+    def persist_chain(self, chain: list):
+        """
+        Queue a full rewrite of the chain file (after our chain was replaced).
+        WAL records only extend the on-disk tip, so blocks appended after a
+        chain swap would otherwise never link up and be dropped on replay.
+        
+        Args:
+            chain: Snapshot of the new chain (a list of Blocks)
+        """
+        self._wal_queue.put(chain)
+
+    def _wal_loop(self):
+        """Background loop: append queued blocks to the WAL, compacting every _WAL_COMPACT_EVERY blocks."""
+        appended = 0
+        while True:
+            block = self._wal_queue.get()
+            try:
+                if isinstance(block, list):
+                    # Replaced chain: rewrite the canonical file, then drop the
+                    # old fork's WAL records (compaction finds nothing to fold)
+                    self.storage.save_blockchain(block)
+                    self.storage.compact_blockchain()
+                    appended = 0
+                elif not self.storage.has_blockchain():
+                    # The WAL needs a canonical file to extend - write it once in full
+                    self.storage.save_blockchain(self.blockchain.chain)
+                elif self.storage.append_block(block):
+                    appended += 1
+                    if appended >= self._WAL_COMPACT_EVERY:
+                        appended = 0
+                        self.storage.compact_blockchain()
+            except Exception as e:
+                logger.error(f"[Storage] WAL write error: {e}")
+            finally:
+                self._wal_queue.task_done()
+
     def reload_from_disk(self) -> bool:
         """
         Reload blockchain and pending transactions from disk.
@@ -216,10 +452,8 @@ class Node:
             
             pending_tx, self._pending_version = self.storage.load_pending_transactions()
             # Merge pending transactions (don't lose any)
-            existing_ids = {tx.get('tx_id') for tx in self.blockchain.pending_transactions}
             for tx in pending_tx:
-                if tx.get('tx_id') not in existing_ids:
-                    self.blockchain.pending_transactions.append(tx)
+                self.blockchain.add_pending(tx)  # Skips ones already pending
             logger.info(f"[Node] Reloaded pending transactions (v{self._pending_version})")
             
             return True
@@ -237,6 +471,22 @@ class Node:
         """
         return self.storage.end_session(self.port)
 
+    def close(self):
+        """
+        Release networking resources: keep-alive HTTP pools, the peer I/O
+        worker pool and the signing process pool. Registered as an exit hook.
+        """
+        global _sign_pool
+        self._broadcast_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+        self._pool.clear()
+        
+        with _sign_pool_lock:
+            if _sign_pool is not None:
+                _sign_pool.shutdown(wait=False, cancel_futures=True)
+                _sign_pool = None
+
     # =========================================================================
     # PEER MANAGEMENT & AUTO-DISCOVERY
     # =========================================================================
@@ -255,7 +505,7 @@ class Node:
                 return False
             
             # Must start with http:// or https://
-            if not peer_url.startswith("http://") and not peer_url.startswith("https://"):
+            if not peer_url.startswith(PEER_URL_PREFIXES):
                 return False
             
             with self._peers_lock:
@@ -268,8 +518,12 @@ class Node:
                     return True  # Already a peer
                 
                 self.peers.add(peer_url)
+                self._publish_peers()
                 logger.info(f"[Peers] Added peer: {peer_url}")
             
+            # New peer may have a longer chain or transactions we haven't seen
+            self.request_sync()
+            
             # Propagate new peer to network (in background)
             if propagate:
                 threading.Thread(
@@ -283,63 +537,82 @@ class Node:
             logger.error(f"[Peers] Error adding peer: {e}")
             return False
 
+    def _announce_peer(self, target: str, peer: str, my_url: str):
+        """Tell target about peer. Best effort: failures are ignored."""
+        try:
+            self._http.post(
+                f"{target}/announce_peer",
+                json={"peer": peer, "from": my_url},
+                timeout=2
+            )
+        except Exception:
+            pass
+
     def _propagate_peer(self, new_peer_url: str):
         """
         Announce a new peer to all existing peers.
         This spreads peer information across the network.
+        
+        All announcements are sent concurrently on the shared I/O pool.
         """
-        host_ip = os.getenv("HOST_IP", "localhost")
-        my_url = f"http://{host_ip}:{self.port}"
+        my_url = self._my_url
         
-        with self._peers_lock:
-            peers_copy = set(self.peers)
+        peers_copy = self._peers_snapshot
         
+        # (target, peer to announce) pairs
+        announcements = []
         for peer in peers_copy:
             if peer == new_peer_url:
                 continue  # Don't send peer info back to itself
-            try:
-                # Tell this peer about the new peer
-                requests.post(
-                    f"{peer}/announce_peer",
-                    json={"peer": new_peer_url, "from": my_url},
-                    timeout=2
-                )
-            except:
-                pass
+            # Tell this peer about the new peer
+            announcements.append((peer, new_peer_url))
+            # Share our peer list with the new peer
+            announcements.append((new_peer_url, peer))
         
-        # Also tell the new peer about us and our other peers
-        try:
-            # Register ourselves with the new peer
-            requests.post(
-                f"{new_peer_url}/announce_peer",
-                json={"peer": my_url, "from": my_url},
-                timeout=2
-            )
-            # Share our peer list with them
-            for peer in peers_copy:
-                if peer != new_peer_url:
-                    requests.post(
-                        f"{new_peer_url}/announce_peer",
-                        json={"peer": peer, "from": my_url},
-                        timeout=2
-                    )
-        except:
-            pass
+        # Register ourselves with the new peer
+        announcements.append((new_peer_url, my_url))
+        
+        futures = [
+            self._io_pool.submit(self._announce_peer, target, peer, my_url)
+            for target, peer in announcements
+        ]
+        for future in futures:
+            future.result()
+
+    def get_peers(self) -> tuple:
+        """Current peers as an immutable snapshot (lock-free, safe to iterate)."""
+        return self._peers_snapshot
+
+    def _publish_peers(self):
+        """
+        Republish the lock-free peer snapshot.
+        Must be called with _peers_lock held, after every mutation of self.peers.
+        """
+        self._peers_snapshot = tuple(self.peers)
+        self._peer_routes = {
+            peer: (f"{peer}/receive_block", f"{peer}/tx_batch")
+            for peer in self._peers_snapshot
+        }
+
+    def refresh_identity(self):
+        """
+        Recompute our advertised URL from HOST_IP.
+        Done once at startup; call again only if HOST_IP changes at runtime.
+        """
+        self._host_ip = os.getenv("HOST_IP", "localhost")
+        self._my_url = f"http://{self._host_ip}:{self.port}"
+        self._me_netlocs = frozenset(
+            f"{host}:{self.port}".lower()
+            for host in ("localhost", "127.0.0.1", "0.0.0.0", self._host_ip)
+        )
 
     def _is_me(self, url: str) -> bool:
         """Check if a URL refers to this node."""
         if not url:
             return False
-            
-        host_ip = os.getenv("HOST_IP", "localhost")
-        identifiers = [
-            f"localhost:{self.port}",
-            f"127.0.0.1:{self.port}",
-            f"0.0.0.0:{self.port}",
-            f"{host_ip}:{self.port}"
-        ]
         
-        return any(x in url for x in identifiers)
+        # Exact netloc match: "localhost:5000" must not match "localhost:50001"
+        return urlsplit(url).netloc.lower() in self._me_netlocs
 
     def connect_to_bootstrap_peers(self):
         """
@@ -348,19 +621,20 @@ class Node:
         """
         connected = 0
         
-        for peer_url in BOOTSTRAP_PEERS:
-            # Skip self
-            if self._is_me(peer_url):
-                continue
-            
+        # Check which peers are online, all at once (one dead peer no longer stalls startup)
+        futures = {
+            self._io_pool.submit(self._http.get, peer_url, timeout=(self._PROBE_TIMEOUT, 2)): peer_url
+            for peer_url in BOOTSTRAP_PEERS
+            if not self._is_me(peer_url)  # Skip self
+        }
+        
+        for future in as_completed(futures):
             try:
-                # Check if peer is online
-                response = requests.get(peer_url, timeout=2)
-                if response.status_code == 200:
+                if future.result().status_code == 200:
                     # Add peer locally
-                    self.add_peer(peer_url, propagate=True)
+                    self.add_peer(futures[future], propagate=True)
                     connected += 1
-            except:
+            except Exception:
                 pass  # Peer not available
         
         if connected > 0:
@@ -373,10 +647,33 @@ class Node:
         with self._peers_lock:
             if peer_url in self.peers:
                 self.peers.discard(peer_url)
+                self._peer_failures.pop(peer_url, None)
+                self._publish_peers()
                 logger.info(f"[Peers] Removed peer: {peer_url}")
                 return True
             return False
 
+    def _fetch_peer_list(self, peer: str) -> list:
+        """Fetch a peer's peer list. Returns [] if the peer is unreachable."""
+        try:
+            response = self._http.get(f"{peer}/peers", timeout=(self._PROBE_TIMEOUT, 3))
+            if response.status_code == 200:
+                # Get the peers list from the response dict
+                return response.json().get("peers", [])
+        except Exception:
+            pass
+        return []
+
+    def _probe_peer(self, peer: str) -> bool:
+        """Cheap reachability check: can we open a TCP connection to the peer?"""
+        try:
+            parts = urlsplit(peer)
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            with socket.create_connection((parts.hostname, port), timeout=self._PROBE_TIMEOUT):
+                return True
+        except (OSError, ValueError):
+            return False
+
     def discover_peers_from_network(self) -> int:
         """
         Discover new peers from existing peers.
@@ -384,43 +681,50 @@ class Node:
         """
         new_peers = set()
         
-        with self._peers_lock:
-            current_peers = set(self.peers)
+        current_peers = self._peers_snapshot
         
-        for peer in current_peers:
-            try:
-                response = requests.get(f"{peer}/peers", timeout=3)
-                if response.status_code == 200:
-                    data = response.json()
-                    # Get the peers list from the response dict
-                    peer_list = data.get("peers", [])
-                    for p in peer_list:
-                        # Validate it's a proper URL before adding
-                        if isinstance(p, str) and (p.startswith("http://") or p.startswith("https://")):
-                            if p not in current_peers and not self._is_me(p):
-                                new_peers.add(p)
-            except Exception:
-                pass
+        # Ask every peer for its peer list in parallel
+        for peer_list in self._io_pool.map(self._fetch_peer_list, current_peers):
+            for p in peer_list:
+                # Validate it's a proper URL before adding
+                if isinstance(p, str) and p.startswith(PEER_URL_PREFIXES):
+                    if p not in current_peers and not self._is_me(p):
+                        new_peers.add(p)
+        
+        # Only keep peers that are actually reachable (probed in parallel)
+        if new_peers:
+            candidates = list(new_peers)
+            new_peers = {
+                p for p, alive in zip(candidates, self._io_pool.map(self._probe_peer, candidates))
+                if alive
+            }
         
         # Add discovered peers (without propagation since they already exist)
-        with self._peers_lock:
-            for p in new_peers:
-                if p not in self.peers:
-                    self.peers.add(p)
+        if new_peers:
+            with self._peers_lock:
+                self.peers.update(new_peers)
+                self._publish_peers()
         
         if new_peers:
             logger.info(f"[Peers] Discovered {len(new_peers)} new peers")
         
         return len(new_peers)
 
+    def _register_with_peer(self, peer: str, my_url: str, timeout: float):
+        """POST our URL to a peer's /register_node. Returns the response."""
+        return self._http.post(
+            f"{peer}/register_node",
+            json={"node_url": my_url},
+            timeout=timeout
+        )
+
     def register_with_network(self, known_peer: str = None) -> bool:
         """
         Register this node with the network.
         Connects to known peer and discovers other peers.
         """
         try:
-            host_ip = os.getenv("HOST_IP", "localhost")
-            my_url = f"http://{host_ip}:{self.port}"
+            my_url = self._my_url
             
             # If no known peer, try default network nodes
             if not known_peer:
@@ -433,20 +737,19 @@ class Node:
             
             # Track peers we've already registered with to avoid duplicates
             registered_with = set()
+            discovered = []
             
-            for peer in known_peers:
-                if self._is_me(peer):
-                    continue
-                if peer in registered_with:
-                    continue
-                    
+            # Register self with every known peer in parallel
+            futures = {
+                self._io_pool.submit(self._register_with_peer, peer, my_url, 5): peer
+                for peer in dict.fromkeys(known_peers)
+                if not self._is_me(peer)
+            }
+            
+            for future in as_completed(futures):
+                peer = futures[future]
                 try:
-                    # Register self with the peer
-                    response = requests.post(
-                        f"{peer}/register_node",
-                        json={"node_url": my_url},
-                        timeout=5
-                    )
+                    response = future.result()
                     
                     if response.status_code in [200, 201]:
                         self.add_peer(peer)
@@ -454,24 +757,28 @@ class Node:
                         connected = True
                         logger.info(f"[Network] Registered with {peer}")
                         
-                        # Get their peers too and register with them
-                        data = response.json()
-                        for p in data.get("peers", []):
-                            if not self._is_me(p) and p not in registered_with:
-                                self.add_peer(p)
-                                # Register with discovered peer (one-time, no cascade)
-                                try:
-                                    requests.post(
-                                        f"{p}/register_node",
-                                        json={"node_url": my_url},
-                                        timeout=3
-                                    )
-                                    registered_with.add(p)
-                                except:
-                                    pass
+                        # Get their peers too
+                        discovered.extend(
+                            p for p in response.json().get("peers", []) if isinstance(p, str)
+                        )
                 except Exception as e:
                     logger.debug(f"[Network] Could not connect to {peer}: {e}")
             
+            # Register with discovered peers (one-time, no cascade), also in parallel
+            new_peers = [
+                p for p in dict.fromkeys(discovered)
+                if not self._is_me(p) and p not in registered_with
+            ]
+            for p in new_peers:
+                self.add_peer(p)
+            
+            futures = [self._io_pool.submit(self._register_with_peer, p, my_url, 3) for p in new_peers]
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+            
             if connected:
                 # Sync blockchain after joining
                 self.sync_with_network()
@@ -488,74 +795,137 @@ class Node:
     # CONSENSUS & SYNC
     # =========================================================================
 
+    def _get_peer_chain_json(self, peer: str, params: dict = None):
+        """GET a peer's /chain. Returns (status_code, payload or None)."""
+        response = self._http.get(f"{peer}/chain", params=params, timeout=10)
+        if response.status_code != 200:
+            return response.status_code, None
+        return 200, _json_loads(response.content)
+
+    def _fetch_peer_chain(self, peer: str):
+        """
+        Fetch the part of a peer's chain that we don't have yet.
+        
+        Asks for /chain?since=<our length>. When the peer's block just before
+        that point matches our tip, only the new suffix is transferred and our
+        own blocks are reused as the prefix. Falls back to the full chain when
+        the peer has forked below our tip or doesn't support ``since``.
+        
+        Returns:
+            (prefix_blocks, suffix_dicts) for a peer chain longer than ours,
+            or None if the peer is unreachable or not ahead of us
+        """
+        local_chain = self.blockchain.chain
+        since = len(local_chain)
+        try:
+            status, data = self._get_peer_chain_json(peer, {"since": since})
+            if status == 400:
+                status, data = self._get_peer_chain_json(peer)
+            if not data or data.get('length', 0) <= since:
+                return None
+            
+            if data.get('since') == since:
+                if data.get('anchor_hash') == local_chain[since - 1].hash:
+                    return local_chain[:since], data.get('chain', [])
+                
+                # Fork below our tip - need the peer's full chain
+                status, data = self._get_peer_chain_json(peer)
+                if not data:
+                    return None
+            
+            return [], data.get('chain', [])
+        except requests.exceptions.RequestException:
+            pass
+        except Exception as e:
+            logger.debug(f"[Consensus] Error fetching chain from {peer}: {e}")
+        return None
+
+    def _validate_peer_chain(self, prefix: list, suffix: list) -> bool:
+        """
+        Validate a peer chain straight from its JSON blocks.
+        Only the suffix is checked when it extends our own (already valid) prefix.
+        Runs on the I/O pool so competing chains are validated concurrently.
+        """
+        try:
+            anchor_hash = prefix[-1].hash if prefix else None
+            return self.blockchain.is_valid_chain_from_dicts(suffix, anchor_hash)
+        except Exception as e:
+            logger.debug(f"[Consensus] Error processing peer chain: {e}")
+            return False
+
     def resolve_conflicts(self) -> bool:
         """
         Resolve conflicts by adopting the longest valid chain.
         Implements the longest chain rule for consensus.
         
+        Peer chains are fetched concurrently, and every candidate longer than
+        ours is validated on the shared thread pool (threads, not processes,
+        so the large chain payloads are never pickled across process boundaries).
+        
+        Fetching, validation and Block construction all run without any lock;
+        the chain lock is only held to re-check the length and swap the chain in,
+        so a block mined or received meanwhile can't be appended in between.
+        
         Returns:
             True if our chain was replaced
         """
-        with self._sync_lock:
-            try:
-                longest_chain = None
-                max_length = len(self.blockchain.chain)
-                replaced = False
-                
-                with self._peers_lock:
-                    peers_copy = set(self.peers)
-                
-                for peer in peers_copy:
-                    try:
-                        response = requests.get(f"{peer}/chain", timeout=10)
-                        if response.status_code != 200:
-                            continue
-                            
-                        data = response.json()
-                        chain_length = data.get('length', 0)
-                        
-                        # Only process if longer
-                        if chain_length <= max_length:
-                            continue
-                        
-                        peer_chain = []
-                        for b in data['chain']:
-                            block = Block(
-                                b['index'],
-                                b['timestamp'],
-                                b['data'],
-                                b['previous_hash'],
-                                b['nonce']
-                            )
-                            block.hash = b['hash']
-                            peer_chain.append(block)
-                        
-                        # Validate the chain
-                        if self.blockchain.is_valid_chain(peer_chain):
-                            max_length = len(peer_chain)
-                            longest_chain = peer_chain
-                            
-                    except requests.exceptions.RequestException:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"[Consensus] Error processing peer chain: {e}")
-                        continue
+        try:
+            longest_chain = None
+            max_length = len(self.blockchain.chain)
+            
+            peers_copy = self._peers_snapshot
+            
+            validations = {}
+            for candidate in self._io_pool.map(self._fetch_peer_chain, peers_copy):
+                # Only process if longer
+                if not candidate or len(candidate[0]) + len(candidate[1]) <= max_length:
+                    continue
+                validations[self._io_pool.submit(self._validate_peer_chain, *candidate)] = candidate
+            
+            # Keep the longest valid chain as validations complete
+            for future in as_completed(validations):
+                prefix, suffix = validations[future]
+                if future.result() and len(prefix) + len(suffix) > max_length:
+                    max_length = len(prefix) + len(suffix)
+                    longest_chain = validations[future]
+            
+            replaced = False
+            
+            if longest_chain:
+                # Only the winning chain's new blocks are materialized into Block objects
+                prefix, suffix = longest_chain
+                new_chain = prefix + self.blockchain._restore_chain(suffix)
                 
-                if longest_chain:
-                    self.blockchain.chain = longest_chain
-                    with self.blockchain._lock:
+                # Same lock mine_block/add_block append under: the check and the
+                # swap must be atomic with respect to them
+                with self.blockchain._lock:
+                    # Our chain may have grown (mined/received a block) or been
+                    # replaced by a concurrent sync while we were fetching
+                    if len(new_chain) > len(self.blockchain.chain):
+                        self.blockchain.chain = new_chain
                         self.blockchain._invalidate_cache()
+                        # Queued under the lock, so blocks appended after the
+                        # swap reach the WAL only after the new chain file
+                        self.persist_chain(list(new_chain))
+                        replaced = True
+                
+                if replaced:
                     # CRITICAL: Clean up pending transactions after chain replacement
                     # This removes any transactions that are now in the new chain
                     self.blockchain.cleanup_pending_transactions()
-                    replaced = True
                     logger.info(f"[Consensus] Chain replaced. New length: {len(self.blockchain.chain)}")
-                
-                return replaced
-                
-            except Exception as e:
-                logger.error(f"[Consensus] Error: {e}")
-                return False
+                    
+                    # The network is moving - follow up with a full sync
+                    self.request_sync()
+                    self.notify_balance_changed()
+            
+            self._last_consensus = time.monotonic()
+            self._chain_dirty = False
+            return replaced
+            
+        except Exception as e:
+            logger.error(f"[Consensus] Error: {e}")
+            return False
 
     def sync_with_network(self) -> bool:
         """
@@ -581,37 +951,149 @@ class Node:
             logger.error(f"[Sync] Error: {e}")
             return False
 
+    def _fetch_peer_mempool(self, peer: str, known_filter: bytes) -> list:
+        """
+        Fetch the pending transactions a peer has that we don't.
+        
+        Posts a Bloom filter of our pending tx_ids to /mempool/missing, so only
+        the difference comes back; falls back to the full /mempool for peers
+        without that endpoint. Returns [] if the peer is unreachable.
+        """
+        try:
+            response = self._http.post(f"{peer}/mempool/missing", data=known_filter,
+                                       headers=self._json_headers, timeout=5)
+            if response.status_code in (404, 405):
+                response = self._http.get(f"{peer}/mempool", timeout=5)
+            if response.status_code == 200:
+                return _json_loads(response.content).get("transactions", [])
+        except Exception:
+            pass
+        return []
+
     def _sync_pending_transactions(self):
         """
         Sync pending transactions from peers.
         CRITICAL: Also checks that transactions aren't already mined.
+        
+        All peer mempools are fetched in parallel and merged first, so a
+        transaction announced by several peers is validated only once.
+        
+        Expects our own pool to be cleaned of mined transactions already
+        (sync_with_network runs cleanup_pending_transactions just before).
         """
-        with self._peers_lock:
-            peers_copy = set(self.peers)
+        peers_copy = self._peers_snapshot
         
-        # First, clean up our own pending transactions
-        self.blockchain.cleanup_pending_transactions()
+        # One filter of what we already hold, shared by every peer request
+        known_filter = _json_bytes(TxIdBloomFilter.from_ids(
+            [tx.get("tx_id") for tx in self.blockchain.pending_transactions]
+        ).to_dict())
         
-        # Get existing tx IDs (both pending AND mined)
-        existing_tx_ids = {tx.get("tx_id") for tx in self.blockchain.pending_transactions}
-        mined_tx_ids = self.blockchain.get_mined_transaction_ids()
+        # Merge all peers' mempools (first announcement wins)
+        candidates = {}
+        filters = [known_filter] * len(peers_copy)
+        for transactions in self._io_pool.map(self._fetch_peer_mempool, peers_copy, filters):
+            for tx in transactions:
+                if not isinstance(tx, dict):
+                    continue
+                tx_id = tx.get("tx_id")
+                # Skip if already in pending OR already mined (indexed lookups, no rescans)
+                if tx_id and tx_id not in candidates and not self.blockchain.is_transaction_known(tx_id):
+                    candidates[tx_id] = tx
         
-        for peer in peers_copy:
+        for tx in candidates.values():
+            try:
+                # Validate before adding (this also checks chain)
+                is_valid, error = self.blockchain.validate_transaction(tx)
+                if is_valid:
+                    self.blockchain.add_pending(tx)
+            except Exception as e:
+                logger.debug(f"[Sync] Skipping invalid peer transaction: {e}")
+
+    # =========================================================================
+    # BACKGROUND SCHEDULER
+    # =========================================================================
+
+    def _schedule(self, delay: float, priority: int, action):
+        """
+        Queue a background task and make sure the scheduler thread is running.
+        
+        Args:
+            delay: Seconds from now to run the task
+            priority: Tie-breaker for tasks due at the same time (lower runs first)
+            action: Callable taking no arguments
+            
+        Returns:
+            The sched event (usable with scheduler.cancel)
+        """
+        with self._scheduler_lock:
+            job = self._scheduler.enter(delay, priority, action)
+            if self._scheduler_thread is None:
+                self._scheduler_thread = threading.Thread(
+                    target=self._scheduler_loop, daemon=True, name="node-scheduler"
+                )
+                self._scheduler_thread.start()
+            return job
+
+    def _scheduler_loop(self):
+        """Run queued tasks until every service has stopped rescheduling itself."""
+        while True:
+            self._scheduler.run()
+            with self._scheduler_lock:
+                if self._scheduler.empty():
+                    self._scheduler_thread = None
+                    return
+
+    def _scheduler_delay(self, timeout: float):
+        """
+        Scheduler sleep function.
+        Sleeps on the sync wake-up event so request_sync() pulls the next sync forward.
+        """
+        if self._wakeup.wait(timeout):
+            self._wakeup.clear()
+            if self._sync_requested:
+                self._sync_requested = False
+                self._expedite("_sync_job", 0, self._sync_task)
+            if self._balance_changed:
+                self._balance_changed = False
+                self._expedite("_auto_transfer_job", 2, self._auto_transfer_task)
+
+    def _expedite(self, job_attr: str, priority: int, action):
+        """
+        Move a queued task (if any) to run immediately.
+        
+        Args:
+            job_attr: Name of the attribute holding the task's sched event
+            priority: The task's scheduling priority
+            action: The task callable
+        """
+        with self._scheduler_lock:
+            job = getattr(self, job_attr)
+            if job is None:
+                return
             try:
-                response = requests.get(f"{peer}/mempool", timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-                    for tx in data.get("transactions", []):
-                        tx_id = tx.get("tx_id")
-                        # Skip if already in pending OR already mined
-                        if tx_id and tx_id not in existing_tx_ids and tx_id not in mined_tx_ids:
-                            # Validate before adding (this also checks chain)
-                            is_valid, error = self.blockchain.validate_transaction(tx)
-                            if is_valid:
-                                self.blockchain.pending_transactions.append(tx)
-                                existing_tx_ids.add(tx_id)
-            except:
-                pass
+                self._scheduler.cancel(job)
+            except ValueError:
+                # Already running or finished; it reschedules itself
+                return
+            setattr(self, job_attr, self._scheduler.enter(0, priority, action))
+
+    def _consensus_check(self, max_age: float = None):
+        """
+        Run resolve_conflicts() if the chain was marked dirty, or unless a
+        consensus round finished within max_age seconds (default _CONSENSUS_INTERVAL).
+        """
+        if max_age is None:
+            max_age = self._CONSENSUS_INTERVAL
+        if self._chain_dirty or time.monotonic() - self._last_consensus >= max_age:
+            self.resolve_conflicts()
+
+    def mark_chain_dirty(self):
+        """Note that a peer announced a block we couldn't append (possible fork)."""
+        self._chain_dirty = True
+
+    # =========================================================================
+    # SYNC SERVICE
+    # =========================================================================
 
     def start_sync_service(self):
         """Start background sync service."""
@@ -619,25 +1101,49 @@ class Node:
             return False
         
         self.sync_active = True
-        self._sync_thread = threading.Thread(target=self._sync_loop, daemon=True)
-        self._sync_thread.start()
+        if self._sync_job is None:
+            self._sync_job = self._schedule(0, 0, self._sync_task)
         logger.info("[Sync] Background sync service started")
         return True
 
     def stop_sync_service(self):
         """Stop background sync service."""
         self.sync_active = False
+        # Wake the scheduler so the sync task drops out promptly
+        self._sync_requested = True
+        self._wakeup.set()
         logger.info("[Sync] Background sync service stopped")
 
-    def _sync_loop(self):
-        """Background sync loop."""
-        while self.sync_active:
-            try:
-                self.sync_with_network()
-                time.sleep(self._sync_interval)
-            except Exception as e:
-                logger.error(f"[Sync] Loop error: {e}")
-                time.sleep(5)
+    def request_sync(self):
+        """
+        Wake the background sync task (called when peers announce new
+        blocks/transactions, a peer joins, or our chain is replaced).
+        Also resets the idle back-off so follow-up syncs stay frequent.
+        """
+        self._sync_delay = self._sync_interval
+        self._sync_requested = True
+        self._wakeup.set()
+
+    def _sync_task(self):
+        """
+        Scheduled sync task.
+        Runs immediately when request_sync() is called; otherwise it falls back
+        to polling, doubling the delay from _sync_interval up to _SYNC_IDLE_MAX
+        while nothing happens on the network.
+        """
+        if not self.sync_active:
+            self._sync_job = None
+            return
+        
+        delay = self._sync_delay
+        self._sync_delay = min(delay * 2, self._SYNC_IDLE_MAX)
+        try:
+            self.sync_with_network()
+        except Exception as e:
+            logger.error(f"[Sync] Task error: {e}")
+            delay = 5
+        
+        self._sync_job = self._schedule(delay, 0, self._sync_task)
 
     # =========================================================================
     # MINING SERVICE (Only for Miner nodes)
@@ -654,8 +1160,8 @@ class Node:
             return False
         
         self.mining_active = True
-        self._mining_thread = threading.Thread(target=self._mining_loop, daemon=True)
-        self._mining_thread.start()
+        if self._mining_job is None:
+            self._mining_job = self._schedule(0, 1, self._mining_task)
         logger.info("[Mining] Mining service started")
         return True
 
@@ -668,106 +1174,247 @@ class Node:
         logger.info("[Mining] Mining service stopped")
         return True
 
-    def _mining_loop(self):
+    def _mining_task(self):
         """
-        Background mining loop - mines blocks continuously.
+        Scheduled mining task - mines one block, then requeues itself.
         Implements proper consensus check before mining.
         """
-        while self.mining_active:
-            try:
-                # STEP 1: Sync with network before mining (consensus)
-                # This prevents mining on an outdated chain
-                self.resolve_conflicts()
+        if not self.mining_active:
+            self._mining_job = None
+            return
+        
+        delay = self._MINING_DELAY
+        try:
+            # STEP 1: Sync with network before mining (consensus)
+            # This prevents mining on an outdated chain; skipped if the
+            # sync task just completed a consensus round
+            self._consensus_check()
+            
+            # STEP 2: Mine block
+            block = self.blockchain.mine_block(self._address)
+            
+            if block:
+                # STEP 3: Verify we still have the longest chain after mining
+                # (another miner might have broadcasted while we were mining)
+                pre_broadcast_length = len(self.blockchain.chain)
                 
-                # STEP 2: Mine block
-                block = self.blockchain.mine_block(self.wallet.address())
+                balance = self.get_balance()
+                tx_count = len(block.data) - 1  # Exclude coinbase
+                logger.info(f"[Mining] ⛏️  Block #{block.index} mined! "
+                            f"Reward: {MINING_REWARD} {COIN_SYMBOL}, "
+                            f"Transactions: {tx_count}, "
+                            f"Balance: {balance:.2f} {COIN_SYMBOL}")
                 
-                if block:
-                    # STEP 3: Verify we still have the longest chain after mining
-                    # (another miner might have broadcasted while we were mining)
-                    pre_broadcast_length = len(self.blockchain.chain)
-                    
-                    balance = self.get_balance()
-                    tx_count = len(block.data) - 1  # Exclude coinbase
-                    logger.info(f"[Mining] ⛏️  Block #{block.index} mined! "
-                                f"Reward: {MINING_REWARD} {COIN_SYMBOL}, "
-                                f"Transactions: {tx_count}, "
-                                f"Balance: {balance:.2f} {COIN_SYMBOL}")
-                    
-                    # STEP 4: Broadcast block to peers immediately
-                    accepted_count = self._broadcast_block(block)
-                    
-                    # STEP 5: Quick sync to handle any conflicts
+                # STEP 4: Persist and broadcast the block in the background, keep mining
+                self.persist_block(block)
+                self._submit_block_broadcast(block)
+                self.notify_balance_changed()
+                
+                # STEP 5: Periodic full sync to handle any conflicts (the pre-mine
+                # consensus check covers the blocks in between)
+                self._blocks_since_resolve += 1
+                if self._blocks_since_resolve >= self._RESOLVE_EVERY_BLOCKS:
+                    self._blocks_since_resolve = 0
                     self.resolve_conflicts()
                     
                     # Check if our block was accepted (chain length should be same or greater)
                     if len(self.blockchain.chain) < pre_broadcast_length:
                         logger.warning(f"[Mining] Block may have been orphaned (chain replaced)")
-                
-                # Small delay between mining attempts
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"[Mining] Error: {e}")
-                time.sleep(1)
+            
+        except Exception as e:
+            logger.error(f"[Mining] Error: {e}")
+            delay = 1
+        
+        # Small delay between mining attempts
+        self._mining_job = self._schedule(delay, 1, self._mining_task)
 
-    def _broadcast_block(self, block) -> int:
+    def _submit_block_broadcast(self, block):
         """
-        Broadcast mined block to all peers.
-        Returns number of peers that accepted the block.
+        Broadcast a mined block without blocking the miner.
+        Waits only if _MAX_PENDING_BROADCASTS broadcasts are still in flight.
         """
-        block_dict = {
-            "index": block.index,
-            "timestamp": block.timestamp,
-            "data": block.data,
-            "previous_hash": block.previous_hash,
-            "nonce": block.nonce,
-            "hash": block.hash
-        }
+        pending = self._pending_broadcasts
+        while pending and pending[0].done():
+            pending.popleft()
         
-        accepted_count = 0
+        if len(pending) >= self._MAX_PENDING_BROADCASTS:
+            # Backpressure: let the oldest broadcast finish first
+            pending.popleft().result()
         
+        pending.append(self._broadcast_pool.submit(self._broadcast_block, block))
+
+    def _post_json(self, url: str, body: bytes) -> int:
+        """POST a pre-serialized JSON body over the broadcast pool. Returns the HTTP status."""
+        response = self._pool.request("POST", url, body=body, headers=self._json_headers)
+        return response.status
+
+    def _mark_peer_unhealthy(self, peer: str):
+        """Count a failed broadcast to peer; drop it after too many consecutive failures."""
         with self._peers_lock:
-            peers_copy = set(self.peers)
+            failures = self._peer_failures.get(peer, 0) + 1
+            self._peer_failures[peer] = failures
         
-        for peer in peers_copy:
+        if failures >= self._MAX_PEER_FAILURES:
+            logger.info(f"[Peers] Dropping {peer} after {failures} failed broadcasts")
+            self.remove_peer(peer)
+
+    def _post_to_peer(self, peer: str, url: str, body: bytes) -> bool:
+        """
+        POST a broadcast payload to one peer, bounded by the in-flight semaphore.
+        
+        Args:
+            peer: Peer base URL (used for failure tracking)
+            url: Full endpoint URL
+            body: Pre-serialized JSON body
+            
+        Returns:
+            True if the peer accepted the payload
+        """
+        with self._broadcast_sem:
             try:
-                response = requests.post(
-                    f"{peer}/receive_block", 
-                    json=block_dict, 
-                    timeout=5
-                )
-                if response.status_code in [200, 201]:
-                    accepted_count += 1
+                accepted = self._post_json(url, body) in (200, 201)
             except Exception as e:
-                logger.debug(f"[Broadcast] Failed to send block to {peer}: {e}")
+                logger.debug(f"[Broadcast] Failed to reach {peer}: {e}")
+                self._mark_peer_unhealthy(peer)
+                return False
+        
+        # Peer answered, so it is reachable again
+        if self._peer_failures.get(peer):
+            with self._peers_lock:
+                self._peer_failures.pop(peer, None)
+        return accepted
+
+    def _broadcast_block(self, block) -> int:
+        """
+        Broadcast mined block to all peers.
+        Returns number of peers that accepted the block.
+        """
+        body = block.to_json_bytes()
+        
+        peer_routes = self._peer_routes
+        
+        futures = [
+            self._io_pool.submit(self._post_to_peer, peer, block_url, body)
+            for peer, (block_url, _) in peer_routes.items()
+        ]
+        accepted_count = sum(1 for future in futures if future.result())
         
-        logger.debug(f"[Broadcast] Block accepted by {accepted_count}/{len(peers_copy)} peers")
+        logger.debug(f"[Broadcast] Block accepted by {accepted_count}/{len(peer_routes)} peers")
         return accepted_count
 
-    def _broadcast_transaction(self, tx_dict: dict) -> int:
+    def _fanout_routes(self) -> list:
+        """
+        Pick the peers to gossip a transaction to: a random subset of
+        max(TX_BROADCAST_FANOUT, sqrt(N)) peers, which relay it onward.
+        
+        Returns:
+            List of (peer, routes) pairs from _peer_routes
         """
-        Broadcast transaction to all peers.
-        Returns number of peers that received it.
+        routes = list(self._peer_routes.items())
+        k = max(TX_BROADCAST_FANOUT, math.isqrt(len(routes)))
+        if len(routes) <= k:
+            return routes
+        return random.sample(routes, k)
+
+    def _mark_broadcast(self, tx_id: str) -> bool:
         """
-        received_count = 0
+        Record that a transaction is being gossiped, in a TTL'd seen-cache.
         
-        with self._peers_lock:
-            peers_copy = set(self.peers)
+        Entries are kept in insertion (= expiry) order, so expired ones are
+        trimmed from the front in O(expired).
         
-        for peer in peers_copy:
+        Returns:
+            True if it was not broadcast within the last _BROADCAST_SEEN_TTL seconds
+        """
+        now = time.monotonic()
+        seen = self._broadcast_seen
+        
+        with self._broadcast_seen_lock:
+            while seen:
+                oldest_id, expiry = next(iter(seen.items()))
+                if expiry > now and len(seen) < self._BROADCAST_SEEN_MAX:
+                    break
+                del seen[oldest_id]
+            
+            if tx_id in seen:
+                return False
+            seen[tx_id] = now + self._BROADCAST_SEEN_TTL
+            return True
+
+    def queue_transaction(self, tx_dict: dict, tx_bytes: bytes = None):
+        """
+        Queue a transaction for the next batched gossip to peers.
+        Transactions already broadcast recently are skipped, so relayed gossip doesn't loop.
+        
+        Args:
+            tx_dict: Signed transaction dict (already added to pending)
+            tx_bytes: Its JSON bytes, if already serialized (saves re-encoding)
+        """
+        tx_id = tx_dict.get("tx_id")
+        if tx_id and not self._mark_broadcast(tx_id):
+            return
+        
+        self._out_tx_queue.append(tx_bytes or _json_bytes(tx_dict))
+        if len(self._out_tx_queue) >= self._TX_BATCH_MAX:
+            self._out_tx_ready.set()
+
+    def _admit_and_broadcast(self, tx_dict: dict, tx_bytes: bytes = None):
+        """
+        Admit a transaction to our pending pool and queue it for gossip.
+        
+        The append is lock-free and the network I/O happens later on the batch
+        thread, so no mempool lock is ever held across a peer request.
+        
+        Args:
+            tx_dict: Validated transaction dict
+            tx_bytes: Its JSON bytes, if already serialized
+            
+        Returns:
+            True if admitted, False if it was already pending or mined
+            (e.g. the same transaction relayed by another peer just now)
+        """
+        if not self.blockchain.add_pending(tx_dict):
+            return False
+        self.queue_transaction(tx_dict, tx_bytes)
+        return True
+
+    def _tx_batch_loop(self):
+        """Background loop: flush queued transactions every _TX_BATCH_INTERVAL (or as soon as a batch fills)."""
+        while True:
             try:
-                response = requests.post(
-                    f"{peer}/receive_transaction",
-                    json=tx_dict,
-                    timeout=5
-                )
-                if response.status_code in [200, 201]:
-                    received_count += 1
-            except Exception:
-                pass
+                self._out_tx_ready.wait(timeout=self._TX_BATCH_INTERVAL)
+                self._out_tx_ready.clear()
+                
+                queue = self._out_tx_queue
+                while queue:
+                    batch = []
+                    while queue and len(batch) < self._TX_BATCH_MAX:
+                        batch.append(queue.popleft())
+                    self._broadcast_transaction_batch(batch)
+            except Exception as e:
+                logger.error(f"[Broadcast] Batch error: {e}")
+
+    def _broadcast_transaction_batch(self, txs: list) -> int:
+        """
+        Gossip a batch of transactions to a fan-out subset of peers, one request per peer.
+        
+        Args:
+            txs: List of serialized transactions (JSON bytes)
+            
+        Returns:
+            Number of peers that accepted the batch
+        """
+        # Splice the pre-serialized transactions into the batch envelope
+        body = b'{"type":"tx_batch","txs":[' + b",".join(txs) + b"]}"
         
-        return received_count
+        futures = [
+            self._io_pool.submit(self._post_to_peer, peer, batch_url, body)
+            for peer, (_, batch_url) in self._fanout_routes()
+        ]
+        accepted_count = sum(1 for future in as_completed(futures) if future.result())
+        
+        logger.debug(f"[Broadcast] Batch of {len(txs)} transactions accepted by {accepted_count}/{len(futures)} peers")
+        return accepted_count
 
     # =========================================================================
     # AUTO-TRANSFER SERVICE (Only for Miner nodes)
@@ -784,8 +1431,9 @@ class Node:
             return False
         
         self.auto_transfer_active = True
-        self._auto_transfer_thread = threading.Thread(target=self._auto_transfer_loop, daemon=True)
-        self._auto_transfer_thread.start()
+        self._auto_transfer_delay = self._AUTO_TRANSFER_MIN_INTERVAL
+        if self._auto_transfer_job is None:
+            self._auto_transfer_job = self._schedule(0, 2, self._auto_transfer_task)
         logger.info(f"[AutoTransfer] Service started (threshold: {MINER_AUTO_TRANSFER_THRESHOLD} {COIN_SYMBOL})")
         return True
 
@@ -795,63 +1443,76 @@ class Node:
             return False
         
         self.auto_transfer_active = False
+        self.notify_balance_changed()  # Wake the scheduler so the task drops out promptly
         logger.info("[AutoTransfer] Service stopped")
         return True
 
-    def _auto_transfer_loop(self):
-        """Background loop to check balance and auto-transfer to collection."""
-        while self.auto_transfer_active:
-            try:
-                # Sync with network first
-                self.resolve_conflicts()
-                
-                balance = self.get_balance()
-                
-                # Check if we have pending auto-transfers already
-                pending_auto_transfers = sum(
-                    float(tx.get("amount", 0)) 
-                    for tx in self.blockchain.pending_transactions 
-                    if tx.get("sender") == self.wallet.address() and tx.get("tx_type") == "auto_transfer"
-                )
-                
-                # Available balance = balance - pending outgoing transfers
-                available_balance = balance - pending_auto_transfers
-                
-                if available_balance >= MINER_AUTO_TRANSFER_THRESHOLD:
-                    # First check if collection node is online
-                    if not self._is_collection_node_online():
-                        logger.warning("[AutoTransfer] Collection node is offline. Keeping coins safe with miner.")
-                    else:
-                        # Get collection node address
-                        collection_address = self._get_collection_address()
-                        
-                        if collection_address:
-                            # Determine transfer amount
-                            if AUTO_TRANSFER_ALL:
-                                # Transfer ALL available balance (leaves 0)
-                                transfer_amount = available_balance
-                            else:
-                                # Transfer only threshold amount
-                                transfer_amount = MINER_AUTO_TRANSFER_THRESHOLD
-                            
-                            success = self.create_transfer(
-                                receiver=collection_address,
-                                amount=transfer_amount,
-                                tx_type=TransactionType.AUTO_TRANSFER
-                            )
-                            
-                            if success:
-                                logger.info(f"[AutoTransfer] 💰 Transferred {transfer_amount:.2f} {COIN_SYMBOL} "
-                                            f"to Collection Node. Remaining: {available_balance - transfer_amount:.2f} {COIN_SYMBOL}")
+    def notify_balance_changed(self):
+        """
+        Wake the auto-transfer task (called when a block is mined or accepted,
+        or the chain is replaced - the only events that change confirmed balances).
+        Also resets the idle back-off so follow-up checks stay frequent.
+        """
+        self._auto_transfer_delay = self._AUTO_TRANSFER_MIN_INTERVAL
+        self._balance_changed = True
+        self._wakeup.set()
+
+    def _auto_transfer_task(self):
+        """
+        Scheduled task: check balance and auto-transfer to collection.
+        Runs on notify_balance_changed(); otherwise it falls back to polling,
+        doubling the delay from _AUTO_TRANSFER_MIN_INTERVAL up to
+        AUTO_TRANSFER_MAX_INTERVAL while nothing changes.
+        """
+        if not self.auto_transfer_active:
+            self._auto_transfer_job = None
+            return
+        
+        delay = self._auto_transfer_delay
+        self._auto_transfer_delay = min(delay * 2, AUTO_TRANSFER_MAX_INTERVAL)
+        try:
+            # Sync with network first, but only on demand: our balance is
+            # already current unless a peer announced a conflicting block
+            self._consensus_check(self._AUTO_TRANSFER_CONSENSUS_MAX_AGE)
+            
+            # Available balance = balance - pending auto-transfers already queued
+            available_balance = self.get_available_balance(auto_only=True)
+            
+            if available_balance >= MINER_AUTO_TRANSFER_THRESHOLD:
+                # First check if collection node is online
+                if not self._is_collection_node_online():
+                    logger.warning("[AutoTransfer] Collection node is offline. Keeping coins safe with miner.")
+                else:
+                    # Get collection node address
+                    collection_address = self._get_collection_address()
+                    
+                    if collection_address:
+                        # Determine transfer amount
+                        if AUTO_TRANSFER_ALL:
+                            # Transfer ALL available balance (leaves 0)
+                            transfer_amount = available_balance
                         else:
-                            logger.warning("[AutoTransfer] Collection node address not available")
-                
-                # Check every 5 seconds
-                time.sleep(5)
-                
-            except Exception as e:
-                logger.error(f"[AutoTransfer] Error: {e}")
-                time.sleep(5)
+                            # Transfer only threshold amount
+                            transfer_amount = MINER_AUTO_TRANSFER_THRESHOLD
+                        
+                        success = self.create_transfer(
+                            receiver=collection_address,
+                            amount=transfer_amount,
+                            tx_type=TransactionType.AUTO_TRANSFER
+                        )
+                        # Check again soon rather than after a long idle back-off
+                        delay = self._auto_transfer_delay = self._AUTO_TRANSFER_MIN_INTERVAL
+                        
+                        if success:
+                            logger.info(f"[AutoTransfer] 💰 Transferred {transfer_amount:.2f} {COIN_SYMBOL} "
+                                        f"to Collection Node. Remaining: {available_balance - transfer_amount:.2f} {COIN_SYMBOL}")
+                    else:
+                        logger.warning("[AutoTransfer] Collection node address not available")
+            
+        except Exception as e:
+            logger.error(f"[AutoTransfer] Error: {e}")
+        
+        self._auto_transfer_job = self._schedule(delay, 2, self._auto_transfer_task)
 
     def _get_collection_address(self) -> str:
         """Get the collection node's wallet address."""
@@ -860,7 +1521,7 @@ class Node:
         
         # Try to fetch from collection node
         try:
-            response = requests.get(f"{self.collection_node_url}/address", timeout=5)
+            response = self._http.get(f"{self.collection_node_url}/address", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 self.collection_node_address = data.get("address")
@@ -879,39 +1540,88 @@ class Node:
         This prevents auto-transfers when collection node is down,
         ensuring miner's coins remain safe.
         
+        Uses a single lightweight HEAD probe, with the result cached both ways
+        (circuit breaker): a healthy answer is reused for _COLLECTION_HEALTHY_TTL,
+        and after a failed probe the node is treated as offline for a backoff
+        window (doubling from 5s up to 60s), so back-to-back auto-transfer runs
+        don't pay a round trip each, nor re-probe a dead node.
+        
         Returns:
             True if collection node is online and responding
         """
+        now = time.monotonic()
+        if now < self._collection_ok_until:
+            return True
+        if now < self._collection_down_until:
+            return False
+        
         try:
-            response = requests.get(f"{self.collection_node_url}/health", timeout=3)
-            if response.status_code == 200:
-                return True
-            # If health endpoint doesn't exist, try the address endpoint as fallback
-            response = requests.get(f"{self.collection_node_url}/address", timeout=3)
-            return response.status_code == 200
+            response = self._http.head(
+                f"{self.collection_node_url}/health",
+                timeout=1.0,
+                allow_redirects=False
+            )
+            online = response.status_code == 200
         except requests.exceptions.RequestException:
-            return False
+            online = False
         except Exception as e:
             logger.debug(f"[AutoTransfer] Error checking collection node health: {e}")
-            return False
+            online = False
+        
+        if online:
+            self._collection_backoff = self._COLLECTION_BACKOFF_MIN
+            self._collection_ok_until = time.monotonic() + self._COLLECTION_HEALTHY_TTL
+        else:
+            self._collection_down_until = time.monotonic() + self._collection_backoff
+            self._collection_backoff = min(self._collection_backoff * 2, self._COLLECTION_BACKOFF_MAX)
+        
+        return online
 
     # =========================================================================
     # TRANSACTION HANDLING
     # =========================================================================
 
-    def get_available_balance(self) -> float:
-        """Get balance minus pending outgoing transactions."""
+    def get_available_balance(self, auto_only: bool = False) -> float:
+        """
+        Get balance minus pending outgoing transactions.
+        
+        Args:
+            auto_only: Only subtract pending auto-transfers
+        """
         balance = self.get_balance()
         
-        # Subtract pending outgoing transactions
-        pending_outgoing = sum(
-            float(tx.get("amount", 0)) 
-            for tx in self.blockchain.pending_transactions 
-            if tx.get("sender") == self.wallet.address()
-        )
+        # Subtract pending outgoing transactions (running total, no pool scan)
+        pending_outgoing = self.blockchain.get_pending_outgoing(self._address, auto_only=auto_only)
         
         return max(0.0, balance - pending_outgoing)
 
+    def sign_transaction(self, tx: Transaction) -> Transaction:
+        """
+        Sign a transaction with this node's wallet on the signing process pool.
+        Falls back to signing in-thread if worker processes are unavailable.
+        
+        Args:
+            tx: Transaction to sign
+            
+        Returns:
+            The signed transaction
+        """
+        global _sign_pool
+        message_hash = tx.hash()
+        
+        try:
+            signature = _get_sign_pool().submit(
+                sign_payload, self.wallet.private_key.to_string(), message_hash
+            ).result()
+        except Exception as e:
+            logger.debug("[Transfer] Signing pool unavailable, signing in-thread: %s", e)
+            if isinstance(e, BrokenProcessPool):
+                with _sign_pool_lock:
+                    _sign_pool = None
+            signature = self.wallet.sign(message_hash)
+        
+        return tx.set_signature(self.wallet.get_public_key_hex(), signature)
+
     def create_transfer(self, receiver: str, amount: float, 
                        tx_type: str = TransactionType.TRANSFER) -> bool:
         """
@@ -923,54 +1633,51 @@ class Node:
             tx_type: Transaction type
             
         Returns:
-            True if successful
-            
-        Raises:
-            InsufficientBalanceError: If balance is insufficient
-            ValueError: If amount is invalid
+            True if successful, False if the amount/receiver is invalid or the
+            balance is insufficient. Unexpected failures (e.g. signing) propagate
+            to the caller's top-level handler.
         """
         try:
             # Validate amount
             if amount <= 0:
                 raise ValueError("Amount must be positive")
             
-            if receiver == self.wallet.address():
+            if receiver == self._address:
                 raise ValueError("Cannot send to yourself")
             
             # Check available balance (balance minus pending outgoing)
             available_balance = self.get_available_balance()
             if available_balance < amount:
-                logger.warning(f"[Transfer] Insufficient balance. Available: {available_balance:.2f} {COIN_SYMBOL}, "
-                               f"Need: {amount:.2f} {COIN_SYMBOL}")
+                logger.warning("[Transfer] Insufficient balance. Available: %.2f %s, Need: %.2f %s",
+                               available_balance, COIN_SYMBOL, amount, COIN_SYMBOL)
                 return False
             
-            # Create and sign transaction
+            # Create transaction
             tx = Transaction(
-                sender=self.wallet.address(),
+                sender=self._address,
                 receiver=receiver,
                 amount=amount,
                 tx_type=tx_type
             )
-            tx.sign(self.wallet)
-            
-            tx_dict = tx.to_dict()
-            
-            # Add to pending transactions
-            self.blockchain.pending_transactions.append(tx_dict)
-            
-            # Broadcast to peers
-            broadcast_count = self._broadcast_transaction(tx_dict)
-            
-            logger.info(f"[Transfer] Created transaction: {amount} {COIN_SYMBOL} to {receiver[:16]}... "
-                        f"(broadcast to {broadcast_count} peers)")
-            return True
-            
-        except ValueError as e:
-            logger.error(f"[Transfer] Validation error: {e}")
+        except (TypeError, ValueError) as e:
+            logger.error("[Transfer] Validation error: %s", e)
             return False
-        except Exception as e:
-            logger.error(f"[Transfer] Error: {e}")
+        
+        self.sign_transaction(tx)
+        
+        tx_dict = tx.to_dict()
+        
+        # Re-check and reserve under the chain lock: a concurrent transfer
+        # (e.g. API request vs auto-transfer) may have spent it since the check above
+        if not self.blockchain.reserve_pending(tx_dict):
+            logger.warning("[Transfer] Insufficient balance after concurrent transfer. Need: %.2f %s",
+                           amount, COIN_SYMBOL)
             return False
+        self.queue_transaction(tx_dict, tx.to_json_bytes())
+        
+        logger.info("[Transfer] Created transaction: %s %s to %s... (queued for broadcast)",
+                    amount, COIN_SYMBOL, receiver[:16])
+        return True
 
     # =========================================================================
     # COLLECTION NODE FUNCTIONS
@@ -47,41 +47,46 @@ def main() -> int:
         return 1
     
     node_type = get_node_type_from_port(port)
-    print(f"")
-    print(f"╔══════════════════════════════════════════════════════════╗")
-    print(f"║           CarbonCoin ({COIN_SYMBOL}) Blockchain Network            ║")
-    print(f"╠══════════════════════════════════════════════════════════╣")
-    print(f"║  Node Type: {node_type.upper():<45} ║")
-    print(f"║  Port:      {port:<45} ║")
+
+    # Build the banner and write it in one go (one stdout write instead of ~20)
+    lines = []
+    lines.append(f"")
+    lines.append(f"╔══════════════════════════════════════════════════════════╗")
+    lines.append(f"║           CarbonCoin ({COIN_SYMBOL}) Blockchain Network            ║")
+    lines.append(f"╠══════════════════════════════════════════════════════════╣")
+    lines.append(f"║  Node Type: {node_type.upper():<45} ║")
+    lines.append(f"║  Port:      {port:<45} ║")
     if private_key:
-        print(f"║  Auth:      Existing wallet                               ║")
+        lines.append(f"║  Auth:      Existing wallet                               ║")
     else:
-        print(f"║  Auth:      New wallet created                            ║")
-    print(f"╚══════════════════════════════════════════════════════════╝")
-    print(f"")
+        lines.append(f"║  Auth:      New wallet created                            ║")
+    lines.append(f"╚══════════════════════════════════════════════════════════╝")
+    lines.append(f"")
     
     host_display = os.getenv("HOST_DISPLAY", "localhost")
     
     if node_type == "miner":
-        print("📍 Miner endpoints:")
-        print(f"   POST http://{host_display}:{port}/miner/start  - Start mining + auto-transfer")
-        print(f"   POST http://{host_display}:{port}/miner/stop   - Stop all services")
-        print(f"   GET  http://{host_display}:{port}/balance      - Check balance")
+        lines.append("📍 Miner endpoints:")
+        lines.append(f"   POST http://{host_display}:{port}/miner/start  - Start mining + auto-transfer")
+        lines.append(f"   POST http://{host_display}:{port}/miner/stop   - Stop all services")
+        lines.append(f"   GET  http://{host_display}:{port}/balance      - Check balance")
     elif node_type == "collection":
-        print("📍 Collection node endpoints:")
-        print(f"   POST http://{host_display}:{port}/reward       - Reward a user")
-        print(f"   GET  http://{host_display}:{port}/balance      - Check balance")
+        lines.append("📍 Collection node endpoints:")
+        lines.append(f"   POST http://{host_display}:{port}/reward       - Reward a user")
+        lines.append(f"   GET  http://{host_display}:{port}/balance      - Check balance")
     else:
-        print("📍 User node endpoints:")
-        print(f"   GET  http://{host_display}:{port}/balance      - Check balance")
-        print(f"   POST http://{host_display}:{port}/transfer     - Transfer coins")
+        lines.append("📍 User node endpoints:")
+        lines.append(f"   GET  http://{host_display}:{port}/balance      - Check balance")
+        lines.append(f"   POST http://{host_display}:{port}/transfer     - Transfer coins")
     
-    print("")
-    print(f"📊 Common endpoints:")
-    print(f"   GET  http://{host_display}:{port}/             - Node info")
-    print(f"   GET  http://{host_display}:{port}/chain        - View blockchain")
-    print(f"   GET  http://{host_display}:{port}/stats        - Network stats")
-    print("")
+    lines.append("")
+    lines.append(f"📊 Common endpoints:")
+    lines.append(f"   GET  http://{host_display}:{port}/             - Node info")
+    lines.append(f"   GET  http://{host_display}:{port}/chain        - View blockchain")
+    lines.append(f"   GET  http://{host_display}:{port}/stats        - Network stats")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
     return 0
@@ -4,6 +4,11 @@ Setup script for building Cython extensions.
 Build commands:
     python setup.py build_ext --inplace    # Build for development
     python setup.py install                 # Install to site-packages
+
+Profile-guided build (Linux/gcc):
+    CC_PGO=generate python setup.py build_ext --inplace --force
+    # ...run a representative workload (e.g. mine a few blocks)...
+    CC_PGO=use python setup.py build_ext --inplace --force
     
 For Windows, you may need Visual Studio Build Tools installed.
 For Linux/Mac, you need gcc/clang.
@@ -26,17 +31,28 @@ except ImportError:
 extra_compile_args = []
 extra_link_args = []
 
+# Link-time optimization is on for every platform
 if sys.platform == 'win32':
     # Windows (MSVC)
-    extra_compile_args = ['/O2', '/arch:AVX2']
+    extra_compile_args = ['/O2', '/arch:AVX2', '/GL']
+    extra_link_args = ['/LTCG']
 elif sys.platform == 'darwin':
     # macOS (clang)
-    extra_compile_args = ['-O3', '-march=native', '-ffast-math']
-    extra_link_args = ['-O3']
+    extra_compile_args = ['-O3', '-march=native', '-ffast-math', '-flto=thin']
+    extra_link_args = ['-O3', '-flto=thin']
 else:
     # Linux (gcc)
-    extra_compile_args = ['-O3', '-march=native', '-ffast-math', '-fopenmp']
-    extra_link_args = ['-O3', '-fopenmp']
+    extra_compile_args = ['-O3', '-march=native', '-ffast-math', '-fopenmp', '-flto']
+    extra_link_args = ['-O3', '-fopenmp', '-flto']
+
+# Optional profile-guided optimization pass (Linux/gcc): CC_PGO=generate|use
+PGO_MODE = os.environ.get('CC_PGO', '').lower()
+if sys.platform.startswith('linux') and PGO_MODE == 'generate':
+    extra_compile_args.append('-fprofile-generate')
+    extra_link_args.append('-fprofile-generate')
+elif sys.platform.startswith('linux') and PGO_MODE == 'use':
+    extra_compile_args += ['-fprofile-use', '-fprofile-correction']
+    extra_link_args.append('-fprofile-use')
 
 
 def get_extensions():
@@ -99,6 +115,10 @@ setup(
         'requests>=2.28.0',
     ],
     extras_require={
+        # Faster JSON for block/transaction broadcast (falls back to stdlib json)
+        'fast': [
+            'orjson>=3.9.0',
+        ],
         'dev': [
             'Cython>=3.0.0',
             'pytest>=7.0.0',
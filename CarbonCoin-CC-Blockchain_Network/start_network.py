@@ -4,7 +4,11 @@ import sys
 import os
 import signal
 import platform
+import socket
+import selectors
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 NODES = [
@@ -18,10 +22,17 @@ GATEWAY = {
     "port": 8000
 }
 
+# Max seconds to wait for all services to start accepting connections
+READY_TIMEOUT = 15
+
 processes = []
 
+# Set on shutdown; the launcher's main thread sleeps until this is set
+stop_event = threading.Event()
+
 def signal_handler(sig, frame):
     print("\n\n🛑 Stopping CarbonCoin Network...")
+    stop_event.set()
     shutdown_network()
     sys.exit(0)
 
@@ -52,42 +63,96 @@ def start_miner():
     except Exception as e:
         print(f"⚠️  Error starting miner: {str(e)}")
 
+def spawn(service):
+    """Start a service process in its own console/session and track it."""
+    print(f"🚀 Starting {service['name']} (Port {service['port']})...")
+    if platform.system() == "Windows":
+        # Separate console per service so logs stay readable
+        p = subprocess.Popen(service['cmd'], creationflags=subprocess.CREATE_NEW_CONSOLE)
+    else:
+        p = subprocess.Popen(service['cmd'], start_new_session=True)
+    processes.append({"name": service['name'], "process": p})
+
+def is_ready(port):
+    """True if something is accepting TCP connections on localhost:port."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.settimeout(0.1)
+    try:
+        return s.connect_ex(("127.0.0.1", port)) == 0
+    finally:
+        s.close()
+
+def wait_until_ready(port, deadline):
+    """Poll port until it accepts connections or the deadline passes."""
+    while time.monotonic() < deadline:
+        if is_ready(port):
+            return True
+        time.sleep(0.1)
+    return False
+
+def wait_for_services(services):
+    """
+    Wait (in parallel, up to READY_TIMEOUT in total) for every service's port.
+    Returns the names of services that never became ready.
+    """
+    deadline = time.monotonic() + READY_TIMEOUT
+    with ThreadPoolExecutor(max_workers=len(services)) as pool:
+        results = pool.map(lambda svc: wait_until_ready(svc['port'], deadline), services)
+        return [svc['name'] for svc, ready in zip(services, results) if not ready]
+
+def wait_for_shutdown():
+    """
+    Block the main thread until a signal handler sets stop_event.
+    
+    Signals are routed to a socketpair via signal.set_wakeup_fd, so the
+    select() below wakes the moment Ctrl+C arrives, on POSIX and Windows
+    alike (a plain sleep or Event.wait isn't reliably interruptible there).
+    """
+    r, w = socket.socketpair()
+    r.setblocking(False)
+    w.setblocking(False)
+    signal.set_wakeup_fd(w.fileno())
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(r, selectors.EVENT_READ)
+            while not stop_event.is_set():
+                selector.select()
+                # Drain the wakeup bytes so the next select() blocks again
+                try:
+                    while r.recv(4096):
+                        pass
+                except BlockingIOError:
+                    pass
+    finally:
+        signal.set_wakeup_fd(-1)
+        r.close()
+        w.close()
+
 def start_network():
-    print("\n")
-    print("╔══════════════════════════════════════════════════════════╗")
-    print("║      CarbonCoin (CC) Blockchain Network Launcher         ║")
-    print("╠══════════════════════════════════════════════════════════╣")
-    print("║  1. Starting 2 Blockchain Nodes (Collection + Miner)     ║")
-    print("║  2. Starting Gateway Query Service                       ║")
-    print("║  3. Press Ctrl+C to stop the network                     ║")
-    print("╚══════════════════════════════════════════════════════════╝")
-    print("\n")
-
-    # 1. Start Blockchain Nodes
+    sys.stdout.write("\n".join([
+        "\n",
+        "╔══════════════════════════════════════════════════════════╗",
+        "║      CarbonCoin (CC) Blockchain Network Launcher         ║",
+        "╠══════════════════════════════════════════════════════════╣",
+        "║  1. Starting 2 Blockchain Nodes (Collection + Miner)     ║",
+        "║  2. Starting Gateway Query Service                       ║",
+        "║  3. Press Ctrl+C to stop the network                     ║",
+        "╚══════════════════════════════════════════════════════════╝",
+        "\n",
+    ]) + "\n")
+    sys.stdout.flush()
+
+    # 1. Start Blockchain Nodes (all at once, then wait until they accept connections)
     for node in NODES:
-        print(f"🚀 Starting {node['name']} (Port {node['port']})...")
-        # Direct stdout/stderr to DEVNULL for cleaner main terminal, 
-        # or remove stderr=subprocess.DEVNULL if you want to see errors.
-        if platform.system() == "Windows":
-             # Creation flags for separate independent process groups if needed, 
-             # but standard Popen is usually fine for this script.
-             p = subprocess.Popen(node['cmd'], creationflags=subprocess.CREATE_NEW_CONSOLE)
-        else:
-             p = subprocess.Popen(node['cmd'], start_new_session=True)
-             
-        processes.append({"name": node['name'], "process": p})
-        time.sleep(1) # stagger start
+        spawn(node)
 
     print("\n⏳ Waiting for nodes to initialize...")
-    time.sleep(5)
+    not_ready = wait_for_services(NODES)
+    if not_ready:
+        print(f"⚠️  Not responding after {READY_TIMEOUT}s: {', '.join(not_ready)}")
 
     # 2. Start Gateway
-    print(f"🌐 Starting {GATEWAY['name']} (Port {GATEWAY['port']})...")
-    if platform.system() == "Windows":
-        p = subprocess.Popen(GATEWAY['cmd'], creationflags=subprocess.CREATE_NEW_CONSOLE)
-    else:
-        p = subprocess.Popen(GATEWAY['cmd'], start_new_session=True)
-    processes.append({"name": GATEWAY['name'], "process": p})
+    spawn(GATEWAY)
 
     print("\n✅ Network is RUNNING!")
     print("   - Collection: http://localhost:7000")
@@ -98,15 +163,14 @@ def start_network():
 
     # Start the miner via API
     print("⏳ Initializing miner startup...")
-    time.sleep(2)  # Give server a moment to be ready
+    wait_for_services([GATEWAY])
     start_miner()
 
-    # Keep main script alive
-    while True:
-        try:
-            time.sleep(1)
-        except KeyboardInterrupt:
-            signal_handler(None, None)
+    # Keep main script alive, sleeping in the kernel until a signal arrives
+    try:
+        wait_for_shutdown()
+    except KeyboardInterrupt:
+        signal_handler(None, None)
 
 if __name__ == "__main__":
     # Register signal handler for graceful shutdown
@@ -13,22 +13,34 @@ Fields:
 """
 
 import logging
-from typing import Optional, Dict
+import threading
+import time
+from typing import Optional, Dict, List, Tuple, Iterator, Union
 from datetime import datetime
 
 try:
-    from pymongo import MongoClient
-    from pymongo.errors import PyMongoError, DuplicateKeyError
+    from pymongo import MongoClient, InsertOne, IndexModel
+    from pymongo.errors import PyMongoError, BulkWriteError
+    from pymongo.collation import Collation
+    from pymongo.write_concern import WriteConcern
     from bson import ObjectId
+    # Case-insensitive comparison for usernames (strength=2 ignores case, not accents)
+    LABEL_COLLATION = Collation(locale="en", strength=2)
     PYMONGO_AVAILABLE = True
 except ImportError:
     PYMONGO_AVAILABLE = False
 
-from config import MONGO_URI, MONGO_DATABASE, MONGO_WALLETS_COLLECTION
+from config import (
+    MONGO_URI, MONGO_DATABASE, MONGO_WALLETS_COLLECTION,
+    MONGO_MAX_POOL, MONGO_MIN_POOL, MONGO_MAX_IDLE_MS
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# MongoDB error code for a unique index violation
+DUPLICATE_KEY_ERROR = 11000
+
 
 class MongoStorage:
     """
@@ -41,57 +53,317 @@ class MongoStorage:
     _db = None
     _collection = None
     _initialized = False
+    # Guards singleton creation/initialization against concurrent first use
+    _lock = threading.Lock()
+    
+    # In-process cache for wallet lookups (wallets rarely change after
+    # creation); entries expire after this many seconds
+    _READ_CACHE_TTL = 5.0
+    _READ_CACHE_MAX = 1024
+    
+    # healthcheck() pings at most once per this many seconds and otherwise
+    # returns the last result, so failing checks don't each wait out a timeout
+    _HEALTH_CACHE_TTL = 1.0
+    
+    # Full-collection scans fetch this many documents per round trip,
+    # projected to the wallet fields
+    _SCAN_BATCH_SIZE = 500
+    _WALLET_FIELDS = {"wallet_address": 1, "created_at": 1, "label": 1, "user_id": 1}
     
     def __new__(cls):
-        """Singleton pattern to reuse MongoDB connection."""
+        """Singleton pattern to reuse MongoDB connection (double-checked locking)."""
         if cls._instance is None:
-            cls._instance = super(MongoStorage, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(MongoStorage, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-        """Initialize MongoDB connection (only once due to singleton)."""
+        """
+        Set up the (singleton) handler. The MongoDB connection itself is made
+        lazily on first use, so importing this module never touches the network.
+        """
         if self._initialized:
             return
-            
-        if not PYMONGO_AVAILABLE:
-            logger.warning("[MongoStorage] pymongo not installed. MongoDB features disabled.")
-            self._initialized = True
-            return
         
-        try:
-            self._client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
-            # Test connection
-            self._client.admin.command('ping')
+        with self._lock:
+            if self._initialized:
+                return
+            
+            # (kind, key) -> (expiry, document or None), kept in insertion (= expiry) order
+            self._read_cache = {}
+            self._cache_lock = threading.Lock()
+            
+            # Bumped by every invalidation; a read only caches its result if
+            # its key wasn't invalidated after the read began. Per-key stamps
+            # are kept oldest first and trimmed at _READ_CACHE_MAX - trimmed
+            # keys fall back to the newest trimmed stamp (conservative)
+            self._cache_generation = 0
+            self._invalidated_at = {}
+            self._invalidated_floor = 0
             
-            self._db = self._client[MONGO_DATABASE]
-            self._collection = self._db[MONGO_WALLETS_COLLECTION]
+            # Last healthcheck() result and when it was taken
+            self._last_ping_ok = False
+            self._last_ping_ts = 0.0
+            self._ping_lock = threading.Lock()
             
-            # Create unique index on wallet_address to prevent duplicates
-            self._collection.create_index("wallet_address", unique=True)
-            # Create index on label (username) for quick lookups
-            self._collection.create_index("label")
+            # Connect once, on first use (see _ensure_connected)
+            self._connect_attempted = False
+            self._connect_lock = threading.Lock()
+            
+            if not PYMONGO_AVAILABLE:
+                logger.warning("[MongoStorage] pymongo not installed. MongoDB features disabled.")
+                self._connect_attempted = True
             
-            logger.info(f"[MongoStorage] Connected to MongoDB: {MONGO_DATABASE}.{MONGO_WALLETS_COLLECTION}")
             self._initialized = True
+    
+    def _ensure_connected(self):
+        """
+        Connect to MongoDB, ping it and create indexes - once per process.
+        Threads racing on first use wait for the one doing the connect.
+        """
+        if self._connect_attempted:
+            return
+        
+        with self._connect_lock:
+            if self._connect_attempted:
+                return
             
+            try:
+                client = MongoClient(
+                    MONGO_URI,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=MONGO_MAX_POOL,
+                    minPoolSize=MONGO_MIN_POOL,
+                    maxIdleTimeMS=MONGO_MAX_IDLE_MS,
+                    retryWrites=True,
+                    w=1
+                )
+                # Test connection
+                client.admin.command('ping')
+                
+                db = client[MONGO_DATABASE]
+                # Wallets are a write-once mirror of on-chain state: acknowledge
+                # writes without waiting for the journal fsync
+                collection = db.get_collection(
+                    MONGO_WALLETS_COLLECTION, write_concern=WriteConcern(w=1, j=False)
+                )
+                
+                self._client, self._db = client, db
+                self._ensure_indexes(collection)
+                # Published last: is_connected() keys off _collection
+                self._collection = collection
+                
+                logger.info(f"[MongoStorage] Connected to MongoDB: {MONGO_DATABASE}.{MONGO_WALLETS_COLLECTION}")
+                
+            except Exception as e:
+                logger.error(f"[MongoStorage] Failed to connect to MongoDB: {e}")
+                self._client = None
+                self._db = None
+                self._collection = None
+            finally:
+                self._connect_attempted = True
+    
+    def _ensure_indexes(self, collection):
+        """
+        Create the Wallets indexes (no-op for ones that already exist).
+        A failure here is logged but doesn't disable MongoDB: the indexes
+        usually exist already, and queries still work without them.
+        """
+        try:
+            # One createIndexes command for all of them
+            collection.create_indexes([
+                # Unique wallet_address to prevent duplicates
+                IndexModel("wallet_address", unique=True),
+                # Label (username) lookups, and per-user listings sorted newest first
+                IndexModel([("label", 1), ("created_at", -1)], name="label_created"),
+                # Case-insensitive label for username_exists equality queries
+                IndexModel("label", collation=LABEL_COLLATION, name="label_ci"),
+                # Website lookups by linked user (only set on some wallets)
+                IndexModel("user_id", sparse=True),
+            ])
         except Exception as e:
-            logger.error(f"[MongoStorage] Failed to connect to MongoDB: {e}")
-            self._client = None
-            self._db = None
-            self._collection = None
-            self._initialized = True
+            logger.warning(f"[MongoStorage] Failed to create indexes: {e}")
     
     def is_connected(self) -> bool:
-        """Check if MongoDB is connected and available."""
-        if not PYMONGO_AVAILABLE or self._client is None:
+        """
+        Check if MongoDB is configured and was reachable when first used.
+        
+        Connects on the first call; after that this is a local check only
+        (no server round trip): pymongo's topology monitor
+        tracks server health and reconnects itself, and operations against a
+        down server fail with PyMongoError, which every method handles.
+        """
+        self._ensure_connected()
+        return PYMONGO_AVAILABLE and self._collection is not None
+    
+    def healthcheck(self) -> bool:
+        """
+        Ping the server (for health endpoints; not for the request path).
+        The result is reused for _HEALTH_CACHE_TTL seconds, and concurrent
+        callers get the last result instead of pinging in parallel.
+        """
+        if not self.is_connected():
             return False
+        
+        if time.monotonic() - self._last_ping_ts < self._HEALTH_CACHE_TTL:
+            return self._last_ping_ok
+        if not self._ping_lock.acquire(blocking=False):
+            return self._last_ping_ok
+        
         try:
-            self._client.admin.command('ping')
-            return True
-        except:
-            return False
+            self._client.admin.command('ping', maxTimeMS=500)
+            self._last_ping_ok = True
+        except PyMongoError as e:
+            # Includes ConnectionFailure / ServerSelectionTimeoutError
+            logger.debug(f"[MongoStorage] Ping failed: {e}")
+            self._last_ping_ok = False
+        finally:
+            self._last_ping_ts = time.monotonic()
+            self._ping_lock.release()
+        return self._last_ping_ok
+    
+    def _cache_get(self, key: tuple) -> tuple:
+        """
+        Look up a cached wallet read.
+        
+        Returns:
+            (hit: bool, document copy or None, generation to pass to _cache_put on a miss)
+        """
+        with self._cache_lock:
+            entry = self._read_cache.get(key)
+            generation = self._cache_generation
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None, generation
+        return True, (dict(entry[1]) if entry[1] is not None else None), generation
+    
+    def _cache_put(self, key: tuple, document: Optional[Dict], generation: int):
+        """
+        Cache a wallet read for _READ_CACHE_TTL seconds (stores a copy).
+        
+        Args:
+            key: Cache key
+            document: The document read (None if not found)
+            generation: Generation returned by the _cache_get that preceded the read;
+                        the write is skipped if the key was invalidated since
+        """
+        now = time.monotonic()
+        cache = self._read_cache
+        with self._cache_lock:
+            if self._invalidated_at.get(key, self._invalidated_floor) > generation:
+                return  # Written meanwhile - this read may already be stale
+            
+            # Trim expired entries (and the oldest, once full) from the front
+            while cache:
+                oldest_key, (expiry, _) = next(iter(cache.items()))
+                if expiry > now and len(cache) < self._READ_CACHE_MAX:
+                    break
+                del cache[oldest_key]
+            cache.pop(key, None)
+            cache[key] = (now + self._READ_CACHE_TTL, dict(document) if document is not None else None)
+    
+    def _cache_invalidate(self, wallet_address: str, label: str):
+        """Drop cached reads for a wallet that was just written."""
+        with self._cache_lock:
+            self._cache_generation += 1
+            invalidated_at = self._invalidated_at
+            for key in (("u", label), ("a", wallet_address)):
+                self._read_cache.pop(key, None)
+                # Re-insert so stamps stay in increasing order
+                invalidated_at.pop(key, None)
+                invalidated_at[key] = self._cache_generation
+            while len(invalidated_at) > self._READ_CACHE_MAX:
+                oldest_key = next(iter(invalidated_at))
+                self._invalidated_floor = invalidated_at.pop(oldest_key)
+    
+    @staticmethod
+    def _wallet_document(wallet_address: str, created_at: float, label: str,
+                         user_id: Union[str, "ObjectId", None] = None) -> dict:
+        """Build the Wallets document for one wallet (raises on an invalid user_id)."""
+        document = {
+            "wallet_address": wallet_address,
+            "created_at": datetime.fromtimestamp(created_at),
+            "label": label
+        }
+        
+        # Add user_id only if provided (links to Users collection)
+        # Convert string to ObjectId for proper MongoDB reference
+        # (an ObjectId from the Users collection is used as-is)
+        if user_id:
+            document["user_id"] = user_id if isinstance(user_id, ObjectId) else ObjectId(user_id)
+        return document
     
-    def store_wallet(self, wallet_address: str, created_at: float, label: str, user_id: str = None) -> tuple:
+    def store_wallets_bulk(self, wallets: List[Dict], fast_insert: bool = False) -> Tuple[int, List[Dict]]:
+        """
+        Store many wallets in MongoDB in a single unordered bulk write.
+        
+        A failing wallet (e.g. duplicate address) doesn't stop the rest
+        of the batch from being inserted.
+        
+        Args:
+            wallets: List of dicts with wallet_address, created_at (unix
+                     timestamp), label and optional user_id (str or ObjectId)
+            fast_insert: Fire-and-forget (w=0) for bulk imports of wallets
+                         known to be new; server-side errors aren't reported
+            
+        Returns:
+            (inserted_count, errors) where errors are pymongo-style write
+            error dicts ({"index", "code", "errmsg"}) indexed into wallets.
+            With fast_insert, inserted_count is the number of wallets sent.
+        """
+        if not self.is_connected():
+            return 0, [{"index": i, "code": None, "errmsg": "MongoDB not connected"}
+                       for i in range(len(wallets))]
+        
+        documents = []
+        op_indexes = []  # Position in `wallets` of each document
+        errors = []
+        for i, wallet in enumerate(wallets):
+            try:
+                document = self._wallet_document(
+                    wallet["wallet_address"], wallet["created_at"],
+                    wallet["label"], wallet.get("user_id")
+                )
+            except Exception as e:
+                errors.append({"index": i, "code": None, "errmsg": str(e)})
+                continue
+            documents.append(document)
+            op_indexes.append(i)
+        
+        if not documents:
+            return 0, errors
+        
+        collection = self._collection
+        if fast_insert:
+            collection = collection.with_options(write_concern=WriteConcern(w=0))
+        
+        try:
+            result = collection.bulk_write(
+                [InsertOne(document) for document in documents], ordered=False
+            )
+            inserted = result.inserted_count if result.acknowledged else len(documents)
+        except BulkWriteError as e:
+            inserted = e.details.get("nInserted", 0)
+            for error in e.details.get("writeErrors", []):
+                errors.append({
+                    "index": op_indexes[error["index"]],
+                    "code": error.get("code"),
+                    "errmsg": error.get("errmsg")
+                })
+        except PyMongoError as e:
+            logger.error(f"[MongoStorage] Failed to store wallets: {e}")
+            return 0, errors + [{"index": i, "code": None, "errmsg": str(e)} for i in op_indexes]
+        finally:
+            # After the write, so a concurrent read can't re-cache the old miss
+            for document in documents:
+                self._cache_invalidate(document["wallet_address"], document["label"])
+        
+        if len(wallets) > 1:
+            logger.info(f"[MongoStorage] Stored {inserted}/{len(wallets)} wallets")
+        return inserted, sorted(errors, key=lambda error: error["index"])
+    
+    def store_wallet(self, wallet_address: str, created_at: float, label: str,
+                     user_id: Union[str, "ObjectId", None] = None) -> tuple:
         """
         Store a wallet in MongoDB.
         
@@ -99,38 +371,26 @@ class MongoStorage:
             wallet_address: The wallet's public address
             created_at: Timestamp when wallet was created (unix timestamp)
             label: Username/label for the wallet
-            user_id: Optional ObjectId string from Users collection (for website integration)
+            user_id: Optional ObjectId (or its hex string) from Users collection (for website integration)
             
         Returns:
             (success: bool, error_message: str or None)
         """
-        if not self.is_connected():
-            return False, "MongoDB not connected"
+        inserted, errors = self.store_wallets_bulk([{
+            "wallet_address": wallet_address,
+            "created_at": created_at,
+            "label": label,
+            "user_id": user_id
+        }])
         
-        try:
-            document = {
-                "wallet_address": wallet_address,
-                "created_at": datetime.fromtimestamp(created_at),
-                "label": label
-            }
-            
-            # Add user_id only if provided (links to Users collection)
-            # Convert string to ObjectId for proper MongoDB reference
-            if user_id:
-                document["user_id"] = ObjectId(user_id)
-            
-            self._collection.insert_one(document)
+        if inserted:
             logger.info(f"[MongoStorage] Stored wallet for user '{label}': {wallet_address[:16]}...")
             return True, None
-            
-        except DuplicateKeyError:
-            return False, f"Wallet address already exists in database"
-        except PyMongoError as e:
-            logger.error(f"[MongoStorage] Failed to store wallet: {e}")
-            return False, str(e)
-        except Exception as e:
-            logger.error(f"[MongoStorage] Unexpected error storing wallet: {e}")
-            return False, str(e)
+        
+        error = errors[0] if errors else {"code": None, "errmsg": "Wallet was not stored"}
+        if error["code"] == DUPLICATE_KEY_ERROR:
+            return False, "Wallet address already exists in database"
+        return False, error["errmsg"]
     
     def get_wallet_by_username(self, username: str) -> Optional[Dict]:
         """
@@ -140,11 +400,15 @@ class MongoStorage:
             username: The username/label to search for
             
         Returns:
-            Wallet document dict or None if not found
+            Wallet document dict or None if not found (cached for _READ_CACHE_TTL seconds)
         """
         if not self.is_connected():
             return None
         
+        hit, cached, generation = self._cache_get(("u", username))
+        if hit:
+            return cached
+        
         try:
             result = self._collection.find_one({"label": username})
             if result:
@@ -152,6 +416,7 @@ class MongoStorage:
                 result["_id"] = str(result["_id"])
                 if isinstance(result.get("created_at"), datetime):
                     result["created_at"] = result["created_at"].timestamp()
+            self._cache_put(("u", username), result, generation)
             return result
         except Exception as e:
             logger.error(f"[MongoStorage] Failed to get wallet by username: {e}")
@@ -165,17 +430,22 @@ class MongoStorage:
             wallet_address: The wallet address to search for
             
         Returns:
-            Wallet document dict or None if not found
+            Wallet document dict or None if not found (cached for _READ_CACHE_TTL seconds)
         """
         if not self.is_connected():
             return None
         
+        hit, cached, generation = self._cache_get(("a", wallet_address))
+        if hit:
+            return cached
+        
         try:
             result = self._collection.find_one({"wallet_address": wallet_address})
             if result:
                 result["_id"] = str(result["_id"])
                 if isinstance(result.get("created_at"), datetime):
                     result["created_at"] = result["created_at"].timestamp()
+            self._cache_put(("a", wallet_address), result, generation)
             return result
         except Exception as e:
             logger.error(f"[MongoStorage] Failed to get wallet by address: {e}")
@@ -197,35 +467,58 @@ class MongoStorage:
             return False
         
         try:
-            # Case-insensitive search using regex
-            import re
-            pattern = re.compile(f"^{re.escape(username)}$", re.IGNORECASE)
-            count = self._collection.count_documents({"label": pattern})
-            return count > 0
+            # Case-insensitive equality served by the label_ci collation index
+            # (a regex with the i flag can't use an index); fetch only the _id
+            # of the first hit rather than running a count aggregation
+            return self._collection.find_one(
+                {"label": username}, projection={"_id": 1}, collation=LABEL_COLLATION
+            ) is not None
         except Exception as e:
             logger.error(f"[MongoStorage] Failed to check username: {e}")
             return False
     
-    def get_all_wallets(self) -> list:
+    def iter_wallets(self) -> Iterator[Dict]:
         """
-        Get all wallets from MongoDB.
+        Stream all wallets from MongoDB, _SCAN_BATCH_SIZE documents per round trip.
         
-        Returns:
-            List of wallet documents
+        Yields:
+            Wallet documents (JSON-ready: _id as str, created_at as unix timestamp)
         """
         if not self.is_connected():
-            return []
+            return
         
         try:
-            results = list(self._collection.find())
-            for result in results:
+            cursor = self._collection.find({}, projection=self._WALLET_FIELDS).batch_size(self._SCAN_BATCH_SIZE)
+            for result in cursor:
                 result["_id"] = str(result["_id"])
-                if isinstance(result.get("created_at"), datetime):
-                    result["created_at"] = result["created_at"].timestamp()
-            return results
+                created_at = result.get("created_at")
+                if isinstance(created_at, datetime):
+                    result["created_at"] = created_at.timestamp()
+                yield result
         except Exception as e:
-            logger.error(f"[MongoStorage] Failed to get all wallets: {e}")
-            return []
+            logger.error(f"[MongoStorage] Failed to iterate wallets: {e}")
+    
+    def iter_addresses(self) -> Iterator[str]:
+        """Stream just the wallet addresses (no other fields are decoded)."""
+        if not self.is_connected():
+            return
+        
+        try:
+            cursor = self._collection.find({}, projection={"wallet_address": 1, "_id": 0})
+            for result in cursor.batch_size(self._SCAN_BATCH_SIZE):
+                yield result["wallet_address"]
+        except Exception as e:
+            logger.error(f"[MongoStorage] Failed to iterate wallet addresses: {e}")
+    
+    def get_all_wallets(self) -> list:
+        """
+        Get all wallets from MongoDB.
+        Prefer iter_wallets() for large collections (bounded memory).
+        
+        Returns:
+            List of wallet documents
+        """
+        return list(self.iter_wallets())
     
     def close(self):
         """Close MongoDB connection."""
@@ -234,5 +527,6 @@ class MongoStorage:
             logger.info("[MongoStorage] MongoDB connection closed")
 
 
-# Global instance for easy access
+# Global instance for easy access. Import and reuse this one; it owns the
+# process-wide MongoClient pool, so don't create MongoStorage per request.
 mongo_storage = MongoStorage()
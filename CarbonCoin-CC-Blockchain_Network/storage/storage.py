@@ -13,6 +13,7 @@ CONCURRENCY PROTECTION:
 Directory structure:
     data/
         blockchain.json      - Shared blockchain (all nodes read/write)
+        blockchain.wal       - Blocks appended since blockchain.json was last compacted
         pending_tx.json      - Shared pending transactions
         wallets.json         - All wallets registry
         active_sessions.json - Track which wallet is active on which port
@@ -28,6 +29,7 @@ from pathlib import Path
 import threading
 from contextlib import contextmanager
 import hashlib
+import struct
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +79,7 @@ class Storage:
     
     # File paths (shared across all nodes)
     BLOCKCHAIN_FILE = "blockchain.json"
+    CHAIN_WAL_FILE = "blockchain.wal"
     PENDING_TX_FILE = "pending_tx.json"
     WALLETS_FILE = "wallets.json"
     SESSIONS_FILE = "active_sessions.json"
@@ -377,13 +380,8 @@ class Storage:
                             block_dict = block
                         chain_data.append(block_dict)
                     
-                    # Step 4: Write data
-                    with open(filepath, "w") as f:
-                        json.dump(chain_data, f, indent=2)
-                    
-                    # Step 5: Increment version after successful write
-                    checksum = self._compute_checksum(chain_data)
-                    new_version = self._increment_version(file_key, checksum)
+                    # Step 4-5: Write data and increment version
+                    new_version = self._write_chain_file(chain_data)
                     
                     logger.info(f"[Storage] Saved blockchain with {len(chain_data)} blocks (version {new_version.version})")
                     return True, new_version.version
@@ -416,6 +414,9 @@ class Storage:
                 with open(filepath, "r") as f:
                     chain_data = json.load(f)
                 
+                # Blocks appended since the last compaction
+                self._replay_wal(chain_data)
+                
                 # Get current version
                 current_version = self._get_version(file_key).version
                 
@@ -430,6 +431,121 @@ class Storage:
         """Check if blockchain data exists on disk."""
         return os.path.exists(self._get_path(self.BLOCKCHAIN_FILE))
     
+    def _write_chain_file(self, chain_data: List[Dict]) -> DataVersion:
+        """
+        Write the canonical blockchain file and bump its version.
+        Must be called within _file_lock().
+        """
+        with open(self._get_path(self.BLOCKCHAIN_FILE), "w") as f:
+            json.dump(chain_data, f, indent=2)
+        
+        checksum = self._compute_checksum(chain_data)
+        return self._increment_version(self.BLOCKCHAIN_FILE, checksum)
+    
+    # =========================================================================
+    # BLOCKCHAIN WRITE-AHEAD LOG
+    # =========================================================================
+    
+    def append_block(self, block: Any) -> bool:
+        """
+        Append a single block to the blockchain WAL and fsync it.
+        Costs O(block) instead of rewriting the whole chain file; the WAL is
+        folded into blockchain.json by compact_blockchain().
+        
+        Records are length-prefixed JSON, so a torn write from a crash is
+        detected and ignored on replay.
+        
+        Args:
+            block: Block object or block dictionary
+            
+        Returns:
+            True if the record was written, False otherwise
+        """
+        if hasattr(block, 'to_json_bytes'):
+            payload = block.to_json_bytes()
+        else:
+            payload = json.dumps(block, separators=(",", ":")).encode()
+        record = struct.pack(">I", len(payload)) + payload
+        
+        with self._file_lock():
+            try:
+                with open(self._get_path(self.CHAIN_WAL_FILE), "ab") as f:
+                    f.write(record)
+                    f.flush()
+                    os.fsync(f.fileno())
+                return True
+            except Exception as e:
+                logger.error(f"[Storage] Failed to append block to WAL: {e}")
+                return False
+    
+    def _replay_wal(self, chain_data: List[Dict]) -> int:
+        """
+        Extend chain_data in place with the WAL blocks that build on its tip.
+        Records from other forks or already compacted blocks are skipped.
+        Must be called within _file_lock().
+        
+        Returns:
+            Number of blocks applied
+        """
+        wal_path = self._get_path(self.CHAIN_WAL_FILE)
+        if not chain_data or not os.path.exists(wal_path):
+            return 0
+        
+        applied = 0
+        with open(wal_path, "rb") as f:
+            while True:
+                header = f.read(4)
+                if len(header) < 4:
+                    break
+                size = struct.unpack(">I", header)[0]
+                payload = f.read(size)
+                if len(payload) < size:
+                    logger.warning("[Storage] Ignoring torn record at end of blockchain WAL")
+                    break
+                try:
+                    block_dict = json.loads(payload)
+                except ValueError:
+                    continue
+                
+                if (block_dict.get("index") == len(chain_data)
+                        and block_dict.get("previous_hash") == chain_data[-1].get("hash")):
+                    chain_data.append(block_dict)
+                    applied += 1
+        return applied
+    
+    def compact_blockchain(self) -> Tuple[bool, int]:
+        """
+        Fold the WAL into blockchain.json and truncate it.
+        The canonical file is only rewritten if the WAL actually extends it.
+        
+        Returns:
+            Tuple[success: bool, current_version: int]
+        """
+        with self._file_lock():
+            try:
+                filepath = self._get_path(self.BLOCKCHAIN_FILE)
+                if not os.path.exists(filepath):
+                    return False, 0
+                
+                with open(filepath, "r") as f:
+                    chain_data = json.load(f)
+                
+                applied = self._replay_wal(chain_data)
+                if applied:
+                    version = self._write_chain_file(chain_data).version
+                    logger.info(f"[Storage] Compacted {applied} WAL blocks into blockchain "
+                                f"({len(chain_data)} blocks, version {version})")
+                else:
+                    version = self._get_version(self.BLOCKCHAIN_FILE).version
+                
+                # Everything worth keeping is now in the canonical file
+                open(self._get_path(self.CHAIN_WAL_FILE), "wb").close()
+                return True, version
+                
+            except Exception as e:
+                logger.error(f"[Storage] Failed to compact blockchain WAL: {e}")
+                return False, 0
+    
     # =========================================================================
     # PENDING TRANSACTIONS PERSISTENCE (SHARED) - WITH VERSION CONTROL
     # =========================================================================
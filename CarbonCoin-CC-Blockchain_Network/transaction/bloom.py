@@ -0,0 +1,127 @@
+"""
+Bloom filter over transaction IDs, used for mempool reconciliation.
+
+A node sends a filter of the tx_ids it already holds to a peer's
+/mempool/missing endpoint and gets back only the transactions the filter
+definitely doesn't contain, instead of downloading the peer's whole mempool.
+
+False positives only mean a transaction is skipped for one sync round:
+every filter is built with a fresh random salt, so the next round hashes
+differently and picks it up.
+"""
+
+import base64
+import hashlib
+import math
+import os
+from typing import Iterable
+
+
+class TxIdBloomFilter:
+    # Target false-positive rate when sizing a filter
+    DEFAULT_ERROR_RATE = 0.01
+
+    # Smallest filter we build (bits), so an empty mempool still yields a valid filter
+    MIN_BITS = 64
+
+    # Upper bound accepted from peers (bits), to cap memory per request
+    MAX_BITS = 8 * 1024 * 1024
+
+    # Longest salt blake2b accepts as a key (bytes)
+    MAX_SALT_BYTES = 64
+
+    def __init__(self, num_bits: int, num_hashes: int, salt: bytes = None, bits: bytes = None):
+        """
+        Create an empty (or deserialized) filter.
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Number of hash functions (k)
+            salt: Per-filter hash salt (random if not given)
+            bits: Existing bit array, when rebuilding a peer's filter
+        """
+        if not 0 < num_bits <= self.MAX_BITS or not 0 < num_hashes <= 32:
+            raise ValueError("Invalid bloom filter parameters")
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.salt = salt if salt is not None else os.urandom(8)
+
+        size = (num_bits + 7) // 8
+        if bits is None:
+            self.bits = bytearray(size)
+        elif len(bits) == size:
+            self.bits = bytearray(bits)
+        else:
+            raise ValueError("Bloom filter bit array has the wrong size")
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = DEFAULT_ERROR_RATE) -> 'TxIdBloomFilter':
+        """
+        Size a filter for `capacity` items at the given false-positive rate.
+
+        Args:
+            capacity: Expected number of tx_ids
+            error_rate: Target false-positive probability
+        """
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_bits = min(max(num_bits, cls.MIN_BITS), cls.MAX_BITS)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, min(num_hashes, 32))
+
+    @classmethod
+    def from_ids(cls, tx_ids: Iterable[str]) -> 'TxIdBloomFilter':
+        """Build a filter containing all of tx_ids."""
+        tx_ids = [tx_id for tx_id in tx_ids if tx_id]
+        bloom = cls.for_capacity(len(tx_ids))
+        for tx_id in tx_ids:
+            bloom.add(tx_id)
+        return bloom
+
+    def _positions(self, tx_id: str):
+        """Bit positions for tx_id (double hashing over one salted blake2b digest)."""
+        digest = hashlib.blake2b(tx_id.encode(), digest_size=16, key=self.salt).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, tx_id: str):
+        """Add a tx_id to the filter."""
+        for pos in self._positions(tx_id):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, tx_id: str) -> bool:
+        """True if tx_id might be in the filter, False if it definitely isn't."""
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(tx_id))
+
+    def to_dict(self) -> dict:
+        """Return the filter as the dict sent over the wire."""
+        return {
+            "num_bits": self.num_bits,
+            "num_hashes": self.num_hashes,
+            "salt": self.salt.hex(),
+            "bits": base64.b64encode(bytes(self.bits)).decode()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TxIdBloomFilter':
+        """
+        Rebuild a filter received from a peer.
+
+        Raises:
+            ValueError: If the payload is malformed
+        """
+        try:
+            salt = bytes.fromhex(data["salt"])
+            if len(salt) > cls.MAX_SALT_BYTES:
+                raise ValueError("salt is too long")
+            return cls(
+                int(data["num_bits"]),
+                int(data["num_hashes"]),
+                salt=salt,
+                bits=base64.b64decode(data["bits"], validate=True)
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid bloom filter: {e}")
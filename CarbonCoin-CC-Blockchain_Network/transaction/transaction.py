@@ -9,9 +9,22 @@ try:
 except ImportError:
     USE_CYTHON = False
 
+# Try to use orjson for fast transaction serialization
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
 from config import TransactionType, COINBASE_ADDRESS, COIN_SYMBOL
 
 class Transaction:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "sender", "receiver", "amount", "signature", "tx_type",
+        "public_key", "timestamp", "_cached_dict", "_cached_json"
+    )
+
     def __init__(self, sender: str, receiver: str, amount: float, 
                  signature: str = "", tx_type: str = TransactionType.TRANSFER,
                  public_key: str = "", timestamp: float = None):
@@ -34,6 +47,8 @@ class Transaction:
         self.tx_type = tx_type
         self.public_key = public_key
         self.timestamp = timestamp or time.time()
+        self._cached_dict = None  # Memoized to_dict() result
+        self._cached_json = None  # Memoized to_json_bytes() result
 
     def _python_hash(self):
         """Pure Python hash calculation."""
@@ -114,22 +129,49 @@ class Transaction:
         Returns:
             Self for chaining
         """
-        self.public_key = wallet.get_public_key_hex()
-        self.signature = wallet.sign(self.hash())
+        return self.set_signature(wallet.get_public_key_hex(), wallet.sign(self.hash()))
+
+    def set_signature(self, public_key: str, signature: str) -> 'Transaction':
+        """
+        Attach a signature produced elsewhere (e.g. a signing worker).
+        
+        Args:
+            public_key: Signer's public key hex
+            signature: Signature hex over hash()
+            
+        Returns:
+            Self for chaining
+        """
+        self.public_key = public_key
+        self.signature = signature
+        # Signing changes the serialized form
+        self._cached_dict = None
+        self._cached_json = None
         return self
 
     def to_dict(self) -> dict:
-        """Convert transaction to dictionary."""
-        return {
-            "sender": self.sender,
-            "receiver": self.receiver,
-            "amount": self.amount,
-            "signature": self.signature,
-            "tx_type": self.tx_type,
-            "public_key": self.public_key,
-            "timestamp": self.timestamp,
-            "tx_id": self.hash_hex()
-        }
+        """Convert transaction to dictionary (memoized; treat the result as read-only)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "sender": self.sender,
+                "receiver": self.receiver,
+                "amount": self.amount,
+                "signature": self.signature,
+                "tx_type": self.tx_type,
+                "public_key": self.public_key,
+                "timestamp": self.timestamp,
+                "tx_id": self.hash_hex()
+            }
+        return self._cached_dict
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to_dict() to JSON bytes once, for reuse across every peer send."""
+        if self._cached_json is None:
+            if USE_ORJSON:
+                self._cached_json = orjson.dumps(self.to_dict())
+            else:
+                self._cached_json = json.dumps(self.to_dict(), separators=(",", ":")).encode()
+        return self._cached_json
 
     @staticmethod
     def from_dict(data: dict) -> 'Transaction':
@@ -8,6 +8,20 @@ try:
 except ImportError:
     USE_CYTHON = False
 
+def sign_payload(private_key_bytes: bytes, message_hash: bytes) -> str:
+    """
+    Sign a message hash with a raw private key.
+    Module-level (picklable) so signing can run in a worker process.
+    
+    Args:
+        private_key_bytes: Raw SECP256k1 private key
+        message_hash: The hash bytes to sign
+        
+    Returns:
+        Hex string of signature
+    """
+    return SigningKey.from_string(private_key_bytes, curve=SECP256k1).sign(message_hash).hex()
+
 class Wallet:
     def __init__(self, private_key_hex: str = None):
         """